@@ -1,7 +1,14 @@
+import time
+
+_START = time.perf_counter()  # before any import, for --profile-startup
+
 import argparse
 import logging
+import sys
+from pathlib import Path
+from typing import Optional
 
-from labelCloud import __version__
+from labelCloud import __version__, cli
 
 
 def main():
@@ -14,24 +21,45 @@ def main():
         action="store_true",
         help="Setup a project with an example point cloud and label.",
     )
+    parser.add_argument(
+        "--profile-startup",
+        action="store_true",
+        help="Print how long each phase of the launch took.",
+    )
+    parser.add_argument(
+        "--profile-frames",
+        action="store_true",
+        help="Show the frame-time statistics of the rendering stages in the viewer.",
+    )
+    parser.add_argument(
+        "--frame-trace",
+        type=Path,
+        metavar="FILE",
+        help="Write the frame timings as Chrome trace JSON on exit (implies --profile-frames).",
+    )
     parser.add_argument(
         "-v", "--version", action="version", version="%(prog)s " + __version__
     )
+    subparsers = parser.add_subparsers(
+        dest="command", title="headless commands", metavar="COMMAND"
+    )
+    cli.add_subcommands(subparsers)
     args = parser.parse_args()
 
+    if args.command:
+        sys.exit(cli.run_command(args))
+
     if args.example:
         setup_example_project()
 
-    start_gui()
+    start_gui(args.profile_startup, args.profile_frames, args.frame_trace)
 
 
 def setup_example_project() -> None:
     import shutil
-    from pathlib import Path
-
-    import pkg_resources
 
     from labelCloud.control.config_manager import config
+    from labelCloud.utils.resources import resource_path
 
     logging.info(
         "Starting labelCloud in example mode.\n"
@@ -47,23 +75,19 @@ def setup_example_project() -> None:
 
     # Copy example files
     shutil.copy(
-        pkg_resources.resource_filename("labelCloud.resources", "default_config.ini"),
+        resource_path("labelCloud.resources", "default_config.ini"),
         str(cwdir.joinpath("config.ini")),
     )
     shutil.copy(
-        pkg_resources.resource_filename(
-            "labelCloud.resources.examples", "exemplary.ply"
-        ),
+        resource_path("labelCloud.resources.examples", "exemplary.ply"),
         str(pcd_folder.joinpath("exemplary.ply")),
     )
     shutil.copy(
-        pkg_resources.resource_filename("labelCloud.resources", "default_classes.json"),
+        resource_path("labelCloud.resources", "default_classes.json"),
         str(label_folder.joinpath("_classes.json")),
     )
     shutil.copy(
-        pkg_resources.resource_filename(
-            "labelCloud.resources.examples", "exemplary.json"
-        ),
+        resource_path("labelCloud.resources.examples", "exemplary.json"),
         str(label_folder.joinpath("exemplary.json")),
     )
     logging.info(
@@ -74,18 +98,32 @@ def setup_example_project() -> None:
     )
 
 
-def start_gui():
+def start_gui(
+    profile_startup: bool = False,
+    profile_frames: bool = False,
+    frame_trace: Optional[Path] = None,
+):
     import sys
 
+    from labelCloud.utils.profiling import frame_profiler, startup_profile
+
+    if profile_startup:
+        startup_profile.enable(_START)
+    if profile_frames or frame_trace:
+        frame_profiler.enable()
+
     from PyQt5.QtWidgets import QApplication, QDesktopWidget
 
     from labelCloud.control.controller import Controller
     from labelCloud.view.gui import GUI
 
+    startup_profile.mark("import modules")
     app = QApplication(sys.argv)
+    startup_profile.mark("create application")
 
     # Setup Model-View-Control structure
     control = Controller()
+    startup_profile.mark("create controller")
     view = GUI(control)
 
     # Install event filter to catch user interventions
@@ -99,9 +137,14 @@ def start_gui():
     width = (desktop.width() - view.width()) // 2
     height = (desktop.height() - view.height()) // 2
     view.move(width, height)
+    startup_profile.mark("show window")
 
     logging.info("Showing GUI...")
-    sys.exit(app.exec_())
+    exit_code = app.exec_()
+    if frame_trace:
+        frame_profiler.dump_trace(frame_trace)
+        logging.info(f"Wrote frame trace to {frame_trace}.")
+    sys.exit(exit_code)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,364 @@
+"""
+Headless batch commands to convert, validate and summarize the labels of a folder.
+
+Only the label formats are imported (no PyQt5/ OpenGL), so the commands also run on
+servers without a display. The point clouds are only used for their file names, from
+which every format derives the path of its label file.
+"""
+import argparse
+import logging
+import math
+import multiprocessing
+import os
+import sys
+import time
+from collections import Counter, defaultdict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set, TextIO, Tuple, Type
+
+from .control.config_manager import config
+from .io.labels import (
+    BaseLabelFormat,
+    CentroidFormat,
+    KittiFormat,
+    PointMatchRaw,
+    PointMatchStore,
+    VerticesFormat,
+)
+from .io.labels.config import LabelConfig
+from .model import BBox, Element
+
+# Same options as the GUI uses for each format (see `get_label_strategy`)
+LABEL_FORMATS: Dict[str, Tuple[Type[BaseLabelFormat], Dict[str, bool]]] = {
+    "vertices": (VerticesFormat, {}),
+    "centroid_rel": (CentroidFormat, {"relative_rotation": True}),
+    "centroid_abs": (CentroidFormat, {"relative_rotation": False}),
+    "centroid_compact": (CentroidFormat, {"relative_rotation": False, "compact": True}),
+    "kitti": (KittiFormat, {"relative_rotation": True}),
+    "kitti_untransformed": (
+        KittiFormat,
+        {"relative_rotation": True, "transformed": False},
+    ),
+    "point_match_raw": (PointMatchRaw, {}),
+    "point_match_store": (PointMatchStore, {}),
+}
+
+# Formats writing into one file of the whole folder, which can not be shared by workers
+SINGLE_WRITER_FORMATS = {"point_match_store"}
+
+PROGRESS_INTERVAL = 0.2  # seconds between progress updates
+
+
+def create_label_format(name: str, label_folder: Path) -> BaseLabelFormat:
+    label_format, options = LABEL_FORMATS[name]
+    return label_format(
+        label_folder, config.getint("LABEL", "export_precision"), **options
+    )
+
+
+def find_pointclouds(folder: Path, postfix: str = "") -> List[Path]:
+    """List the point clouds of a folder like the GUI does (by postfix or extension)."""
+    if postfix:
+        return sorted(folder.glob("*" + postfix))
+
+    from .io.pointclouds import BasePointCloudHandler
+
+    extensions = BasePointCloudHandler.get_supported_extensions()
+    return sorted(path for path in folder.iterdir() if path.suffix in extensions)
+
+
+# ---------------------------------------------------------------------------- #
+#                                 Batch Worker                                 #
+# ---------------------------------------------------------------------------- #
+
+
+@dataclass
+class BatchTask:
+    command: str  # convert, validate or stats
+    source_format: str
+    label_folder: Path
+    target_format: Optional[str] = None
+    output_folder: Optional[Path] = None
+    known_classes: Optional[Set[str]] = None  # of the label config if not given
+
+
+@dataclass
+class FileResult:
+    pcd_path: Path
+    nb_labels: int = 0
+    classes: Counter = field(default_factory=Counter)
+    dimensions: Dict[str, List[Tuple[float, float, float]]] = field(
+        default_factory=lambda: defaultdict(list)
+    )
+    problems: List[str] = field(default_factory=list)
+
+
+class BatchWorker(object):
+    """Holds the label formats of one process and handles single point clouds."""
+
+    def __init__(self, task: BatchTask) -> None:
+        self.task = task
+        self.source = create_label_format(task.source_format, task.label_folder)
+        self.target = None
+        if task.command == "convert":
+            task.output_folder.mkdir(parents=True, exist_ok=True)
+            self.target = create_label_format(task.target_format, task.output_folder)
+        self.known_classes = (
+            set(LabelConfig().get_classes())
+            if task.known_classes is None
+            else task.known_classes
+        )
+
+    def process(self, pcd_path: Path) -> FileResult:
+        result = FileResult(pcd_path)
+        try:
+            elements = self.source.import_labels(pcd_path)
+        except Exception as error:
+            message = " ".join(str(error).split())  # parser errors span several lines
+            result.problems.append(
+                f"could not be read ({type(error).__name__}: {message})"
+            )
+            return result
+
+        result.nb_labels = len(elements)
+        for element in elements:
+            if isinstance(element, BBox):
+                result.classes[element.get_classname()] += 1
+                result.dimensions[element.get_classname()].append(
+                    element.get_dimensions()
+                )
+            else:
+                result.classes[f"camera {element.cam}"] += 1
+
+        if self.task.command == "validate":
+            for index, element in enumerate(elements):
+                result.problems.extend(
+                    f"label {index}: {problem}"
+                    for problem in check_element(element, self.known_classes)
+                )
+        elif self.target is not None:
+            try:
+                self.target.export_labels(elements, pcd_path)
+            except Exception as error:
+                result.problems.append(
+                    f"could not be written ({type(error).__name__}: {error})"
+                )
+        return result
+
+
+def check_element(element: Element, known_classes: Iterable[str]) -> List[str]:
+    """Return the problems of a single label, empty if it is valid."""
+    problems = []
+    if isinstance(element, BBox):
+        if element.get_classname() not in known_classes:
+            problems.append(f"unknown class '{element.get_classname()}'")
+        if not all(
+            map(math.isfinite, (*element.get_center(), *element.get_rotations()))
+        ):
+            problems.append("center or rotation is not finite")
+        if not all(math.isfinite(d) and d > 0 for d in element.get_dimensions()):
+            problems.append(f"invalid dimensions {tuple(element.get_dimensions())}")
+    else:
+        if int(element.cam) < 0:
+            problems.append(f"invalid camera {element.cam}")
+        if not all(map(math.isfinite, (*element.p3d, *element.p2d))):
+            problems.append("point coordinates are not finite")
+    return problems
+
+
+_worker: Optional[BatchWorker] = None
+
+
+def _init_worker(task: BatchTask, log_level: int) -> None:
+    global _worker
+    logging.getLogger().setLevel(log_level)
+    _worker = BatchWorker(task)
+
+
+def _process(pcd_path: Path) -> FileResult:
+    return _worker.process(pcd_path)  # type: ignore
+
+
+def run_batch(
+    task: BatchTask,
+    pcd_paths: List[Path],
+    jobs: int,
+    progress: Optional[TextIO] = sys.stderr,
+) -> Tuple[List[FileResult], float]:
+    """Process all point clouds with a pool of `jobs` processes.
+
+    :return: results in the order of `pcd_paths` and the elapsed seconds
+    """
+    if {task.source_format, task.target_format} & SINGLE_WRITER_FORMATS:
+        jobs = 1
+    log_level = logging.getLogger().level
+    start = time.perf_counter()
+    results: List[FileResult] = []
+
+    pool = None
+    if jobs > 1 and len(pcd_paths) > 1:
+        pool = multiprocessing.Pool(
+            min(jobs, len(pcd_paths)), _init_worker, (task, log_level)
+        )
+        chunksize = max(1, min(64, len(pcd_paths) // (jobs * 8)))
+        iterator = pool.imap_unordered(_process, pcd_paths, chunksize)
+    else:
+        _init_worker(task, log_level)
+        iterator = map(_process, pcd_paths)
+
+    try:
+        last_update = 0.0
+        for result in iterator:
+            results.append(result)
+            now = time.perf_counter()
+            if progress and (
+                now - last_update > PROGRESS_INTERVAL or len(results) == len(pcd_paths)
+            ):
+                last_update = now
+                rate = len(results) / max(now - start, 1e-9)
+                progress.write(
+                    f"\r{len(results)}/{len(pcd_paths)} files ({rate:.1f} files/s)"
+                )
+                progress.flush()
+        if progress and results:
+            progress.write("\n")
+    finally:
+        if pool is not None:
+            pool.close()
+            pool.join()
+
+    order = {path: index for index, path in enumerate(pcd_paths)}
+    results.sort(key=lambda result: order[result.pcd_path])
+    return results, time.perf_counter() - start
+
+
+# ---------------------------------------------------------------------------- #
+#                                   Commands                                   #
+# ---------------------------------------------------------------------------- #
+
+
+def summarize(verb: str, results: List[FileResult], elapsed: float) -> str:
+    nb_labels = sum(result.nb_labels for result in results)
+    nb_problems = sum(bool(result.problems) for result in results)
+    return (
+        f"{verb} {len(results)} files ({nb_labels} labels) in {elapsed:.2f} s: "
+        f"{len(results) / max(elapsed, 1e-9):.1f} files/s, "
+        f"{nb_labels / max(elapsed, 1e-9):.1f} labels/s, "
+        f"{nb_problems} files with problems."
+    )
+
+
+def print_problems(results: List[FileResult]) -> None:
+    for result in results:
+        for problem in result.problems:
+            print(f"{result.pcd_path.name}: {problem}")
+
+
+def print_stats(results: List[FileResult]) -> None:
+    classes: Counter = Counter()
+    dimensions = defaultdict(list)
+    for result in results:
+        classes.update(result.classes)
+        for class_name, dims in result.dimensions.items():
+            dimensions[class_name].extend(dims)
+
+    empty = sum(result.nb_labels == 0 for result in results)
+    print(f"{len(results) - empty} of {len(results)} point clouds are labeled.")
+    if not classes:
+        return
+    width = max(len(name) for name in classes) + 2
+    print(f"{'class'.ljust(width)}{'count':>8}  mean length x width x height")
+    for class_name, count in sorted(classes.items()):
+        line = f"{class_name.ljust(width)}{count:>8}"
+        if dimensions[class_name]:
+            means = [sum(axis) / len(axis) for axis in zip(*dimensions[class_name])]
+            line += "  " + " x ".join(f"{mean:.2f}" for mean in means)
+        print(line)
+
+
+def run_command(args: argparse.Namespace) -> int:
+    if not args.verbose:
+        logging.getLogger().setLevel(logging.WARNING)
+    if args.format is None:
+        args.format = LabelConfig().format
+
+    pcd_paths = find_pointclouds(args.pointclouds, args.postfix)
+    if not pcd_paths:
+        print(f"Found no point clouds in {args.pointclouds}.", file=sys.stderr)
+        return 1
+
+    task = BatchTask(
+        command=args.command,
+        source_format=args.format,
+        label_folder=args.labels,
+        target_format=getattr(args, "to", None),
+        output_folder=getattr(args, "output", None),
+    )
+    results, elapsed = run_batch(
+        task, pcd_paths, args.jobs, progress=None if args.quiet else sys.stderr
+    )
+
+    if args.command == "stats":
+        print_stats(results)
+    else:
+        print_problems(results)
+    verb = {"convert": "Converted", "validate": "Validated", "stats": "Read"}
+    print(summarize(verb[args.command], results, elapsed))
+    return int(any(result.problems for result in results))
+
+
+def add_subcommands(subparsers: argparse._SubParsersAction) -> None:
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument(
+        "--pointclouds",
+        type=Path,
+        default=config.getpath("FILE", "pointcloud_folder"),
+        help="folder of the point clouds whose labels are processed",
+    )
+    common.add_argument(
+        "--postfix",
+        default=config.get("POINTCLOUD", "pointcloud_postfix", fallback=""),
+        help="only use point clouds ending with this postfix",
+    )
+    common.add_argument(
+        "--labels",
+        type=Path,
+        default=config.getpath("FILE", "label_folder"),
+        help="folder of the label files",
+    )
+    common.add_argument(
+        "--format",
+        choices=list(LABEL_FORMATS),
+        default=None,
+        help="format of the label files (default: format of the class definitions)",
+    )
+    common.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="number of worker processes",
+    )
+    common.add_argument(
+        "-q", "--quiet", action="store_true", help="do not show the progress"
+    )
+    common.add_argument(
+        "--verbose", action="store_true", help="log every read and written file"
+    )
+
+    convert = subparsers.add_parser(
+        "convert", parents=[common], help="convert labels into another format"
+    )
+    convert.add_argument("--to", choices=list(LABEL_FORMATS), required=True)
+    convert.add_argument(
+        "--output", type=Path, required=True, help="folder for the converted labels"
+    )
+    subparsers.add_parser(
+        "validate",
+        parents=[common],
+        help="check labels for unknown classes and bad values",
+    )
+    subparsers.add_parser(
+        "stats", parents=[common], help="count the labels and their sizes per class"
+    )
@@ -3,7 +3,7 @@ Base class for any subsequent element controllers (bboxes, point pairs, etc.)
 """ 
 
 import logging
-from typing import TYPE_CHECKING, List, Optional, Callable
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Callable, Tuple
 from functools import wraps
 from ..utils.decorators import logging_debug
 
@@ -11,6 +11,8 @@ from .pcd_manager import PointCloudManager
 from ..definitions import Mode, Point3D
 from ..model.element import Element 
 from .config_manager import config 
+from .edit_history import Edit, EditHistory
+from .label_journal import element_to_dict, replay_elements
 
 if TYPE_CHECKING:
     from ..view.gui import GUI
@@ -29,8 +31,27 @@ def has_active_element_decorator(func):
 
     return wrapper
 
+
+def marks_dirty_decorator(func):
+    """
+    Mark the active element as changed after the function ran and record the change
+    of its editable fields in the undo history
+    """
+
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        element_id = args[0].active_element_id
+        previous = args[0].get_element_fields(element_id)
+        result = func(*args, **kwargs)
+        args[0].element_changed(element_id, previous)
+        return result
+
+    return wrapper
+
 class BaseElementController(object):
     STD_SCALING = config.getfloat("LABEL", "std_scaling")
+    # Attributes of the elements that are changed in place, recorded by the undo history
+    EDITABLE_FIELDS: Tuple[str, ...] = ()
    
      
     def __init__(self, element_type) -> None:
@@ -39,8 +60,16 @@ class BaseElementController(object):
         self.element_type : Element = element_type
         self.elements : List[element_type] = []
         self.active_element_id : int = -1
+        self.dirty : bool = False  # elements differ from the label file of the frame
+        self.history : EditHistory = EditHistory(
+            config.getint("LABEL", "undo_limit", fallback=100),
+            config.getfloat("LABEL", "undo_merge_interval", fallback=1.0),
+        )
         self.add_element_callbacks : List[Callable] = []
         self.update_active_callbacks : List[Callable] = []
+        self.update_element_callbacks : List[Callable] = []
+        self.delete_element_callbacks : List[Callable] = []
+        self.set_elements_callbacks : List[Callable] = []
 
         logging.debug(f"BaseElementControl instantiated | Type: {self.element_type}")
         
@@ -68,9 +97,50 @@ class BaseElementController(object):
         assert self.pcd_manager is not None, "PCD Controller was never set"
         
         pts = self.pcd_manager.get_labels_from_file()
+        unsaved_changes = self.pcd_manager.get_unsaved_changes()
+        if unsaved_changes:
+            pts = replay_elements(pts, unsaved_changes)
+            logging.info(f"Restored {len(unsaved_changes)} unsaved changes from the journal.")
         self.set_elements(pts)
+        self.dirty = bool(unsaved_changes)
         self.update_all()
 
+    def mark_dirty(self) -> None:
+        """Mark the elements as changed, so that they are saved with the next save"""
+        self.dirty = True
+
+    def record_change(self, op: str, **fields) -> None:
+        """Mark the elements as changed and append the change to the label journal"""
+        self.mark_dirty()
+        pcd_manager = getattr(self, "pcd_manager", None)
+        if pcd_manager is not None:
+            pcd_manager.record_change(op, **fields)
+
+    def get_element_fields(self, element_id: int) -> Dict[str, Any]:
+        """Return the values of the editable fields of the element at index element_id"""
+        if not 0 <= element_id < len(self.elements):
+            return {}
+        element = self.elements[element_id]
+        return {name: getattr(element, name) for name in self.EDITABLE_FIELDS}
+
+    def element_changed(
+        self, element_id: int, previous: Optional[Dict[str, Any]] = None
+    ) -> None:
+        """Record that the element at index element_id was changed in place. If the
+        previous values of its editable fields are given, the change can be undone."""
+        if 0 <= element_id < len(self.elements):
+            if previous is not None:
+                self.history.push_fields(
+                    element_id, previous, self.get_element_fields(element_id)
+                )
+            self.record_change(
+                "set", index=element_id, element=element_to_dict(self.elements[element_id])
+            )
+
+    def mark_clean(self) -> None:
+        """Mark the elements as in sync with the label file"""
+        self.dirty = False
+
      
     def select_relative_element(self, amount : int) -> None:
         """Change element some amount relative to current. Will not proceed if
@@ -89,11 +159,21 @@ class BaseElementController(object):
         self.pcd_manager = pcd_manager
 
      
-    def update_element(self, element_id: int, element: Element) -> None:
+    def update_element(
+        self, element_id: int, element: Element, previous: Optional[Dict[str, Any]] = None
+    ) -> None:
         """Update controller's element at index element_id w/ what's given in "element\".
-        Ensures consistency with intial element type"""
+        Ensures consistency with intial element type. If the element was changed in
+        place, pass the previous values of its editable fields to make it undoable."""
         if isinstance(element, self.element_type) and (0 <= element_id < len(self.elements)):
+            if element is not self.elements[element_id]:
+                self.history.push(Edit("replace", element_id, self.elements[element_id], element))
             self.elements[element_id] = element
+            self.element_changed(element_id, previous)
+
+            for func in self.update_element_callbacks:
+                func(element_id)
+
             self.update_all()
         else:
             logging.warning("Element change failed!")
@@ -103,7 +183,13 @@ class BaseElementController(object):
         """Delete element at index element_id"""
         logging.debug(f"element controller - delete element at index {element_id}")
         if 0 <= element_id <= self.active_element_id:
+            self.history.push(Edit("delete", element_id, old=self.elements[element_id]))
             del self.elements[element_id]
+            self.record_change("delete", index=element_id)
+
+            for func in self.delete_element_callbacks:
+                func(element_id)
+
             if self.active_element_id == element_id:
                 self.set_active_element(len(self.elements) - 1)
                 
@@ -142,6 +228,21 @@ class BaseElementController(object):
         Input functions shouldn't depend on return behavior."""
         self.update_active_callbacks.append(callback)
 
+    def register_update_element_callback(self, callback : Callable) -> None:
+        """Add an action to be performed whenever an element is replaced by update_element.
+        Input functions receive the index of the updated element."""
+        self.update_element_callbacks.append(callback)
+
+    def register_delete_element_callback(self, callback : Callable) -> None:
+        """Add an action to be performed whenever an element is deleted.
+        Input functions receive the index the deleted element had."""
+        self.delete_element_callbacks.append(callback)
+
+    def register_set_elements_callback(self, callback : Callable) -> None:
+        """Add an action to be performed whenever the whole element list is replaced.
+        Input functions shouldn't depend on return behavior."""
+        self.set_elements_callbacks.append(callback)
+
      
     def add_element(self, element : Element) -> None:
         logging.debug("ElementController recieved element add:")
@@ -149,6 +250,8 @@ class BaseElementController(object):
         if isinstance(element, self.element_type):
             logging.debug("\t- Element add passed instance check")
             self.elements.append(element)
+            self.history.push(Edit("add", len(self.elements) - 1, new=element))
+            self.record_change("add", element=element_to_dict(element))
             self.set_active_element(self.elements.index(element))
             
             # Run add element callbacks
@@ -163,6 +266,11 @@ class BaseElementController(object):
         initial type"""
         if all([isinstance(x, self.element_type) for x in elements]):
             self.elements = elements
+            self.mark_dirty()
+            self.history.clear()  # the edits belong to the previous elements
+
+        for func in self.set_elements_callbacks:
+            func()
 
         if len(self.elements) > 0:
             self.set_active_element(len(self.elements)-1)
@@ -172,6 +280,70 @@ class BaseElementController(object):
         """Deselect active element and clear current element list"""
         self.deselect_element()
         self.set_elements([]) 
+
+    def delete_all_elements(self) -> None:
+        """Delete all elements of the current point cloud"""
+        elements = self.elements
+        self.reset()
+        self.record_change("clear")
+        if elements:
+            self.history.push(Edit("reset", old=elements))
+
+    def undo(self) -> None:
+        """Revert the last edit of the elements"""
+        edit = self.history.pop_undo()
+        if edit is None:
+            logging.info("Nothing to undo.")
+        else:
+            self.apply_edit(edit, revert=True)
+
+    def redo(self) -> None:
+        """Apply the last reverted edit of the elements again"""
+        edit = self.history.pop_redo()
+        if edit is None:
+            logging.info("Nothing to redo.")
+        else:
+            self.apply_edit(edit, revert=False)
+
+    def apply_edit(self, edit: Edit, revert: bool) -> None:
+        """Apply or revert an edit of the history without recording it again"""
+        if edit.kind in ("set", "replace"):
+            if edit.kind == "set":
+                element = self.elements[edit.element_id]
+                for name, value in (edit.old if revert else edit.new).items():
+                    setattr(element, name, value)
+            else:
+                self.elements[edit.element_id] = edit.old if revert else edit.new
+            self.element_changed(edit.element_id)
+            for func in self.update_element_callbacks:
+                func(edit.element_id)
+            active_element_id = edit.element_id
+
+        elif edit.kind in ("add", "delete") and (edit.kind == "add") == revert:
+            del self.elements[edit.element_id]
+            self.record_change("delete", index=edit.element_id)
+            for func in self.delete_element_callbacks:
+                func(edit.element_id)
+            active_element_id = len(self.elements) - 1
+
+        elif edit.kind in ("add", "delete"):
+            element = edit.new if edit.kind == "add" else edit.old
+            self.elements.insert(edit.element_id, element)
+            self.record_change("insert", index=edit.element_id, element=element_to_dict(element))
+            for func in self.set_elements_callbacks:  # indices after the element shifted
+                func()
+            active_element_id = edit.element_id
+
+        else:  # reset
+            self.elements = list(edit.old) if revert else []
+            self.record_change("clear")
+            for element in self.elements:
+                self.record_change("add", element=element_to_dict(element))
+            for func in self.set_elements_callbacks:
+                func()
+            active_element_id = len(self.elements) - 1
+
+        self.set_active_element(active_element_id)
     
      
     def update_all(self) -> None:
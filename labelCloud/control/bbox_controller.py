@@ -12,12 +12,16 @@ import yaml
 import os
 import numpy as np
 
-from .base_element_controller import BaseElementController, has_active_element_decorator
+from .base_element_controller import (
+    BaseElementController,
+    has_active_element_decorator,
+    marks_dirty_decorator,
+)
 
 from ..definitions import Mode, Point3D
 from ..model.bbox import BBox
 from ..utils import oglhelper
-from .config_manager import config
+from .config_manager import config, settings
 from .pcd_manager import PointCloudManager
 
 if TYPE_CHECKING:
@@ -30,7 +34,7 @@ def only_zrotation_decorator(func):
     """
 
     def wrapper(*args, **kwargs):
-        if not config.getboolean("USER_INTERFACE", "z_rotation_only"):
+        if not settings.z_rotation_only:
             return func(*args, **kwargs)
         else:
             logging.warning(
@@ -40,6 +44,8 @@ def only_zrotation_decorator(func):
     return wrapper
  
 class BoundingBoxController(BaseElementController):
+    EDITABLE_FIELDS = tuple(sorted(BBox.REVISED_ATTRIBUTES))
+
     def __init__(self) -> None:
         super().__init__(BBox)
 
@@ -66,16 +72,19 @@ class BoundingBoxController(BaseElementController):
         return self.get_active_element().get_classname()  # type: ignore
 
     @has_active_element_decorator
+    @marks_dirty_decorator
     def set_classname(self, new_class: str) -> None:
         self.get_active_element().set_classname(new_class)  # type: ignore
         self.update_label_list()
 
     @has_active_element_decorator
+    @marks_dirty_decorator
     def set_center(self, cx: float, cy: float, cz: float) -> None:
         self.get_active_element().center = (cx, cy, cz)  # type: ignore
 
     # MANIPULATORS
     @has_active_element_decorator
+    @marks_dirty_decorator
     def update_position(self, axis: str, value: float) -> None:
         if axis == "pos_x":
             self.get_active_element().set_x_translation(value)  # type: ignore
@@ -87,6 +96,7 @@ class BoundingBoxController(BaseElementController):
             raise Exception("Wrong axis describtion.")
 
     @has_active_element_decorator
+    @marks_dirty_decorator
     def update_dimension(self, dimension: str, value: float) -> None:
         if dimension == "length":
             self.get_active_element().set_length(value)  # type: ignore
@@ -98,6 +108,7 @@ class BoundingBoxController(BaseElementController):
             raise Exception("Wrong dimension describtion.")
 
     @has_active_element_decorator
+    @marks_dirty_decorator
     def update_rotation(self, axis: str, value: float) -> None:
         if axis == "rot_x":
             self.get_active_element().set_x_rotation(value)  # type: ignore
@@ -110,10 +121,11 @@ class BoundingBoxController(BaseElementController):
 
     @only_zrotation_decorator
     @has_active_element_decorator
+    @marks_dirty_decorator
     def rotate_around_x(
         self, dangle: Optional[float] = None, clockwise: bool = False
     ) -> None:
-        dangle = dangle or config.getfloat("LABEL", "std_rotation")
+        dangle = dangle or settings.std_rotation
         if clockwise:
             dangle *= -1
         self.get_active_element().set_x_rotation(  # type: ignore
@@ -122,10 +134,11 @@ class BoundingBoxController(BaseElementController):
 
     @only_zrotation_decorator
     @has_active_element_decorator
+    @marks_dirty_decorator
     def rotate_around_y(
         self, dangle: Optional[float] = None, clockwise: bool = False
     ) -> None:
-        dangle = dangle or config.getfloat("LABEL", "std_rotation")
+        dangle = dangle or settings.std_rotation
         if clockwise:
             dangle *= -1
         self.get_active_element().set_y_rotation(  # type: ignore
@@ -133,13 +146,14 @@ class BoundingBoxController(BaseElementController):
         )
 
     @has_active_element_decorator
+    @marks_dirty_decorator
     def rotate_around_z(
         self,
         dangle: Optional[float] = None,
         clockwise: bool = False,
         absolute: bool = False,
     ) -> None:
-        dangle = dangle or config.getfloat("LABEL", "std_rotation")
+        dangle = dangle or settings.std_rotation
         if clockwise:
             dangle *= -1
         if absolute:
@@ -168,15 +182,16 @@ class BoundingBoxController(BaseElementController):
         self.rotate_around_z(x_angle)
 
     @has_active_element_decorator
+    @marks_dirty_decorator
     def translate_along_x(
         self, distance: Optional[float] = None, left: bool = False, boost: bool = False
     ) -> None:
-        distance = distance or config.getfloat("LABEL", "std_translation")
+        distance = distance or settings.std_translation
         if left:
             distance *= -1
             
         if boost:
-            distance *= config.getfloat("LABEL", "boost_multiplier")
+            distance *= settings.boost_multiplier
 
         cosz, sinz, bu = self.pcd_manager.get_perspective()
 
@@ -185,15 +200,16 @@ class BoundingBoxController(BaseElementController):
         active_bbox.set_y_translation(active_bbox.center[1] + distance * sinz)
 
     @has_active_element_decorator
+    @marks_dirty_decorator
     def translate_along_y(
         self, distance: Optional[float] = None, forward: bool = False, boost: bool = False
     ) -> None:
-        distance = distance or config.getfloat("LABEL", "std_translation")
+        distance = distance or settings.std_translation
         if forward:
             distance *= -1
             
         if boost:
-            distance *= config.getfloat("LABEL", "boost_multiplier")
+            distance *= settings.boost_multiplier
 
         cosz, sinz, bu = self.pcd_manager.get_perspective()
 
@@ -202,21 +218,23 @@ class BoundingBoxController(BaseElementController):
         active_bbox.set_y_translation(active_bbox.center[1] + distance * bu * cosz)
 
     @has_active_element_decorator
+    @marks_dirty_decorator
     def translate_along_z(
         self, distance: Optional[float] = None, down: bool = False, boost: bool = False
     ) -> None:
-        distance = distance or config.getfloat("LABEL", "std_translation")
+        distance = distance or settings.std_translation
         
         if down:
             distance *= -1
 
         if boost:
-            distance *= config.getfloat("LABEL", "boost_multiplier")
+            distance *= settings.boost_multiplier
 
         active_bbox: Bbox = self.get_active_element()  # type: ignore
         active_bbox.set_z_translation(active_bbox.center[2] + distance)
 
     @has_active_element_decorator
+    @marks_dirty_decorator
     def scale(
         self, length_increase: Optional[float] = None, decrease: bool = False
     ) -> None:
@@ -226,7 +244,7 @@ class BoundingBoxController(BaseElementController):
         :param decrease: if True, reverses the length_increasee (* -1)
         :return: None
         """
-        length_increase = length_increase or config.getfloat("LABEL", "std_scaling")
+        length_increase = length_increase or settings.std_scaling
         if decrease:
             length_increase *= -1
         length, width, height = self.get_active_element().get_dimensions()  # type: ignore
@@ -295,6 +313,7 @@ class BoundingBoxController(BaseElementController):
         box = self.get_active_element()
         if box is not None:
             self.pcd_manager.assign_point_label_in_box(box)
+            self.mark_dirty()  # the segmentation labels are saved with the elements
             if config.getboolean("USER_INTERFACE", "delete_box_after_assign"):
                 self.delete_current_element()
 
@@ -0,0 +1,118 @@
+"""
+Solve the camera calibration from the point pairs of all frames on a worker thread
+"""
+
+import logging
+import re
+from pathlib import Path
+from typing import Dict, List
+
+import numpy as np
+import numpy.typing as npt
+from PyQt5 import QtCore
+
+from ..definitions.types import PointPairCamera
+from ..utils.calibration import (
+    MIN_POINT_PAIRS,
+    CalibrationError,
+    CalibrationResult,
+    calibrate_camera,
+)
+from .config_manager import config, config_manager
+
+REVISION_PREFIX = "pmatrix_list_r"
+REVISION_PATTERN = re.compile(rf"{REVISION_PREFIX}(\d+)\.txt")
+
+
+def solve_cameras(
+    point_pairs: List[PointPairCamera],
+    ransac_threshold: float = 10.0,
+    huber_delta: float = 2.0,
+) -> Dict[int, CalibrationResult]:
+    """Calibrate every camera that has enough point pairs.
+
+    :return: calibration result per camera index
+    """
+    results: Dict[int, CalibrationResult] = {}
+    cameras = np.array([int(pair.cam) for pair in point_pairs])
+    for cam in np.unique(cameras):
+        pairs = [pair for pair, c in zip(point_pairs, cameras) if c == cam]
+        if len(pairs) < MIN_POINT_PAIRS:
+            logging.warning(
+                f"Skipping camera {cam}: only {len(pairs)} of {MIN_POINT_PAIRS} needed point pairs."
+            )
+            continue
+        try:
+            results[int(cam)] = calibrate_camera(
+                [pair.p3d for pair in pairs],
+                [pair.p2d for pair in pairs],
+                ransac_threshold=ransac_threshold,
+                huber_delta=huber_delta,
+            )
+        except (CalibrationError, np.linalg.LinAlgError) as error:
+            logging.warning(f"Could not calibrate camera {cam}: {error}")
+    return results
+
+
+def format_pmatrix_list(pmatrices: npt.NDArray) -> str:
+    return ", ".join(f"{value:.8e}" for value in np.ravel(pmatrices))
+
+
+def write_pmatrix_revision(pmatrices: npt.NDArray) -> Path:
+    """Store the matrices as next numbered revision and make them the active pmatrix_list.
+
+    :return: path of the written revision file
+    """
+    revision_folder = config.getpath(
+        "FILE", "manual_calib_folder", fallback="manual_calib/"
+    )
+    revision_folder.mkdir(parents=True, exist_ok=True)
+
+    revisions = [
+        int(match.group(1))
+        for match in map(
+            REVISION_PATTERN.fullmatch, (p.name for p in revision_folder.iterdir())
+        )
+        if match
+    ]
+    revision = max(revisions, default=0) + 1
+    revision_path = revision_folder.joinpath(f"{REVISION_PREFIX}{revision:03d}.txt")
+
+    pmatrix_list = format_pmatrix_list(pmatrices)
+    revision_path.write_text(pmatrix_list + "\n")
+    config.set("FILE", "pmatrix_list", pmatrix_list)
+    config_manager.write_into_file()
+    logging.info(f"Saved calibration revision {revision} to {revision_path}.")
+    return revision_path
+
+
+class CalibrationSolver(QtCore.QThread):
+    """Runs `solve_cameras` off the GUI thread and emits the results when done."""
+
+    solved = QtCore.pyqtSignal(object)  # Dict[int, CalibrationResult]
+    failed = QtCore.pyqtSignal(str)
+
+    def __init__(
+        self,
+        point_pairs: List[PointPairCamera],
+        ransac_threshold: float = 10.0,
+        huber_delta: float = 2.0,
+        parent: QtCore.QObject = None,
+    ) -> None:
+        super().__init__(parent)
+        self.point_pairs = point_pairs
+        self.ransac_threshold = ransac_threshold
+        self.huber_delta = huber_delta
+
+    def run(self) -> None:
+        try:
+            results = solve_cameras(
+                self.point_pairs,
+                ransac_threshold=self.ransac_threshold,
+                huber_delta=self.huber_delta,
+            )
+        except Exception as error:
+            logging.exception("Calibration solver failed.")
+            self.failed.emit(str(error))
+            return
+        self.solved.emit(results)
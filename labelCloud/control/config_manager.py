@@ -1,9 +1,94 @@
 """Load configuration from .ini file."""
 import configparser
 from pathlib import Path
-from typing import List, Union
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
-import pkg_resources
+from ..utils.resources import resource_path
+
+
+class Settings(object):
+    """Typed configuration values that are read in hot paths, e.g. on every frame.
+
+    The values are parsed and validated once when the configuration is read and updated
+    whenever one of their options is set, so that reading them is an attribute access.
+    Callbacks receive the name of each changed setting.
+    """
+
+    # name: (section, option, type, fallback or None if the option is required)
+    OPTIONS: Dict[str, Tuple[str, str, type, Any]] = {
+        "usage_mode": ("FILE", "usage_mode", str, "label"),
+        "point_size": ("POINTCLOUD", "point_size", float, None),
+        "color_with_label": ("POINTCLOUD", "color_with_label", bool, False),
+        "label_color_mix_ratio": ("POINTCLOUD", "label_color_mix_ratio", float, 0.3),
+        "std_translation": ("LABEL", "std_translation", float, None),
+        "std_rotation": ("LABEL", "std_rotation", float, None),
+        "std_scaling": ("LABEL", "std_scaling", float, None),
+        "boost_multiplier": ("LABEL", "boost_multiplier", float, 2.0),
+        "z_rotation_only": ("USER_INTERFACE", "z_rotation_only", bool, None),
+        "show_floor": ("USER_INTERFACE", "show_floor", bool, None),
+        "show_orientation": ("USER_INTERFACE", "show_orientation", bool, None),
+        "viewing_precision": ("USER_INTERFACE", "viewing_precision", int, None),
+        "exp_zoom": ("USER_INTERFACE", "exp_zoom", bool, False),
+    }
+
+    usage_mode: str
+    point_size: float
+    color_with_label: bool
+    label_color_mix_ratio: float
+    std_translation: float
+    std_rotation: float
+    std_scaling: float
+    boost_multiplier: float
+    z_rotation_only: bool
+    show_floor: bool
+    show_orientation: bool
+    viewing_precision: int
+    exp_zoom: bool
+
+    def __init__(self) -> None:
+        self.callbacks: List[Callable[[str], None]] = []
+        self.names = {
+            (section, option): name
+            for name, (section, option, _, _) in self.OPTIONS.items()
+        }
+
+    def register_callback(self, callback: Callable[[str], None]) -> None:
+        self.callbacks.append(callback)
+
+    def read_value(self, config: configparser.ConfigParser, name: str) -> Any:
+        section, option, value_type, fallback = self.OPTIONS[name]
+        getter = {
+            bool: config.getboolean,
+            int: config.getint,
+            float: config.getfloat,
+            str: config.get,
+        }[value_type]
+        kwargs = {} if fallback is None else {"fallback": fallback}
+        try:
+            return getter(section, option, **kwargs)
+        except (ValueError, configparser.Error) as error:
+            raise ValueError(
+                f"Invalid setting '{option}' in [{section}]: {error}"
+            ) from error
+
+    def load(self, config: configparser.ConfigParser) -> None:
+        """Read and validate all settings, nothing is changed if one is invalid."""
+        values = {name: self.read_value(config, name) for name in self.OPTIONS}
+        for name, value in values.items():
+            self.set_value(name, value)
+
+    def option_changed(
+        self, config: configparser.ConfigParser, section: str, option: str
+    ) -> None:
+        name = self.names.get((section, option.lower()))
+        if name is not None:
+            self.set_value(name, self.read_value(config, name))
+
+    def set_value(self, name: str, value: Any) -> None:
+        if name not in self.__dict__ or self.__dict__[name] != value:
+            self.__dict__[name] = value
+            for callback in self.callbacks:
+                callback(name)
 
 
 class ExtendedConfigParser(configparser.ConfigParser):
@@ -12,6 +97,15 @@ class ExtendedConfigParser(configparser.ConfigParser):
     Can automatically parse float values besides plain strings.
     """
 
+    def __init__(self, *args, **kwargs) -> None:
+        self.settings: Optional[Settings] = None  # kept up to date with every set
+        super().__init__(*args, **kwargs)
+
+    def set(self, section, option, value=None) -> None:
+        super().set(section, option, value)
+        if self.settings is not None:
+            self.settings.option_changed(self, section, option)
+
     def getlist(
         self, section, option, raw=False, vars=None, fallback=None
     ) -> Union[List[str], List[float], str]:
@@ -31,19 +125,20 @@ class ExtendedConfigParser(configparser.ConfigParser):
 
 class ConfigManager(object):
     PATH_TO_CONFIG = Path.cwd().joinpath("config.ini")
-    PATH_TO_DEFAULT_CONFIG = Path(
-        pkg_resources.resource_filename("labelCloud.resources", "default_config.ini")
-    )
+    PATH_TO_DEFAULT_CONFIG = resource_path("labelCloud.resources", "default_config.ini")
 
     def __init__(self) -> None:
         self.config = ExtendedConfigParser(comment_prefixes="/", allow_no_value=True)
+        self.settings = Settings()
         self.read_from_file()
+        self.config.settings = self.settings
 
     def read_from_file(self) -> None:
         if ConfigManager.PATH_TO_CONFIG.is_file():
             self.config.read(ConfigManager.PATH_TO_CONFIG)
         else:
             self.config.read(ConfigManager.PATH_TO_DEFAULT_CONFIG)
+        self.settings.load(self.config)
 
     def write_into_file(self) -> None:
         with ConfigManager.PATH_TO_CONFIG.open("w") as configfile:
@@ -51,6 +146,7 @@ class ConfigManager(object):
 
     def reset_to_default(self) -> None:
         self.config.read(ConfigManager.PATH_TO_DEFAULT_CONFIG)
+        self.settings.load(self.config)
 
     def get_file_settings(self, key: str) -> str:
         return self.config["FILE"][key]
@@ -58,3 +154,4 @@ class ConfigManager(object):
 
 config_manager = ConfigManager()
 config = config_manager.config
+settings = config_manager.settings
@@ -6,7 +6,7 @@ from typing import Optional
 import shutil
 import numpy as np
 from PyQt5 import QtGui
-from PyQt5.QtCore import QPoint
+from PyQt5.QtCore import QPoint, QTimer
 from PyQt5.QtCore import Qt as Keys
 
 from functools import wraps
@@ -25,7 +25,10 @@ from .base_drawing_manager import BaseDrawingManager
 from .pcd_manager import PointCloudManager
 from .manual_calibration_controller import ProjectionCorrectionController
 from .base_element_controller import BaseElementController
+from .calibration_solver import CalibrationSolver, write_pmatrix_revision
+from ..utils.projection import get_projection_matrices
 from ..utils.decorators import in_labeling_only_decorator, in_projection_only_decorator
+from ..utils.profiling import frame_profiler, startup_profile
 
 from ..proj_correction_strategies import PointMatchCorrection
 
@@ -65,6 +68,9 @@ class Controller:
         self.side_mode = False
         self.selected_side: Optional[str] = None
 
+        # Calibration solving (projection only)
+        self.calibration_solver: Optional[CalibrationSolver] = None
+
     def startup(self, view: "GUI") -> None:
         """Sets the view in all controllers and dependent modules; Loads labels from file."""
         self.view = view
@@ -82,13 +88,24 @@ class Controller:
 
         # Read labels from folders
         self.pcd_manager.read_pointcloud_folder()
+        # Show the window first, the point cloud and its images take a while to load
+        QTimer.singleShot(0, self.load_first_pcd)
+
+    def load_first_pcd(self) -> None:
         self.next_pcd(save=False)
+        startup_profile.mark("load first point cloud")
+        startup_profile.report()
 
+    @frame_profiler.timed("loop_gui")
     def loop_gui(self) -> None:
         """Function collection called during each event loop iteration."""
         self.set_crosshair()
         self.set_selected_side()
         self.view.gl_widget.updateGL()
+        if self.LABELING:
+            self.view.refresh_bbox_stats()
+        if self.pcd_manager.label_manager.journal is not None:
+            self.pcd_manager.label_manager.journal.sync_if_due()
 
     # POINT CLOUD METHODS
     def next_pcd(self, save: bool = True) -> None:
@@ -122,8 +139,15 @@ class Controller:
         
     # CONTROL METHODS
     def save(self) -> None: # TODO Handle for semantic mode
-        """Saves all bounding boxes and optionally segmentation labels in the label file."""
+        """Saves all bounding boxes and optionally segmentation labels in the label file.
+
+        Frames whose elements did not change since loading or the last save are skipped.
+        """
+        if not self.element_controller.dirty:
+            logging.debug("Labels are unchanged, skipped saving.")
+            return
         self.pcd_manager.save_labels_into_file(self.element_controller.elements)
+        self.element_controller.mark_clean()
 
     def reset(self) -> None:
         """Resets the controllers and bounding boxes from the current screen."""
@@ -131,6 +155,57 @@ class Controller:
         self.drawing_mode.reset()
         self.align_mode.reset()
 
+    # CALIBRATION METHODS
+    @in_projection_only_decorator
+    def solve_calibration(self) -> None:
+        """Solve all camera matrices from the point pairs of every frame on a worker thread."""
+        if self.calibration_solver is not None and self.calibration_solver.isRunning():
+            self.view.status_manager.set_message("Calibration is already being solved ...")
+            return
+
+        self.save()  # include the pairs of the current frame
+        self.pcd_manager.label_manager.flush()
+        point_pairs = self.pcd_manager.label_manager.label_strategy.import_all_labels()
+        logging.info(f"Solving calibration from {len(point_pairs)} point pairs.")
+
+        self.calibration_solver = CalibrationSolver(
+            point_pairs,
+            ransac_threshold=config.getfloat("LABEL", "calibration_ransac_threshold", fallback=10.0),
+            huber_delta=config.getfloat("LABEL", "calibration_huber_delta", fallback=2.0),
+            parent=self.view,
+        )
+        self.calibration_solver.solved.connect(self.apply_calibration)
+        self.calibration_solver.failed.connect(
+            lambda error: self.view.status_manager.set_message(f"Calibration failed: {error}")
+        )
+        self.calibration_solver.start()
+        self.view.status_manager.set_message(
+            f"Solving calibration from {len(point_pairs)} point pairs ..."
+        )
+
+    def apply_calibration(self, results: dict) -> None:
+        """Save solved cameras as new pmatrix_list revision, keeping unsolved cameras."""
+        if not results:
+            self.view.status_manager.set_message("Not enough point pairs to solve any camera.")
+            return
+
+        pmatrices = get_projection_matrices()
+        for cam, result in results.items():
+            pmatrices[cam] = result.pmatrix
+        revision_path = write_pmatrix_revision(pmatrices)
+
+        self.element_controller.metrics.set_projection_matrices(pmatrices)
+        self.element_controller.update_all()
+        self.view.refresh_images()
+        self.view.status_manager.set_message(
+            f"Saved {revision_path.name}: "
+            + ", ".join(
+                f"{str(Camera(cam)).title()} RMS {result.rms:.2f} px "
+                f"({result.inliers.sum()}/{len(result.inliers)} inliers)"
+                for cam, result in sorted(results.items())
+            )
+        )
+
     # CORRECTION METHODS
     def set_crosshair(self) -> None:
         """Sets the crosshair position in the glWidget to the current cursor position."""
@@ -303,9 +378,12 @@ class Controller:
         ):
             self.drawing_mode.drawing_strategy.register_scale(a0.angleDelta().y())
         elif self.side_mode and self.element_controller.has_active_element() and self.LABELING:
+            element_id = self.element_controller.active_element_id
+            previous = self.element_controller.get_element_fields(element_id)
             self.element_controller.get_active_element().change_side(  # type: ignore
                 self.selected_side, -a0.angleDelta().y() / 4000  # type: ignore
             )  # ToDo implement method
+            self.element_controller.element_changed(element_id, previous)
         else:
             self.pcd_manager.zoom_into(a0.angleDelta().y())
             self.scroll_mode = True
@@ -334,6 +412,14 @@ class Controller:
         elif a0.key() == Keys.Key_S and self.ctrl_pressed:
             self.save()
 
+        # Undo and redo element edits
+        elif a0.key() == Keys.Key_Z and self.ctrl_pressed and not self.shift_pressed:
+            self.element_controller.undo()
+        elif (a0.key() == Keys.Key_Y and self.ctrl_pressed) or (
+            a0.key() == Keys.Key_Z and self.ctrl_pressed and self.shift_pressed
+        ):
+            self.element_controller.redo()
+
         elif a0.key() == Keys.Key_Escape:
             if self.drawing_mode.is_active():
                 self.drawing_mode.reset()
@@ -422,6 +508,11 @@ class Controller:
         elif a0.key() == Keys.Key_Space and self.drawing_mode.is_active():
             self.drawing_mode.drawing_strategy.reset()
 
+        elif a0.key() in [Keys.Key_Return, Keys.Key_Enter] and self.drawing_mode.is_active() \
+            and self.PROJECTION:
+            # accept the suggested 2d point
+            self.drawing_mode.accept_suggestion()
+
         #### DUAL EVENTS BASED ON PICKING
         elif a0.key() == Keys.Key_Alt:
             # Unset focus
@@ -0,0 +1,94 @@
+"""
+Suggest the 2D point of a picked 3D point on a worker thread
+"""
+
+import logging
+from typing import List, Optional, Tuple
+
+import numpy as np
+import numpy.typing as npt
+from PyQt5 import QtCore, QtGui
+
+from ..definitions import Point2D, Point3D
+from ..utils.correspondence import refine_pixel, select_camera
+
+
+def read_gray_window(
+    image_path: str, center: npt.NDArray, radius: int
+) -> Optional[Tuple[npt.NDArray[np.uint8], npt.NDArray[np.int64]]]:
+    """Read the grayscale window of the size (2r+1)² around center, clipped to the image.
+
+    :return: window and its top left corner in image coordinates, None if unreadable
+    """
+    image = QtGui.QImage(image_path)
+    if image.isNull():
+        return None
+    left = int(max(center[0] - radius, 0))
+    top = int(max(center[1] - radius, 0))
+    right = int(min(center[0] + radius + 1, image.width()))
+    bottom = int(min(center[1] + radius + 1, image.height()))
+
+    window = image.copy(left, top, right - left, bottom - top)
+    window = window.convertToFormat(QtGui.QImage.Format_Grayscale8)
+    buffer = window.constBits()
+    buffer.setsize(window.byteCount())
+    gray = np.frombuffer(buffer, dtype=np.uint8).reshape(
+        window.height(), window.bytesPerLine()
+    )
+    return gray[:, : window.width()].copy(), np.array([left, top])
+
+
+def read_image_size(image_path: str) -> Optional[Tuple[int, int]]:
+    """Width and height from the image header, None if the image is unreadable"""
+    size = QtGui.QImageReader(image_path).size()
+    return (size.width(), size.height()) if size.isValid() else None
+
+
+class CorrespondenceSuggester(QtCore.QThread):
+    """Projects a 3D point into the best camera and refines the pixel by a corner search.
+
+    Emits `suggested` with the camera index and Point2D, or `failed` if no camera
+    sees the point.
+    """
+
+    suggested = QtCore.pyqtSignal(int, object)
+    failed = QtCore.pyqtSignal(str)
+
+    def __init__(
+        self,
+        point_3d: Point3D,
+        pmatrices: npt.NDArray,
+        image_paths: List[str],
+        search_radius: int = 25,
+        parent: QtCore.QObject = None,
+    ) -> None:
+        super().__init__(parent)
+        self.point_3d = point_3d
+        self.pmatrices = pmatrices
+        self.image_paths = image_paths
+        self.search_radius = search_radius
+
+    def run(self) -> None:
+        # Cameras are only considered with an image, whose size bounds their view
+        image_sizes = [read_image_size(path) for path in self.image_paths]
+        selection = select_camera(
+            np.asarray(self.point_3d), self.pmatrices, image_sizes
+        )
+        if selection is None:
+            self.failed.emit("The picked point is not visible in any camera.")
+            return
+        cam, pixel = selection
+
+        # The window is larger than the search radius, so corners at its border
+        # get a complete neighborhood for the response
+        refined = pixel
+        result = read_gray_window(self.image_paths[cam], pixel, self.search_radius + 4)
+        if result is not None:
+            gray, origin = result
+            refined = refine_pixel(gray, pixel - origin, self.search_radius) + origin
+        else:
+            logging.warning(
+                f"Could not read {self.image_paths[cam]} for the 2D suggestion."
+            )
+
+        self.suggested.emit(cam, Point2D(*np.round(refined, 2)))
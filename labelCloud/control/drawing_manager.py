@@ -9,7 +9,10 @@ from .base_drawing_manager import BaseDrawingManager
 from .bbox_controller import BoundingBoxController
 from .manual_calibration_controller import ProjectionCorrectionController
 from .pcd_manager import PointCloudManager
-from ..definitions import Camera, Point2D
+from .config_manager import config
+from .correspondence_suggester import CorrespondenceSuggester
+from ..definitions import Camera, Point2D, Point3D
+from ..utils.projection import get_projection_matrices
 
 if TYPE_CHECKING:
     from ..view.gui import GUI
@@ -44,6 +47,7 @@ class ProjectionDrawingManager(BaseDrawingManager):
         self.point_controller = point_controller
         self.drawing_strategy: Optional[BaseProjCorrection] = None
         self.pcd_manager = pcd_manager
+        self.suggester: Optional[CorrespondenceSuggester] = None
 
     def register_point_3d(
         self, x: float, y: float, correction: bool = False, is_temporary: bool = False 
@@ -61,6 +65,50 @@ class ProjectionDrawingManager(BaseDrawingManager):
             
         if self.drawing_strategy.is_finished():
             self.finish() 
+        elif not is_temporary:
+            self.suggest_point_2d(world_point)
+
+    def suggest_point_2d(self, p3d : Point3D) -> None:
+        """Search the matching 2d point of a picked 3d point on a worker thread"""
+        if not config.getboolean("USER_INTERFACE", "suggest_correspondences", fallback=True):
+            return
+
+        image_paths = []
+        for manager in self.view.img_manager_list:
+            manager.refresh_image_path()
+            image_paths.append(manager.current_path)
+
+        self.suggester = CorrespondenceSuggester(
+            p3d,
+            get_projection_matrices(),
+            image_paths,
+            search_radius=config.getint("USER_INTERFACE", "suggestion_search_radius", fallback=25),
+            parent=self.view,
+        )
+        strategy, suggester = self.drawing_strategy, self.suggester
+        # Only apply the result if the pick has not changed in the meantime
+        self.suggester.suggested.connect(
+            lambda cam, p2d: self.apply_suggestion(strategy, suggester, p2d, cam)
+        )
+        self.suggester.failed.connect(lambda message: self.view.status_manager.set_message(message))
+        self.suggester.start()
+
+    def apply_suggestion(self, strategy, suggester, p2d : Point2D, camera : Camera) -> None:
+        if strategy is not self.drawing_strategy or suggester is not self.suggester \
+            or strategy.point_2d is not None:
+            return
+        strategy.register_suggestion(p2d, camera)
+        self.view.status_manager.set_message(
+            f"Suggested 2D point in the {Camera(camera)} camera, "
+            "press Enter to accept or click to pick another one."
+        )
+        self.view.refresh_images(do_pixmap=False)
+
+    def accept_suggestion(self) -> None:
+        if self.drawing_strategy is not None and self.drawing_strategy.has_suggestion():
+            self.drawing_strategy.accept_suggestion()
+            if self.drawing_strategy.is_finished():
+                self.finish()
 
     def register_point_2d(
         self, p2d : Point2D, camera: Camera
@@ -0,0 +1,100 @@
+"""
+Undo/redo history of the element edits of the current point cloud.
+
+Edits are recorded as compact deltas instead of copies of the elements: an in-place
+change only stores the element id and the old and new values of the changed fields;
+added, deleted and replaced elements are kept by reference. Consecutive changes of the
+same fields of the same element within `merge_interval` seconds (e.g. holding a key to
+move a box) are merged into one edit. The history keeps at most `max_size` edits and
+is cleared when the elements of another point cloud are loaded.
+"""
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Deque, Dict, List, Optional
+
+import numpy as np
+
+
+@dataclass
+class Edit:
+    kind: str  # "set", "replace", "add", "delete" or "reset"
+    element_id: int = -1
+    old: Any = (
+        None  # field values (set), element (replace, delete) or element list (reset)
+    )
+    new: Any = None  # field values (set) or element (replace, add)
+    time: float = field(default_factory=time.monotonic)
+
+
+def changed_fields(previous: Dict[str, Any], current: Dict[str, Any]) -> Dict[str, Any]:
+    """Return the previous values of the fields that differ in `current`."""
+    return {
+        name: value
+        for name, value in previous.items()
+        if value is not current[name] and not np.array_equal(value, current[name])
+    }
+
+
+class EditHistory(object):
+    def __init__(self, max_size: int = 100, merge_interval: float = 1.0) -> None:
+        self.undo_stack: Deque[Edit] = deque(maxlen=max_size)
+        self.redo_stack: List[Edit] = []
+        self.merge_interval = merge_interval
+
+    def clear(self) -> None:
+        self.undo_stack.clear()
+        self.redo_stack.clear()
+
+    def can_undo(self) -> bool:
+        return bool(self.undo_stack)
+
+    def can_redo(self) -> bool:
+        return bool(self.redo_stack)
+
+    def push(self, edit: Edit) -> None:
+        """Record a new edit, which discards the edits that were undone before."""
+        self.redo_stack.clear()
+        if self.undo_stack and self.merges_into(self.undo_stack[-1], edit):
+            last = self.undo_stack[-1]
+            last.new = edit.new
+            last.time = edit.time
+        else:
+            self.undo_stack.append(edit)
+
+    def push_fields(
+        self, element_id: int, previous: Dict[str, Any], current: Dict[str, Any]
+    ) -> None:
+        """Record an in-place change of an element from its field values before and after."""
+        old = changed_fields(previous, current)
+        if old:
+            self.push(
+                Edit("set", element_id, old, {name: current[name] for name in old})
+            )
+
+    def merges_into(self, last: Edit, edit: Edit) -> bool:
+        if (
+            last.kind != edit.kind
+            or last.element_id != edit.element_id
+            or edit.time - last.time > self.merge_interval
+        ):
+            return False
+        if edit.kind == "set":
+            return last.new.keys() == edit.new.keys()
+        return edit.kind == "replace"
+
+    def pop_undo(self) -> Optional[Edit]:
+        """Return the last edit to revert it, or None if there is nothing to undo."""
+        if not self.undo_stack:
+            return None
+        edit = self.undo_stack.pop()
+        self.redo_stack.append(edit)
+        return edit
+
+    def pop_redo(self) -> Optional[Edit]:
+        """Return the last undone edit to apply it again, or None."""
+        if not self.redo_stack:
+            return None
+        edit = self.redo_stack.pop()
+        self.undo_stack.append(edit)
+        return edit
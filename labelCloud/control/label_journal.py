@@ -0,0 +1,200 @@
+"""
+Append-only journal of the label changes that were not saved yet.
+
+Labels are only saved when leaving a point cloud or closing labelCloud. To not lose the
+work on the current point cloud in a crash, every change of its elements (and of its
+segmentation labels) is appended as one JSON line to a journal in the label folder.
+Lines are synced to disk in batches (at most every `journal_sync_interval` seconds).
+
+When a point cloud is loaded, its journaled changes are replayed on top of the label
+file. Once its labels are saved, the journal drops the changes of this point cloud.
+"""
+import base64
+import json
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+from typing import IO, Any, Dict, List, Optional
+
+import numpy as np
+import numpy.typing as npt
+
+from ..definitions.types import Point2D, Point3D, PointPairCamera
+from ..io.labels import write_file_atomic
+from ..model import BBox, Element
+
+
+class LabelJournal(object):
+    FILE_NAME = ".labelCloud_journal.jsonl"
+
+    def __init__(self, path: Path, sync_interval: float = 1.0) -> None:
+        self.path = path
+        self.sync_interval = sync_interval
+        self.records: List[Dict[str, Any]] = self.read_records(path)
+        self.seq = max((record["seq"] for record in self.records), default=0)
+        self.file: Optional[IO[str]] = None  # opened with the first change
+        self.unsynced = False
+        self.last_sync = time.monotonic()
+        self.lock = threading.Lock()  # compaction runs on the label writer thread
+
+        if self.records:
+            logging.warning(
+                f"Found {len(self.records)} unsaved changes of "
+                f"{len(self.get_frames())} point cloud(s) in {path}, "
+                "they are restored when opening the point cloud."
+            )
+
+    @staticmethod
+    def read_records(path: Path) -> List[Dict[str, Any]]:
+        records = []
+        if path.is_file():
+            with path.open("r") as read_file:
+                for line in read_file:
+                    try:
+                        records.append(json.loads(line))
+                    except json.JSONDecodeError:
+                        logging.warning(f"Skipped a torn line in {path}.")
+        return records
+
+    def get_frames(self) -> List[str]:
+        """Names of the point clouds with unsaved changes."""
+        return list(dict.fromkeys(record["frame"] for record in self.records))
+
+    def get_records(self, frame: str) -> List[Dict[str, Any]]:
+        with self.lock:
+            return [record for record in self.records if record["frame"] == frame]
+
+    def append(self, frame: str, op: str, **fields: Any) -> None:
+        with self.lock:
+            self.seq += 1
+            record = {"seq": self.seq, "frame": frame, "op": op, **fields}
+            if self.file is None:
+                self.file = self.path.open("a")
+            self.file.write(json.dumps(record) + "\n")
+            self.records.append(record)
+            self.unsynced = True
+        self.sync_if_due()
+
+    def checkpoint(self) -> int:
+        """Number of the last change, to compact the changes saved until now."""
+        return self.seq
+
+    def sync_if_due(self) -> None:
+        if self.unsynced and time.monotonic() - self.last_sync >= self.sync_interval:
+            self.sync()
+
+    def sync(self) -> None:
+        with self.lock:
+            if self.file is not None and self.unsynced:
+                self.file.flush()
+                os.fsync(self.file.fileno())
+            self.unsynced = False
+            self.last_sync = time.monotonic()
+
+    def compact(self, frame: str, checkpoint: int) -> None:
+        """Drop the changes of the frame up to the checkpoint after they were saved."""
+        with self.lock:
+            records = [
+                record
+                for record in self.records
+                if record["frame"] != frame or record["seq"] > checkpoint
+            ]
+            if len(records) == len(self.records):
+                return
+            self.records = records
+            if self.file is not None:
+                self.file.close()
+                self.file = None
+            if records:
+                write_file_atomic(
+                    self.path, "".join(json.dumps(record) + "\n" for record in records)
+                )
+            elif self.path.exists():
+                self.path.unlink()
+            self.unsynced = False
+
+    def close(self) -> None:
+        self.sync()
+        with self.lock:
+            if self.file is not None:
+                self.file.close()
+                self.file = None
+
+
+# ---------------------------------------------------------------------------- #
+#                                    Records                                   #
+# ---------------------------------------------------------------------------- #
+
+
+def element_to_dict(element: Element) -> Dict[str, Any]:
+    if isinstance(element, BBox):
+        return {
+            "type": "bbox",
+            "classname": element.get_classname(),
+            "center": [float(value) for value in element.get_center()],
+            "dimensions": [float(value) for value in element.get_dimensions()],
+            "rotations": [float(value) for value in element.get_rotations()],
+        }
+    return {
+        "type": "point_pair",
+        "p3d": [float(value) for value in element.p3d],
+        "p2d": [float(value) for value in element.p2d],
+        "cam": int(element.cam),
+    }
+
+
+def element_from_dict(data: Dict[str, Any]) -> Element:
+    if data["type"] == "bbox":
+        bbox = BBox(*data["center"], *data["dimensions"])
+        bbox.set_rotations(*data["rotations"])
+        bbox.set_classname(data["classname"])
+        return bbox
+    return PointPairCamera(Point3D(*data["p3d"]), Point2D(*data["p2d"]), data["cam"])
+
+
+def encode_indices(indices: npt.NDArray[np.int64]) -> str:
+    return base64.b64encode(indices.astype("<u4").tobytes()).decode("ascii")
+
+
+def decode_indices(data: str) -> npt.NDArray[np.int64]:
+    return np.frombuffer(base64.b64decode(data), dtype="<u4").astype(np.int64)
+
+
+def replay_elements(
+    elements: List[Element], records: List[Dict[str, Any]]
+) -> List[Element]:
+    """Apply the journaled element changes to the elements of the label file."""
+    elements = list(elements)
+    for record in records:
+        op = record["op"]
+        if op == "add":
+            elements.append(element_from_dict(record["element"]))
+        elif op == "insert" and 0 <= record["index"] <= len(elements):
+            elements.insert(record["index"], element_from_dict(record["element"]))
+        elif op == "set" and 0 <= record["index"] < len(elements):
+            elements[record["index"]] = element_from_dict(record["element"])
+        elif op == "delete" and 0 <= record["index"] < len(elements):
+            del elements[record["index"]]
+        elif op == "clear":
+            elements = []
+        elif op != "labels":
+            logging.warning(f"Skipped the invalid journal record {record}.")
+    return elements
+
+
+def replay_segmentation_labels(
+    labels: npt.NDArray[np.int8], records: List[Dict[str, Any]]
+) -> npt.NDArray[np.int64]:
+    """Apply the journaled label assignments, return the indices of changed points."""
+    changed = []
+    for record in records:
+        if record["op"] == "labels":
+            indices = decode_indices(record["indices"])
+            indices = indices[indices < len(labels)]
+            labels[indices] = record["label"]
+            changed.append(indices)
+    if not changed:
+        return np.empty(0, dtype=np.int64)
+    return np.unique(np.concatenate(changed))
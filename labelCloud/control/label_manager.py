@@ -1,13 +1,15 @@
 import logging
+import threading
 from pathlib import Path
-from typing import List, Optional
+from typing import Callable, Dict, List, Optional, Tuple
 
 from logdecorator import log_on_start
-from ..io.labels import BaseLabelFormat, CentroidFormat, KittiFormat, VerticesFormat, PointMatchRaw
+from ..io.labels import BaseLabelFormat, CentroidFormat, KittiFormat, VerticesFormat, PointMatchRaw, PointMatchStore
 from ..io.labels.config import LabelConfig
 from ..definitions.labeling_mode import LabelingMode
 from ..model import Element 
 from .config_manager import config
+from .label_journal import LabelJournal
 
 
 def get_label_strategy(export_format: str, label_folder: Path) -> "BaseLabelFormat":
@@ -18,6 +20,10 @@ def get_label_strategy(export_format: str, label_folder: Path) -> "BaseLabelForm
             return CentroidFormat(
                 label_folder, LabelManager.EXPORT_PRECISION, relative_rotation=True
             )
+        elif export_format == "centroid_compact":
+            return CentroidFormat(
+                label_folder, LabelManager.EXPORT_PRECISION, compact=True
+            )
         elif export_format == "kitti":
             return KittiFormat(
                 label_folder, LabelManager.EXPORT_PRECISION, relative_rotation=True
@@ -37,9 +43,88 @@ def get_label_strategy(export_format: str, label_folder: Path) -> "BaseLabelForm
             label_folder, LabelManager.EXPORT_PRECISION, relative_rotation=False
         )
     if LabelConfig().type == LabelingMode.PROJECTION_CORRECTION:
+        if export_format == "point_match_store":
+            return PointMatchStore(label_folder, LabelManager.EXPORT_PRECISION)
         return PointMatchRaw(label_folder, LabelManager.EXPORT_PRECISION)
 
 
+class LabelWriter(object):
+    """Exports labels on a background thread, so that saving does not block navigation.
+
+    Only the newest snapshot per point cloud is kept while waiting, so quickly saving a
+    frame several times writes it once. Frames are written in the order of their first
+    submission.
+    """
+
+    def __init__(self, label_strategy: "BaseLabelFormat") -> None:
+        self.label_strategy = label_strategy
+        self.pending: Dict[Path, Tuple[List[Element], Optional[Callable]]] = {}
+        self.writing: Optional[Path] = None
+        self.closed = False
+        self.condition = threading.Condition()
+        self.thread = threading.Thread(target=self._run, name="LabelWriter", daemon=True)
+        self.thread.start()
+
+    def submit(
+        self,
+        pcd_path: Path,
+        elements: List[Element],
+        on_written: Optional[Callable[[], None]] = None,
+    ) -> None:
+        """Queue the elements (which must not be changed afterwards) for export.
+
+        `on_written` is called on the writer thread after a successful export.
+        """
+        with self.condition:
+            if self.closed:
+                raise RuntimeError("The label writer was already closed.")
+            self.pending[pcd_path] = (elements, on_written)
+            self.condition.notify_all()
+
+    def is_pending(self, pcd_path: Path) -> bool:
+        with self.condition:
+            return pcd_path in self.pending or pcd_path == self.writing
+
+    def wait_for(self, pcd_path: Path) -> None:
+        """Block until the labels of the point cloud were written."""
+        with self.condition:
+            self.condition.wait_for(
+                lambda: pcd_path not in self.pending and pcd_path != self.writing
+            )
+
+    def flush(self) -> None:
+        """Block until all queued labels were written."""
+        with self.condition:
+            self.condition.wait_for(lambda: not self.pending and self.writing is None)
+
+    def close(self) -> None:
+        """Write the remaining labels and stop the thread."""
+        with self.condition:
+            self.closed = True
+            self.condition.notify_all()
+        self.thread.join()
+
+    def _run(self) -> None:
+        while True:
+            with self.condition:
+                self.condition.wait_for(lambda: self.pending or self.closed)
+                if not self.pending:
+                    return
+                pcd_path = next(iter(self.pending))
+                elements, on_written = self.pending.pop(pcd_path)
+                self.writing = pcd_path
+            try:
+                self.label_strategy.export_labels(elements, pcd_path)
+                if on_written is not None:
+                    on_written()
+            except Exception:
+                logging.exception(f"Could not save the labels of {pcd_path}!")
+            finally:
+                with self.condition:
+                    self.writing = None
+                    self.condition.notify_all()
+
+
 class LabelManager(object):
     STD_LABEL_FORMAT = LabelConfig().format
     EXPORT_PRECISION = config.getint("LABEL", "export_precision")
@@ -56,8 +141,17 @@ class LabelManager(object):
             self.label_folder.mkdir(parents=True)
 
         self.label_strategy = get_label_strategy(strategy, self.label_folder)
+        self.writer: Optional[LabelWriter] = None
+        self.journal: Optional[LabelJournal] = None
+        if config.getboolean("LABEL", "journal", fallback=True):
+            self.journal = LabelJournal(
+                self.label_folder.joinpath(LabelJournal.FILE_NAME),
+                config.getfloat("LABEL", "journal_sync_interval", fallback=1.0),
+            )
 
     def import_labels(self, pcd_path: Path) -> List[Element]:
+        if self.writer is not None:
+            self.writer.wait_for(pcd_path)  # read what was saved last
         try:
             return self.label_strategy.import_labels(pcd_path)
         except KeyError as key_error:
@@ -77,3 +171,40 @@ class LabelManager(object):
 
     def export_labels(self, pcd_path: Path, elements: List[Element]) -> None:
         self.label_strategy.export_labels(elements, pcd_path)
+
+    def export_labels_in_background(self, pcd_path: Path, elements: List[Element]) -> None:
+        """Export a copy of the elements on the writer thread (if the format allows it).
+
+        The journaled changes of the point cloud are dropped once the labels are written.
+        """
+        on_written = None
+        if self.journal is not None:
+            journal, checkpoint = self.journal, self.journal.checkpoint()
+            on_written = lambda: journal.compact(pcd_path.name, checkpoint)
+
+        if not self.label_strategy.BACKGROUND_EXPORT:
+            self.export_labels(pcd_path, elements)
+            if on_written is not None:
+                on_written()
+            return
+        if self.writer is None:
+            self.writer = LabelWriter(self.label_strategy)
+        self.writer.submit(pcd_path, self.label_strategy.copy_elements(elements), on_written)
+
+    def flush(self) -> None:
+        """Wait until all labels exported in the background are written."""
+        if self.writer is not None:
+            self.writer.flush()
+
+    def close(self) -> None:
+        if self.writer is not None:
+            self.writer.close()
+            self.writer = None
+        if self.journal is not None:
+            self.journal.close()
+        self.label_strategy.close()
+
+    def update_label_folder(self, label_folder: Path) -> None:
+        self.flush()  # queued labels belong into the previous folder
+        self.label_folder = label_folder
+        self.label_strategy.update_label_folder(label_folder)
@@ -16,8 +16,9 @@ from .base_element_controller import BaseElementController, has_active_element_d
 from ..definitions import Mode, Camera, Color4f
 from ..definitions.types import PointPairCamera, Point2D, Point3D
 from ..utils import oglhelper
-from .config_manager import config
+from .config_manager import settings
 from .pcd_manager import PointCloudManager
+from .reprojection_metrics import ReprojectionMetrics
 from ..utils.oglhelper import draw_crosshair
 
 if TYPE_CHECKING:
@@ -25,9 +26,11 @@ if TYPE_CHECKING:
 
 
 class ProjectionCorrectionController(BaseElementController):
-    
+    EDITABLE_FIELDS = ("p3d", "p2d", "cam")
+
     def __init__(self) -> None:
         super().__init__(PointPairCamera)
+        self.metrics = ReprojectionMetrics(self)
             
     def show_3d_points(self) -> None:
         for idx, point in enumerate(self.elements):
@@ -41,12 +44,17 @@ class ProjectionCorrectionController(BaseElementController):
         self.update_p3d_readout()
         self.update_p2d_readout()
         self.update_camera_readout()
+        self.update_metrics_readout()
         
     def update_element_list(self) -> None:
         self.view.element_list.blockSignals(True)
         self.view.element_list.clear()
-        for point in self.elements:
-            self.view.element_list.addItem("Point")
+        for idx, point in enumerate(self.elements):
+            error = self.metrics.get_error(idx)
+            if error is None or np.isnan(error):
+                self.view.element_list.addItem("Point")
+            else:
+                self.view.element_list.addItem(f"Point ({error:.1f} px)")
         if self.has_active_element():
             self.view.element_list.setCurrentRow(self.active_element_id)
             current_item = self.view.element_list.currentItem()
@@ -68,38 +76,46 @@ class ProjectionCorrectionController(BaseElementController):
         if self.has_active_element():
             self.view.row3_col1_edit.setText(str(self.get_active_element().cam))     
 
+    def update_metrics_readout(self) -> None:
+        if self.has_active_element():
+            self.view.status_manager.set_message(
+                self.metrics.get_summary(int(self.get_active_element().cam))
+            )
+
     def translate_along_y(self, forward=False, boost=False):
         """Move active element within 2D view"""
-        distance = config.getfloat("LABEL", "std_translation")
+        distance = settings.std_translation
         distance*=4
 
         if not forward:
             distance *= -1
         
         if boost:
-            distance *= config.getfloat("LABEL", "boost_multiplier")
+            distance *= settings.boost_multiplier
 
         pt = self.get_active_element()
+        previous = self.get_element_fields(self.active_element_id)
         pt.p2d = (pt.p2d[0], pt.p2d[1] + distance)
-        self.update_element(self.active_element_id, pt)
+        self.update_element(self.active_element_id, pt, previous)
 
         self.view.refresh_images(do_pixmap=False)
 
         
     def translate_along_x(self, left=False, boost=False):
         """Move active element within 2D view"""
-        distance = config.getfloat("LABEL", "std_translation")
+        distance = settings.std_translation
         distance*=4
 
         if left:
             distance *= -1
         
         if boost:
-            distance *= config.getfloat("LABEL", "boost_multiplier")
+            distance *= settings.boost_multiplier
 
         pt = self.get_active_element()
-        pt.p2d = (pt.p2d[0] + distance, pt.p2d[1]) 
-        self.update_element(self.active_element_id, pt)
+        previous = self.get_element_fields(self.active_element_id)
+        pt.p2d = (pt.p2d[0] + distance, pt.p2d[1])
+        self.update_element(self.active_element_id, pt, previous)
 
         self.view.refresh_images(do_pixmap=False)
 
@@ -5,11 +5,9 @@ Sets the point cloud and original point cloud path. Initiate the writing to the
 import logging
 from pathlib import Path
 from shutil import copyfile
-from typing import TYPE_CHECKING, List, Optional, Set, Tuple
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set, Tuple
 import glob
 import numpy as np
-import open3d as o3d
-import pkg_resources
 from math import exp
 
 from ..definitions import LabelingMode, Point3D, Color3f
@@ -17,8 +15,11 @@ from ..io.labels.config import LabelConfig
 from ..io.pointclouds import BasePointCloudHandler, Open3DHandler
 from ..model import BBox, Perspective, PointCloud, Element
 from ..utils.logger import blue, green, print_column
-from .config_manager import config
+from ..utils.resources import resource_path
+from .config_manager import config, settings
+from .label_journal import encode_indices, replay_segmentation_labels
 from .label_manager import LabelManager
+from .segmentation_stats import SegmentationStats
 
 if TYPE_CHECKING:
     from ..view.gui import GUI
@@ -73,6 +74,12 @@ class PointCloudManager(object):
             str
         ] = set()  # TODO: this should integrate with the new label definition setup.
         self.saved_perspective: Optional[Perspective] = None
+        settings.register_callback(self.setting_changed)
+        self.segmentation_stats: Optional[SegmentationStats] = None
+        if self.SEGMENTATION:
+            self.segmentation_stats = SegmentationStats(
+                config.getpath("FILE", "segmentation_folder")
+            )
 
     @property
     def pcd_path(self) -> Path:
@@ -118,11 +125,7 @@ class PointCloudManager(object):
                 "Please set the point cloud folder to a location that contains point cloud files."
             )
             self.pointcloud = PointCloud.from_file(
-                Path(
-                    pkg_resources.resource_filename(
-                        "labelCloud.resources", "labelCloud_icon.pcd"
-                    )
-                )
+                resource_path("labelCloud.resources", "labelCloud_icon.pcd")
             )
             self.update_pcd_infos(pointcloud_label=" – (select folder!)")
 
@@ -139,10 +142,11 @@ class PointCloudManager(object):
             self.current_id += 1
             self.save_current_perspective()
             self.pointcloud = PointCloud.from_file(
-                self.pcd_path,
-                self.saved_perspective,
-                write_buffer=self.pointcloud is not None,
+                self.pcd_path, self.saved_perspective
             )
+            self.check_segmentation_labels()
+            self.replay_segmentation_changes()
+            self.update_class_stats(frame_loaded=True)
             self.update_pcd_infos()
         else:
             logging.warning("No point clouds left!")
@@ -153,10 +157,11 @@ class PointCloudManager(object):
             self.current_id = pcd_index
             self.save_current_perspective()
             self.pointcloud = PointCloud.from_file(
-                self.pcd_path,
-                self.saved_perspective,
-                write_buffer=self.pointcloud is not None,
+                self.pcd_path, self.saved_perspective
             )
+            self.check_segmentation_labels()
+            self.replay_segmentation_changes()
+            self.update_class_stats(frame_loaded=True)
             self.update_pcd_infos()
         else:
             logging.warning("This point cloud does not exists!")
@@ -169,6 +174,9 @@ class PointCloudManager(object):
             self.pointcloud = PointCloud.from_file(
                 self.pcd_path, self.saved_perspective
             )
+            self.check_segmentation_labels()
+            self.replay_segmentation_changes()
+            self.update_class_stats(frame_loaded=True)
             self.update_pcd_infos()
         else:
             raise Exception("No point cloud left for loading!")
@@ -199,14 +207,45 @@ class PointCloudManager(object):
 
     def save_labels_into_file(self, elements: List[Element]) -> None:
         if self.pcds:
-            self.label_manager.export_labels(self.pcd_path, elements)
+            if self.pointcloud is not None and self.pointcloud.has_label:
+                label_path = self.pointcloud.save_segmentation_labels()
+                if self.segmentation_stats is not None:
+                    self.segmentation_stats.update_frame(
+                        label_path, self.pointcloud.label_counts
+                    )
+            self.label_manager.export_labels_in_background(self.pcd_path, elements)
             if self.LABELING:
                 self.collected_object_classes.update(
-                    {bbox.get_classname() for bbox in bboxes}
+                    {bbox.get_classname() for bbox in elements}
                 )
         else:
             logging.warning("No point clouds to save labels for!")
 
+    # JOURNAL
+    def record_change(self, op: str, **fields: Any) -> None:
+        """Append a label change of the current point cloud to the journal."""
+        journal = self.label_manager.journal
+        if journal is not None and self.pcds:
+            journal.append(self.pcd_path.name, op, **fields)
+
+    def get_unsaved_changes(self) -> List[Dict[str, Any]]:
+        """Journaled changes of the current point cloud that were not saved yet."""
+        journal = self.label_manager.journal
+        if journal is None or not self.pcds:
+            return []
+        return journal.get_records(self.pcd_path.name)
+
+    def replay_segmentation_changes(self) -> None:
+        if self.pointcloud is None or not self.pointcloud.has_label:
+            return
+        changed = replay_segmentation_labels(
+            self.pointcloud.labels, self.get_unsaved_changes()  # type: ignore
+        )
+        if len(changed):
+            self.pointcloud.count_labels()
+            self.pointcloud.update_label_colors(changed)
+            logging.info(f"Restored the unsaved labels of {len(changed)} points.")
+
     def save_current_perspective(self) -> None:
         if config.getboolean("USER_INTERFACE", "KEEP_PERSPECTIVE") and self.pointcloud:
             self.saved_perspective = Perspective.from_point_cloud(self.pointcloud)
@@ -252,7 +291,7 @@ class PointCloudManager(object):
                                center=-14,
                                exp_scale=0.00005,
                                sig_scale=0.6)*0.8 \
-            if config.getboolean("USER_INTERFACE", "exp_zoom") else 1
+            if settings.exp_zoom else 1
         
         zoom_distance = distance * PointCloudManager.ZOOM_FACTOR * falloff
 
@@ -293,6 +332,8 @@ class PointCloudManager(object):
         )
         logging.info("Copyied the original point cloud to %s.", blue(originals_path))
 
+        import open3d as o3d
+
         # Rotate and translate point cloud
         rotation_matrix = o3d.geometry.get_rotation_matrix_from_axis_angle(
             np.multiply(axis, angle)
@@ -330,14 +371,49 @@ class PointCloudManager(object):
         # Relabel the points if its inside the box
         if self.pointcloud.has_label:
             assert self.pointcloud.labels is not None
-            self.pointcloud.labels[points_inside] = (
-                LabelConfig().get_class(box.classname).id
+            label_id = LabelConfig().get_class(box.classname).id
+            self.pointcloud.set_labels(points_inside, label_id)
+            self.update_class_stats()
+            self.record_change(
+                "labels",
+                indices=encode_indices(np.flatnonzero(points_inside)),
+                label=label_id,
             )
-            self.pointcloud.update_selected_points_in_label_vbo(points_inside)
             logging.info(
                 f"Labeled {np.sum(points_inside)} points inside the current bounding box with label `{box.classname}`"
             )
 
+    def check_segmentation_labels(self) -> None:
+        """Offer to replace segmentation labels that are missing in the label config."""
+        if self.pointcloud is None or not self.pointcloud.has_label:
+            return
+        undefined_label_ids = self.pointcloud.get_undefined_label_ids()
+        if undefined_label_ids and self.view.ask_replace_undefined_labels(
+            self.pointcloud.path, undefined_label_ids
+        ):
+            self.pointcloud.replace_missing_labels_with_default()
+
+    def setting_changed(self, name: str) -> None:
+        """Apply a changed setting to the current point cloud."""
+        if name == "label_color_mix_ratio" and self.pointcloud is not None:
+            if self.pointcloud.has_label:
+                self.pointcloud.set_mix_ratio(settings.label_color_mix_ratio)
+
+    def update_class_stats(self, frame_loaded: bool = False) -> None:
+        """Show the number of points per class in the current frame and the dataset."""
+        if (
+            self.segmentation_stats is None
+            or self.pointcloud is None
+            or not self.pointcloud.has_label
+        ):
+            return
+        if frame_loaded:
+            self.segmentation_stats.set_current_frame(self.pointcloud.path.stem)
+        frame_counts = self.pointcloud.label_counts
+        self.view.update_class_stats(
+            frame_counts, self.segmentation_stats.get_dataset_counts(frame_counts)
+        )
+
     # HELPER
 
     def get_perspective(self) -> Tuple[float, float, float]:
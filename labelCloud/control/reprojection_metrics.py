@@ -0,0 +1,130 @@
+"""
+Live reprojection error of the collected point pairs under the current calibration
+"""
+
+import logging
+from typing import TYPE_CHECKING, List, Optional
+
+import numpy as np
+import numpy.typing as npt
+
+from ..definitions import Camera
+from ..utils.projection import (
+    ResidualStatistics,
+    get_projection_matrices,
+    reprojection_residuals,
+    residual_statistics,
+)
+
+if TYPE_CHECKING:
+    from .base_element_controller import BaseElementController
+
+
+class ReprojectionMetrics:
+    """Keeps the pixel residual of every point pair of an element controller.
+
+    Residuals are cached per pair and only recomputed for pairs that were added,
+    edited or deleted since the last query (or for all pairs once the projection
+    matrices change).
+    """
+
+    def __init__(
+        self,
+        element_controller: "BaseElementController",
+        pmatrices: Optional[npt.NDArray] = None,
+    ) -> None:
+        self.element_controller = element_controller
+        self.pmatrices = get_projection_matrices() if pmatrices is None else pmatrices
+        self.residuals: List[Optional[npt.NDArray[np.float64]]] = []
+
+        element_controller.register_add_element_callback(self.element_added)
+        element_controller.register_update_element_callback(self.element_updated)
+        element_controller.register_delete_element_callback(self.element_deleted)
+        element_controller.register_set_elements_callback(self.invalidate_all)
+
+    # CALLBACKS
+    def element_added(self) -> None:
+        # The controller may already have refreshed the metrics for the new element
+        if len(self.residuals) < len(self.element_controller.elements):
+            self.residuals.append(None)
+
+    def element_updated(self, element_id: int) -> None:
+        if 0 <= element_id < len(self.residuals):
+            self.residuals[element_id] = None
+
+    def element_deleted(self, element_id: int) -> None:
+        if 0 <= element_id < len(self.residuals):
+            del self.residuals[element_id]
+
+    def invalidate_all(self) -> None:
+        self.residuals = [None] * len(self.element_controller.elements)
+
+    def set_projection_matrices(self, pmatrices: npt.NDArray) -> None:
+        """Use a new calibration, all residuals have to be recomputed"""
+        self.pmatrices = np.asarray(pmatrices, dtype=np.float64).reshape(-1, 3, 4)
+        self.invalidate_all()
+
+    # METRICS
+    def refresh(self) -> None:
+        """Compute the residuals of all stale pairs, batched per camera"""
+        pairs = self.element_controller.elements
+        if len(self.residuals) < len(pairs):
+            # Elements are appended before the add callbacks run
+            self.residuals.extend([None] * (len(pairs) - len(self.residuals)))
+        elif len(self.residuals) > len(pairs):
+            logging.debug(
+                "Reprojection metrics out of sync, recomputing all residuals."
+            )
+            self.invalidate_all()
+
+        stale = [idx for idx, residual in enumerate(self.residuals) if residual is None]
+        if not stale:
+            return
+
+        cameras = np.array([int(pairs[idx].cam) for idx in stale])
+        for cam in np.unique(cameras):
+            indices = [idx for idx, c in zip(stale, cameras) if c == cam]
+            if not 0 <= cam < len(self.pmatrices):
+                logging.warning(f"No projection matrix for camera {cam}.")
+                residuals = np.full((len(indices), 2), np.nan)
+            else:
+                residuals = reprojection_residuals(
+                    [pairs[idx].p3d for idx in indices],
+                    [pairs[idx].p2d for idx in indices],
+                    self.pmatrices[cam],
+                )
+            for idx, residual in zip(indices, residuals):
+                self.residuals[idx] = residual
+
+    def get_residual(self, element_id: int) -> Optional[npt.NDArray[np.float64]]:
+        """Vector from the picked to the projected pixel of one pair"""
+        self.refresh()
+        if 0 <= element_id < len(self.residuals):
+            return self.residuals[element_id]
+        return None
+
+    def get_error(self, element_id: int) -> Optional[float]:
+        """Length of the residual of one pair in pixels"""
+        residual = self.get_residual(element_id)
+        return None if residual is None else float(np.linalg.norm(residual))
+
+    def get_camera_statistics(self, cam: int) -> Optional[ResidualStatistics]:
+        """RMS, median and maximum residual of all pairs of one camera"""
+        self.refresh()
+        residuals = [
+            residual
+            for pair, residual in zip(self.element_controller.elements, self.residuals)
+            if int(pair.cam) == cam and not np.isnan(residual).any()
+        ]
+        return residual_statistics(np.array(residuals))
+
+    def get_summary(self, cam: int) -> str:
+        """Human readable statistics of one camera for the status bar"""
+        stats = self.get_camera_statistics(cam)
+        camera_name = str(Camera(cam)).title()
+        if stats is None:
+            return f"{camera_name} camera: no point pairs"
+        return (
+            f"{camera_name} camera reprojection error ({stats.count} pairs): "
+            f"RMS {stats.rms:.2f} px, median {stats.median:.2f} px, max {stats.max:.2f} px"
+        )
@@ -0,0 +1,152 @@
+"""
+Number of points per segmentation class in the current frame and in the whole dataset.
+
+The counts of the current frame are the label histogram of the point cloud, which is
+kept up to date as boxes are assigned (see `PointCloud.label_counts`). The dataset
+totals are summed up once from an index file in the segmentation folder that caches
+the histogram of every label file together with its size and modification time, only
+label files that changed since they were indexed are read again. Afterwards the totals
+follow the saved frames, so switching frames doesn't touch the label files.
+"""
+import json
+import logging
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+import numpy as np
+import numpy.typing as npt
+
+from ..io.labels import write_file_atomic
+from ..io.segmentations import LABEL_ID_RANGE, BaseSegmentationHandler
+from ..model.point_cloud import get_segmentation_extension
+
+
+class SegmentationStats(object):
+    INDEX_FILE = ".class_stats_index.json"
+    INDEX_VERSION = 1
+
+    def __init__(self, segmentation_folder: Path) -> None:
+        self.segmentation_folder = segmentation_folder
+        self.index_path = segmentation_folder / self.INDEX_FILE
+        self.index: Dict[str, Dict[str, Any]] = self.read_index()
+        self.index_changed = False
+        # Summed up counts of all saved frames, built when the first frame is loaded
+        self.total_counts: Optional[npt.NDArray[np.int64]] = None
+        # Summed up counts of all frames but the current one
+        self.other_counts = np.zeros(LABEL_ID_RANGE, dtype=np.int64)
+
+    def read_index(self) -> Dict[str, Dict[str, Any]]:
+        try:
+            data = json.loads(self.index_path.read_text())
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            logging.warning(
+                f"Ignoring the invalid class statistics {self.index_path}: {e}"
+            )
+            return {}
+        if data.get("version") != self.INDEX_VERSION:
+            return {}
+        return data["frames"]
+
+    def write_index(self) -> None:
+        if self.segmentation_folder.is_dir():
+            write_file_atomic(
+                self.index_path,
+                json.dumps({"version": self.INDEX_VERSION, "frames": self.index}),
+            )
+        self.index_changed = False
+
+    def get_label_files(self) -> Dict[str, Path]:
+        """Label file of every frame, in the configured format if there are several."""
+        if not self.segmentation_folder.is_dir():
+            return {}
+        extensions = BaseSegmentationHandler.get_supported_extensions()
+        preferred_extension = get_segmentation_extension()
+        label_files: Dict[str, Path] = {}
+        for path in sorted(self.segmentation_folder.iterdir()):
+            if path.suffix in extensions and (
+                path.stem not in label_files or path.suffix == preferred_extension
+            ):
+                label_files[path.stem] = path
+        return label_files
+
+    def get_frame_counts(self, label_path: Path) -> npt.NDArray[np.int64]:
+        """Label histogram of a label file, read only if it changed since indexing."""
+        stat = label_path.stat()
+        entry = self.index.get(label_path.stem)
+        if (
+            entry is not None
+            and entry["file"] == label_path.name
+            and entry["size"] == stat.st_size
+            and entry["mtime_ns"] == stat.st_mtime_ns
+        ):
+            return self.get_indexed_counts(label_path.stem)
+
+        handler = BaseSegmentationHandler.get_handler(label_path.suffix)()
+        counts = handler.count_labels(label_path)
+        self.set_index_entry(label_path, counts)
+        return counts
+
+    def get_indexed_counts(self, frame: str) -> npt.NDArray[np.int64]:
+        """Label histogram of a frame as indexed, without checking its label file."""
+        counts = np.zeros(LABEL_ID_RANGE, dtype=np.int64)
+        entry = self.index.get(frame)
+        if entry is not None:
+            for label_id, count in entry["counts"].items():
+                counts[int(label_id) & 0xFF] = count
+        return counts
+
+    def set_index_entry(self, label_path: Path, counts: npt.NDArray[np.int64]) -> None:
+        stat = label_path.stat()
+        label_ids = np.flatnonzero(counts)
+        self.index[label_path.stem] = {
+            "file": label_path.name,
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+            "counts": {  # by the signed label id
+                str(label_id): int(count)
+                for label_id, count in zip(
+                    label_ids.astype(np.uint8).view(np.int8).tolist(),
+                    counts[label_ids].tolist(),
+                )
+            },
+        }
+        self.index_changed = True
+
+    def build_totals(self) -> None:
+        """Sum up the counts of all label files and bring the index up to date."""
+        label_files = self.get_label_files()
+        for stem in set(self.index).difference(label_files):  # deleted label files
+            del self.index[stem]
+            self.index_changed = True
+
+        self.total_counts = np.zeros(LABEL_ID_RANGE, dtype=np.int64)
+        for stem, label_path in label_files.items():
+            try:
+                self.total_counts += self.get_frame_counts(label_path)
+            except (OSError, ValueError) as e:
+                logging.warning(f"Skipping {label_path} in the class statistics: {e}")
+                if self.index.pop(stem, None) is not None:
+                    self.index_changed = True
+        if self.index_changed:
+            self.write_index()
+
+    def set_current_frame(self, frame: str) -> None:
+        """Exclude the saved counts of the loaded frame from the totals."""
+        if self.total_counts is None:
+            self.build_totals()
+        self.other_counts = self.total_counts - self.get_indexed_counts(frame)  # type: ignore
+
+    def get_dataset_counts(
+        self, frame_counts: npt.NDArray[np.int64]
+    ) -> npt.NDArray[np.int64]:
+        """Totals of the dataset with the current, possibly unsaved, frame counts."""
+        return self.other_counts + frame_counts
+
+    def update_frame(self, label_path: Path, counts: npt.NDArray[np.int64]) -> None:
+        """Index the counts of a label file that was just saved without reading it."""
+        if self.total_counts is not None:
+            self.total_counts += counts - self.get_indexed_counts(label_path.stem)
+        self.set_index_entry(label_path, counts)
+        self.write_index()
@@ -5,5 +5,6 @@ class ObjectDetectionFormat(BaseLabelFormat):
     VERTICES = "vertices"
     CENTROID_REL = "centroid_rel"
     CENTROID_ABS = "centroid_abs"
+    CENTROID_COMPACT = "centroid_compact"
     KITTI = "kitti"
     KITTI_UNTRANSFORMED = "kitti_untransformed"
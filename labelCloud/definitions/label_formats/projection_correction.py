@@ -1,4 +1,5 @@
 from .base import BaseLabelFormat
 
 class ProjectionCorrectionFormat(BaseLabelFormat):
-    POINT_MATCH = "point_match_raw"
\ No newline at end of file
+    POINT_MATCH = "point_match_raw"
+    POINT_MATCH_STORE = "point_match_store"
\ No newline at end of file
@@ -1,8 +1,10 @@
-from typing import Tuple, Union, Optional
+from typing import TYPE_CHECKING, Tuple, Union, Optional
 from . import Camera
-from PyQt5.QtGui import QColor
 import logging
 
+if TYPE_CHECKING:
+    from PyQt5.QtGui import QColor
+
 
 Point3D = Tuple[float, float, float]
 
@@ -24,6 +26,9 @@ class Point2D(tuple):
     def __repr__(self):
         return f"({self.__str__()})"
 
+    def __getnewargs__(self):  # for copy and pickle
+        return tuple(self)
+
 class Point3D(tuple):
     def __new__(cls, x, y, z):
         return super(Point3D, cls).__new__(cls, (x, y, z))
@@ -34,6 +39,9 @@ class Point3D(tuple):
     def __repr__(self):
         return f"({self.__str__()})"
 
+    def __getnewargs__(self):  # for copy and pickle
+        return tuple(self)
+
 class PointPairCamera():
     def __init__(self, 
         p3d : Point3D, 
@@ -61,8 +69,11 @@ class Color3f(tuple):
     def __repr__(self):
         return "ColorRGB(r={}, g={}, b={})".format(*self)
 
+    def __getnewargs__(self):  # for copy and pickle
+        return tuple(self)
+
     @classmethod
-    def from_qcolor(cls, color: QColor):
+    def from_qcolor(cls, color: "QColor"):
         return cls(color.red() / 255, color.green() / 255, color.blue() / 255)
 
     @staticmethod
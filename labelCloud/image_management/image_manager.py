@@ -10,15 +10,18 @@ from pathlib import Path
 from typing import TYPE_CHECKING, Optional, Set, Union
 import numpy as np
 
-import pkg_resources
 from PyQt5 import QtCore, QtGui, QtWidgets, uic
 from PyQt5.QtCore import Qt as Keys
 from PyQt5.QtWidgets import QGraphicsPixmapItem
 from PyQt5.QtCore import QEvent
 from PyQt5.QtGui import QPixmap, QPainter, QPen, QTransform
 
+from ..control.config_manager import config
 from ..definitions import Color3f, Camera
 from ..definitions.types import Point2D
+from ..utils.color import get_height_palette
+from ..utils.profiling import frame_profiler
+from ..utils.projection import get_projection_matrices, render_projection_overlay
 from ..utils.decorators import in_labeling_only_decorator, in_projection_only_decorator, logging_debug
 from ..control.base_drawing_manager import BaseDrawingManager
 
@@ -35,6 +38,7 @@ class SingleImageManager:
         self.scene = QtWidgets.QGraphicsScene()
         self.img : Optional[QGraphicsPixmapItem] = None
         self.base_pixmap : Optional[QPixmap] = None
+        self.projection_overlay : Optional[QtGui.QImage] = None
 
         self.camera = 0
         
@@ -192,7 +196,9 @@ class SingleImageManager:
     def refresh_base_pixmap(self) -> None:
         """Refresh base pixmap, should only be called when current sample changes"""
         self.base_pixmap = self.load_image()
+        self.projection_overlay = None
         
+    @frame_profiler.timed("render image")
     def render(self) -> None:
         if self.img is None:
             self.init_image()
@@ -204,6 +210,8 @@ class SingleImageManager:
         pixmap = self.base_pixmap.copy()
 
         if self.view.PROJECTION:
+            if config.getboolean("USER_INTERFACE", "show_projected_points", fallback=False):
+                self.draw_projected_points(pixmap)
             self.draw_pts(pixmap)
 
         self.refresh_scene_pixmap(pixmap)
@@ -254,17 +262,17 @@ class SingleImageManager:
         
         x, y = point
         
-        painter.drawLine(x-5*scale, y-5*scale, x-2.5*scale, y-2.5*scale)
-        painter.drawLine(x+5*scale, y-5*scale, x+2.5*scale, y-2.5*scale)
-        painter.drawLine(x-5*scale, y+5*scale, x-2.5*scale, y+2.5*scale)
-        painter.drawLine(x+5*scale, y+5*scale, x+2.5*scale, y+2.5*scale)
+        painter.drawLine(QtCore.QLineF(x-5*scale, y-5*scale, x-2.5*scale, y-2.5*scale))
+        painter.drawLine(QtCore.QLineF(x+5*scale, y-5*scale, x+2.5*scale, y-2.5*scale))
+        painter.drawLine(QtCore.QLineF(x-5*scale, y+5*scale, x-2.5*scale, y+2.5*scale))
+        painter.drawLine(QtCore.QLineF(x+5*scale, y+5*scale, x+2.5*scale, y+2.5*scale))
 
         painter.setPen(QPen(color, thickness, QtCore.Qt.DotLine))
         
         x, y = point
         
-        painter.drawLine(x-5*scale, y-5*scale, x+5*scale, y+5*scale)
-        painter.drawLine(x+5*scale, y-5*scale, x-5*scale, y+5*scale) 
+        painter.drawLine(QtCore.QLineF(x-5*scale, y-5*scale, x+5*scale, y+5*scale))
+        painter.drawLine(QtCore.QLineF(x+5*scale, y-5*scale, x-5*scale, y+5*scale)) 
         
         painter.end() 
 
@@ -285,9 +293,6 @@ class SingleImageManager:
     
     def draw_pts(self, pixmap : QPixmap, thickness : int = 2, scale : int = 4) -> None:
         all_pts = self.view.controller.element_controller.get_all_elements()
-        
-        if len(all_pts) == 0: 
-            return
 
         active_pt = self.view.controller.element_controller.active_element_id
         
@@ -298,6 +303,7 @@ class SingleImageManager:
             if cam != self.camera: continue        
 
             color = QtCore.Qt.green if idx == active_pt else QtCore.Qt.blue
+            self.draw_residual(p2d, idx, pixmap, thickness=thickness)
             self.draw_crosshairs(p2d, pixmap, color=color, thickness=thickness, scale=scale) 
 
         # Temporary
@@ -306,3 +312,58 @@ class SingleImageManager:
             and drawing_mode.drawing_strategy.point_2d is not None \
             and drawing_mode.drawing_strategy.camera == self.camera:
             self.draw_crosshairs(drawing_mode.drawing_strategy.point_2d, pixmap, color=QtCore.Qt.yellow, scale=4)
+        elif drawing_mode.drawing_strategy is not None \
+            and drawing_mode.drawing_strategy.has_suggestion() \
+            and drawing_mode.drawing_strategy.suggested_camera == self.camera:
+            self.draw_crosshairs(drawing_mode.drawing_strategy.suggested_point_2d, pixmap, color=QtCore.Qt.magenta, scale=4)
+
+    def draw_residual(self, p2d : Point2D, element_id : int, pixmap : QPixmap, thickness : int = 2) -> None:
+        """Draw the vector from a picked 2d point to the projection of its 3d point"""
+        residual = self.view.controller.element_controller.metrics.get_residual(element_id)
+        if residual is None or np.isnan(residual).any():
+            return
+
+        x, y = p2d
+        proj_x, proj_y = x + residual[0], y + residual[1]
+
+        painter = QPainter(pixmap)
+        painter.setPen(QPen(QtCore.Qt.red, thickness, QtCore.Qt.SolidLine))
+        painter.drawLine(QtCore.QPointF(x, y), QtCore.QPointF(proj_x, proj_y))
+        painter.drawEllipse(QtCore.QPointF(proj_x, proj_y), 2 * thickness, 2 * thickness)
+        painter.end()
+
+    def create_projection_overlay(self, width : int, height : int) -> Optional[QtGui.QImage]:
+        """Rasterize all points of the current point cloud into one RGBA layer for this camera"""
+        pointcloud = self.view.controller.pcd_manager.pointcloud
+        pmatrices = get_projection_matrices()
+        if pointcloud is None or self.camera >= len(pmatrices):
+            return None
+
+        colors = None
+        if config.get("USER_INTERFACE", "projected_points_color", fallback="depth") == "intensity":
+            colors = pointcloud.colors
+
+        layer = render_projection_overlay(
+            pointcloud.points,
+            pmatrices[self.camera],
+            width,
+            height,
+            colors=colors,
+            palette=get_height_palette(),
+            point_radius=config.getint("USER_INTERFACE", "projected_points_radius", fallback=1),
+        )
+        # Copy, so the QImage does not depend on the lifetime of the numpy buffer
+        return QtGui.QImage(
+            layer.data, width, height, 4 * width, QtGui.QImage.Format_RGBA8888
+        ).copy()
+
+    def draw_projected_points(self, pixmap : QPixmap) -> None:
+        """Draw the cached overlay of projected points, it is only rebuilt when the sample changes"""
+        if self.projection_overlay is None:
+            self.projection_overlay = self.create_projection_overlay(pixmap.width(), pixmap.height())
+        if self.projection_overlay is None:
+            return
+
+        painter = QPainter(pixmap)
+        painter.drawImage(0, 0, self.projection_overlay)
+        painter.end()
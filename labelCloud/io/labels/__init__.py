@@ -2,8 +2,10 @@ from .base import (
     BaseLabelFormat,
     abs2rel_rotation,
     rel2abs_rotation,
+    write_file_atomic,
 )
-from .centroid import CentroidFormat
+from .centroid import CentroidArrays, CentroidFormat, read_centroid_folder
 from .kitti import KittiFormat
 from .vertices import VerticesFormat
-from .point_match_raw import PointMatchRaw
\ No newline at end of file
+from .point_match_raw import PointMatchRaw
+from .point_match_store import PointMatchStore, PointPairStore
\ No newline at end of file
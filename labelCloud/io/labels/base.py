@@ -1,5 +1,8 @@
+import copy
 import json
 import logging
+import os
+import threading
 from abc import ABC, abstractmethod
 from pathlib import Path
 from typing import List, Optional, Union
@@ -12,6 +15,7 @@ from .config import LabelConfig
 
 class BaseLabelFormat(ABC):
     FILE_ENDING = ".json"
+    BACKGROUND_EXPORT = True  # exports may run on the writer thread of the LabelManager
 
     def __init__(
         self, label_folder: Path, export_precision: int, relative_rotation: bool = False
@@ -38,6 +42,10 @@ class BaseLabelFormat(ABC):
         LabelConfig().load_config()
         logging.info(f"Updated label folder to {new_label_folder}.")
 
+    def close(self) -> None:
+        """Release the resources of the format when labelCloud closes or replaces it."""
+        pass
+
     def round_dec(self, x, decimal_places: Optional[int] = None) -> List[float]:
         if not decimal_places:
             decimal_places = self.export_precision
@@ -46,20 +54,21 @@ class BaseLabelFormat(ABC):
     def save_label_to_file(self, pcd_path: Path, data: Union[dict, str], suffix: str = "_label3d") -> Path:
         name = pcd_path.stem.split('_')[0] + suffix
         label_path = self.label_folder.joinpath(name + self.FILE_ENDING)
-        print(label_path)
 
         if label_path.is_file():
             logging.info("File %s already exists, replacing file ..." % label_path)
         if label_path.suffix == ".json":
-            with open(label_path, "w") as write_file:
-                json.dump(data, write_file, indent="\t")
+            write_file_atomic(label_path, json.dumps(data, indent="\t"))
         elif label_path.suffix == ".txt" and isinstance(data, str):
-            with open(label_path, "w") as write_file:
-                write_file.write(data)
+            write_file_atomic(label_path, data)
         else:
             raise ValueError("Received unknown label format/ type.")
         return label_path
 
+    def copy_elements(self, elements: List[Element]) -> List[Element]:
+        """Copy the elements for an export in the background."""
+        return copy.deepcopy(elements)
+
     @abstractmethod
     def import_labels(self, pcd_path: Path) -> List[Element]:
         raise NotImplementedError
@@ -74,6 +83,24 @@ class BaseLabelFormat(ABC):
 # ---------------------------------------------------------------------------- #
 
 
+def write_file_atomic(path: Path, content: str) -> None:
+    """Write a file via a temporary file in the same folder that replaces it at once.
+
+    Readers and crashes never see a half-written label file.
+    """
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        with open(tmp_path, "w") as write_file:
+            write_file.write(content)
+            write_file.flush()
+            os.fsync(write_file.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        if tmp_path.exists():
+            tmp_path.unlink()
+        raise
+
+
 def abs2rel_rotation(abs_rotation: float) -> float:
     """Convert absolute rotation 0..360° into -pi..+pi from x-Axis.
 
@@ -1,38 +1,56 @@
-import json
-import yaml
 import logging
-import numpy as np
+import multiprocessing
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+import numpy.typing as npt
+import yaml
 
 from ...model import BBox
-from . import BaseLabelFormat, abs2rel_rotation, rel2abs_rotation
+from . import BaseLabelFormat, write_file_atomic
+
+try:  # libyaml bindings are many times faster than the pure Python implementation
+    from yaml import CSafeDumper as SafeDumper
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeDumper, SafeLoader  # type: ignore
+
+# Columns of the compact layout, one flow-style list per field
+FLOAT_COLUMNS = ["x", "y", "z", "length", "width", "height", "z_rotation"]
 
 
 class CentroidFormat(BaseLabelFormat):
     FILE_ENDING = ".yaml"
 
+    def __init__(
+        self,
+        label_folder: Path,
+        export_precision: int,
+        relative_rotation: bool = False,
+        compact: bool = False,
+    ) -> None:
+        super().__init__(label_folder, export_precision, relative_rotation)
+        self.compact = compact  # only changes the export, imports read both layouts
+
     def import_labels(self, pcd_path: Path) -> List[BBox]:
         labels = []
-        
+
         label_path = self.label_folder.joinpath(pcd_path.stem[:-5]+'_label3d'+self.FILE_ENDING)
         if label_path.is_file():
-            with label_path.open("r") as read_file:
-                #data = json.load(read_file)
-                data = yaml.safe_load(read_file) # LXH
-
-            for label in data["labels"]:
-                x,y,z = label["box3d"]["location"]["x"],label["box3d"]["location"]["y"],label["box3d"]["location"]["z"]
-                l,w,h = label["box3d"]["dimension"]["length"],label["box3d"]["dimension"]["width"],label["box3d"]["dimension"]["height"]
-                bbox = BBox(x,y,z,l,w,h)
-                rx,ry,rz = 0.0,0.0,(label["box3d"]["orientation"]["z_rotation"]/np.pi*180.0)
-                if self.relative_rotation:
-                    rotations = map(rel2abs_rotation, rotations)
-                bbox.set_rotations(rx,ry,rz)
-                bbox.set_classname(label["category"])
+            columns = read_label_columns(label_path)
+            z_rotations = to_degrees(columns["z_rotation"], self.relative_rotation)
+            boxes = np.stack([columns[name] for name in FLOAT_COLUMNS[:6]], axis=1)
+            for category, box, z_rotation in zip(
+                columns["category"], boxes.tolist(), z_rotations
+            ):
+                bbox = BBox(*box)
+                bbox.set_rotations(0.0, 0.0, z_rotation)
+                bbox.set_classname(category)
                 labels.append(bbox)
             logging.info(
-                "Imported %s labels from %s." % (len(data["labels"]), label_path)
+                "Imported %s labels from %s." % (len(labels), label_path)
             )
         return labels
 
@@ -42,28 +60,158 @@ class CentroidFormat(BaseLabelFormat):
         out_dict['name'] = pcd_path.name[:-9]
         out_dict['timestamp'] = 0
         out_dict['index'] = out_dict['name']
-        labels_list = []
 
-        # Labels
+        if self.compact:
+            out_dict['columns'] = self.get_label_columns(bboxes)
+        else:
+            out_dict['labels'] = self.get_label_list(bboxes)
+
+        label_path = str(self.label_folder.absolute())+'/'+out_dict['name']+'_label3d.yaml'
+        write_file_atomic(
+            Path(label_path),
+            yaml.dump(out_dict, Dumper=SafeDumper, default_flow_style=None if self.compact else False),
+        )
+
+        # Save to YAML
+        logging.info(
+            f"Exported {len(bboxes)} labels to {label_path} "
+            f"in {self.__class__.__name__} formatting!"
+        )
+
+    @staticmethod
+    def get_label_list(bboxes: List[BBox]) -> List[Dict[str, Any]]:
+        labels_list = []
         for i in range(len(bboxes)):
             bbox = bboxes[i]
             label_i = {}
             label_i['id'] = i+1
-            label_i['category'] = bbox.get_classname()            
+            label_i['category'] = bbox.get_classname()
             dimension = {'length':float(bbox.length), 'width':float(bbox.width), 'height':float(bbox.height)}
             location = {'x':float(bbox.center[0]), 'y':float(bbox.center[1]), 'z':float(bbox.center[2])}
             orientation = {'x_rotation':0.0,'y_rotation':0.0,'z_rotation':float(bbox.z_rotation/180.0*np.pi)}
             label_i['box3d'] = {'dimension':dimension, 'location':location, 'orientation':orientation}
             labels_list.append(label_i)
-        out_dict['labels'] = labels_list
+        return labels_list
 
-        label_path = str(self.label_folder.absolute())+'/'+out_dict['name']+'_label3d.yaml'
-        with open(label_path, 'w') as f:
-            yaml.safe_dump(out_dict, f)
-        f.close()     
+    def get_label_columns(self, bboxes: List[BBox]) -> Dict[str, list]:
+        values = np.array(
+            [
+                [*bbox.center, bbox.length, bbox.width, bbox.height, bbox.z_rotation]
+                for bbox in bboxes
+            ],
+            dtype=np.float64,
+        ).reshape(-1, len(FLOAT_COLUMNS))
+        values[:, -1] = np.deg2rad(values[:, -1])
+        columns: Dict[str, list] = {
+            'id': list(range(1, len(bboxes) + 1)),
+            'category': [bbox.get_classname() for bbox in bboxes],
+        }
+        for name, column in zip(FLOAT_COLUMNS, self.round_dec(values.T)):
+            columns[name] = column
+        return columns
 
-        # Save to YAML
-        logging.info(
-            f"Exported {len(bboxes)} labels to {label_path} "
-            f"in {self.__class__.__name__} formatting!"
+
+# ---------------------------------------------------------------------------- #
+#                                  Bulk Reader                                 #
+# ---------------------------------------------------------------------------- #
+
+
+@dataclass
+class CentroidArrays:
+    """Columnar view on the boxes of many label files."""
+
+    frames: npt.NDArray[np.str_]  # name of the label file of each box
+    categories: npt.NDArray[np.str_]
+    centers: npt.NDArray[np.float64]  # (N, 3)
+    dimensions: npt.NDArray[np.float64]  # (N, 3) length, width, height
+    z_rotations: npt.NDArray[np.float64]  # degrees
+
+    def __len__(self) -> int:
+        return len(self.categories)
+
+
+def read_label_columns(label_path: Path) -> Dict[str, Any]:
+    """Read a centroid label file of either layout into a list of categories and
+    float arrays of the `FLOAT_COLUMNS` (z-rotation in radians as stored)."""
+    with label_path.open("r") as read_file:
+        data = yaml.load(read_file, Loader=SafeLoader)
+
+    if "columns" in data:
+        columns = data["columns"]
+        return {
+            "category": columns["category"],
+            **{name: np.asarray(columns[name], dtype=np.float64) for name in FLOAT_COLUMNS},
+        }
+
+    labels = data["labels"] or []
+    values = np.array(
+        [
+            [
+                label["box3d"]["location"]["x"],
+                label["box3d"]["location"]["y"],
+                label["box3d"]["location"]["z"],
+                label["box3d"]["dimension"]["length"],
+                label["box3d"]["dimension"]["width"],
+                label["box3d"]["dimension"]["height"],
+                label["box3d"]["orientation"]["z_rotation"],
+            ]
+            for label in labels
+        ],
+        dtype=np.float64,
+    ).reshape(-1, len(FLOAT_COLUMNS))
+    return {
+        "category": [label["category"] for label in labels],
+        **dict(zip(FLOAT_COLUMNS, values.T)),
+    }
+
+
+def to_degrees(z_rotations: npt.NDArray[np.float64], relative_rotation: bool) -> List[float]:
+    """Convert the stored z-rotations like `CentroidFormat.import_labels` does."""
+    degrees = np.rad2deg(z_rotations)
+    if relative_rotation:
+        degrees = np.where(degrees < 0, degrees + 360, degrees)
+    return degrees.tolist()
+
+
+def read_centroid_folder(
+    label_folder: Path, relative_rotation: bool = False, processes: Optional[int] = None
+) -> CentroidArrays:
+    """Read all centroid label files of a folder in a pool of processes.
+
+    :param processes: number of worker processes, defaults to the number of CPUs
+    """
+    label_paths = sorted(label_folder.glob("*_label3d" + CentroidFormat.FILE_ENDING))
+    processes = min(processes or multiprocessing.cpu_count(), len(label_paths))
+    if processes > 1:
+        with multiprocessing.Pool(processes) as pool:
+            chunksize = max(1, min(64, len(label_paths) // (processes * 8)))
+            file_columns = pool.map(read_label_columns, label_paths, chunksize)
+    else:
+        file_columns = [read_label_columns(path) for path in label_paths]
+
+    def concatenate(name: str) -> npt.NDArray[np.float64]:
+        return np.concatenate(
+            [np.empty(0)] + [columns[name] for columns in file_columns]
         )
+
+    return CentroidArrays(
+        frames=np.array(
+            [
+                path.stem
+                for path, columns in zip(label_paths, file_columns)
+                for _ in columns["category"]
+            ],
+            dtype=np.str_,
+        ),
+        categories=np.array(
+            [category for columns in file_columns for category in columns["category"]],
+            dtype=np.str_,
+        ),
+        centers=np.stack([concatenate("x"), concatenate("y"), concatenate("z")], axis=1),
+        dimensions=np.stack(
+            [concatenate("length"), concatenate("width"), concatenate("height")], axis=1
+        ),
+        z_rotations=np.asarray(
+            to_degrees(concatenate("z_rotation"), relative_rotation), dtype=np.float64
+        ),
+    )
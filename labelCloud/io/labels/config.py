@@ -1,6 +1,6 @@
 import json
 from dataclasses import dataclass
-from typing import Dict, List, Union
+from typing import Callable, Dict, List, Union
 
 import numpy as np
 import numpy.typing as npt
@@ -50,14 +50,63 @@ class ClassConfig:
 
 class LabelConfig(object, metaclass=SingletonABCMeta):
     def __init__(self) -> None:
-        self.classes: List[ClassConfig]
         self.default: int
         self.type: LabelingMode
         self.format: BaseLabelFormat
 
+        # Lookup tables of the classes, rebuilt by `update_tables` whenever they change
+        self.version: int = 0
+        self.update_callbacks: List[Callable[[], None]] = []
+        self.class_by_name: Dict[str, ClassConfig] = {}
+        self.name_by_id: Dict[int, str] = {}
+        self.color_map: npt.NDArray[np.float32]
+        self.class_order: npt.NDArray[np.int8]
+        self.id_color_map: npt.NDArray[np.float32]
+
         if getattr(self, "_loaded", False) != True:
             self.load_config()
 
+    @property
+    def classes(self) -> List[ClassConfig]:
+        return self._classes
+
+    @classes.setter
+    def classes(self, classes: List[ClassConfig]) -> None:
+        self._classes = classes
+        self.update_tables()
+
+    def update_tables(self) -> None:
+        """Rebuild the lookup tables of the classes and notify their consumers.
+
+        Consumers that poll once per frame (e.g. the label VBO) compare `version`,
+        others register a callback with `register_update_callback`.
+        """
+        self.class_by_name = {c.name: c for c in self.classes}
+        self.name_by_id = {c.id: c.name for c in self.classes}
+
+        # (N, 3) array, color_map[i] is the rgb color of the i-th class
+        self.color_map = np.array(
+            [c.color[0:3] for c in self.classes], dtype=np.float32
+        ).reshape(-1, 3)
+        # class_order[id] is the order of the class in the label definition (or -1)
+        self.class_order = -np.ones(
+            (max((c.id for c in self.classes), default=-1) + 1,), dtype=np.int8
+        )
+        for order, c in enumerate(self.classes):
+            self.class_order[c.id] = order
+        # id_color_map[id] is the rgb color of the class, equals color_map[class_order]
+        self.id_color_map = self.color_map[self.class_order] if self.classes else self.color_map
+        for table in (self.color_map, self.class_order, self.id_color_map):
+            table.flags.writeable = False
+
+        self.version += 1
+        for callback in self.update_callbacks:
+            callback()
+
+    def register_update_callback(self, callback: Callable[[], None]) -> None:
+        """Add an action to be performed whenever the classes or their colors change."""
+        self.update_callbacks.append(callback)
+
     def load_config(self) -> None:
         class_definition_path = config.getpath("FILE", "class_definitions")
         if class_definition_path.exists():
@@ -92,44 +141,27 @@ class LabelConfig(object, metaclass=SingletonABCMeta):
     def nb_of_classes(self) -> int:
         return len(self.classes)
 
-    @property
-    def color_map(self) -> npt.NDArray[np.float32]:
-        """An (N, 3) array where N is the number of classes and color_map[i] represents the i-th class' rgb color."""
-        return np.array([c.color[0:3] for c in self.classes]).astype(np.float32)
-
-    @property
-    def class_order(self) -> npt.NDArray[np.int8]:
-        """An array lookup table to look up the order of a class id in the label definition."""
-        max_class_id = max(c.id for c in self.classes) + 1
-        lookup = -np.ones((max_class_id,), dtype=np.int8)
-        for order, c in enumerate(self.classes):
-            lookup[c.id] = order
-        return lookup
-
     # GETTERS
 
     def get_classes(self) -> Dict[str, ClassConfig]:
-        return {c.name: c for c in self.classes}
+        return self.class_by_name
 
     def get_class(self, class_name: str) -> ClassConfig:
-        return self.get_classes()[class_name]
+        return self.class_by_name[class_name]
 
     def get_relative_class(self, current_class: str, step: int) -> str:
         """Get class, relative to current by id according to given step"""
         if step == 0:
             return current_class
-        id2name = {cc.id: cc.name for cc in self.classes}
-        name2id = {v: k for k, v in id2name.items()}
-        ids = name2id.values()
+        ids = self.name_by_id
         corner_case_id = max(ids) if step < 0 else min(ids)
-        current_id = name2id[current_class]
-        result_id = current_id + step
+        result_id = self.class_by_name[current_class].id + step
         result_id = result_id if result_id in ids else corner_case_id
-        return id2name[result_id]
+        return ids[result_id]
 
     def get_class_color(self, class_name: str) -> Color3f:
         try:
-            return self.get_classes()[class_name].color
+            return self.class_by_name[class_name].color
         except KeyError:
             warn_once(
                 "No color defined for class '%s'!" "Proceeding with red.", class_name
@@ -161,6 +193,7 @@ class LabelConfig(object, metaclass=SingletonABCMeta):
 
     def set_class_color(self, class_name: str, color: Color3f) -> None:
         self.get_class(class_name).color = color
+        self.update_tables()
         self.save_config()
 
     def set_label_format(self, label_format: Union[BaseLabelFormat, str]) -> None:
@@ -4,11 +4,13 @@
 #
 
 
+import copy
 import logging
 import math
-from collections import defaultdict
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Tuple
+from weakref import WeakKeyDictionary
 
 import numpy as np
 import numpy.typing as npt
@@ -17,6 +19,8 @@ from ...control.config_manager import config
 from ...model import BBox
 from . import BaseLabelFormat, abs2rel_rotation, rel2abs_rotation
 
+CALIBRATION_CACHE_SIZE = 256  # parsed calibration files kept in memory
+
 
 def _read_calibration_file(calib_path: Path) -> Dict[str, np.ndarray]:
     lines = []
@@ -31,6 +35,40 @@ def _read_calibration_file(calib_path: Path) -> Dict[str, np.ndarray]:
     return calib_dict
 
 
+@lru_cache(maxsize=CALIBRATION_CACHE_SIZE)
+def _load_transforms(
+    calib_path: Path, mtime_ns: int
+) -> Tuple[npt.NDArray[np.float64], npt.NDArray[np.float64]]:
+    """Parse the velodyne-to-camera transformation and its inverse of a calibration file.
+
+    The modification time is part of the cache key, so edited files are parsed again.
+    """
+    calib_dict = _read_calibration_file(calib_path)
+
+    T_rect = calib_dict["R0_rect"]
+    T_rect = T_rect.reshape(3, 3)
+    T_rect = np.insert(T_rect, 3, values=[0, 0, 0], axis=0)
+    T_rect = np.insert(T_rect, 3, values=[0, 0, 0, 1], axis=1)
+
+    T_v2c = calib_dict["Tr_velo_to_cam"]
+    T_v2c = T_v2c.reshape(3, 4)
+    T_v2c = np.insert(T_v2c, 3, values=[0, 0, 0, 1], axis=0)
+
+    T_v2c = T_rect @ T_v2c
+    T_c2v = np.linalg.inv(T_v2c)
+    T_v2c.flags.writeable = False  # shared by all users of the cache
+    T_c2v.flags.writeable = False
+    return T_v2c, T_c2v
+
+
+def transform_points(
+    points: npt.NDArray[np.float64], transform: npt.NDArray[np.float64]
+) -> npt.NDArray[np.float64]:
+    """Apply a homogeneous (4, 4) transformation to (N, 3) points at once."""
+    points1 = np.hstack([points, np.ones((len(points), 1))])
+    return (points1 @ transform.T)[:, :3]
+
+
 class CalibrationFileNotFound(Exception):
     def __init__(self, calib_path: Path, pcd_name: str) -> None:
         self.calib_path = calib_path
@@ -68,12 +106,11 @@ class KittiFormat(BaseLabelFormat):
         self.transformed = transformed
 
         self.calib_folder = config.getpath("FILE", "calib_folder")
-        self.T_v2c: Optional[npt.ArrayLike] = None
-        self.T_c2v: Optional[npt.ArrayLike] = None
 
-        self.bboxes_meta: Dict[int, Dict] = defaultdict(
-            lambda: TEMPLATE_META
-        )  # id: meta
+        # Imported KITTI attributes of each box, dropped together with the box
+        self.bboxes_meta: "WeakKeyDictionary[BBox, Dict[str, str]]" = (
+            WeakKeyDictionary()
+        )
 
     def import_labels(self, pcd_path: Path) -> List[BBox]:
         bboxes = []
@@ -83,46 +120,47 @@ class KittiFormat(BaseLabelFormat):
             with label_path.open("r") as read_file:
                 label_lines = read_file.readlines()
 
+            metas = []
             for line in label_lines:
                 line_elements = line.split()
-                meta = {
-                    "type": line_elements[0],
-                    "truncated": line_elements[1],
-                    "occluded": line_elements[2],
-                    "alpha": line_elements[3],
-                    "bbox": " ".join(line_elements[4:8]),
-                    "dimensions": " ".join(line_elements[8:11]),
-                    "location": " ".join(line_elements[11:14]),
-                    "rotation_y": line_elements[14],
-                }
-
-                centroid = tuple([float(v) for v in meta["location"].split()])
-
-                height, width, length = tuple(
-                    [float(v) for v in meta["dimensions"].split()]
+                metas.append(
+                    {
+                        "type": line_elements[0],
+                        "truncated": line_elements[1],
+                        "occluded": line_elements[2],
+                        "alpha": line_elements[3],
+                        "bbox": " ".join(line_elements[4:8]),
+                        "dimensions": " ".join(line_elements[8:11]),
+                        "location": " ".join(line_elements[11:14]),
+                        "rotation_y": line_elements[14],
+                    }
                 )
 
-                if self.transformed:
-                    try:
-                        self._get_transforms(pcd_path)
-                    except CalibrationFileNotFound as exc:
-                        logging.exception("Calibration file not found")
-                        logging.warning(
-                            "Skipping loading of labels for this point cloud"
-                        )
-                        return []
-
-                    xyz1 = np.insert(np.asarray(centroid), 3, values=[1])
-                    xyz1 = self.T_c2v @ xyz1
-                    centroid = tuple([float(n) for n in xyz1[:-1]])
-                    centroid = (
-                        centroid[0],
-                        centroid[1],
-                        centroid[2] + height / 2,
-                    )  # centroid in KITTI located on bottom face of bbox
+            centroids = np.array(
+                [meta["location"].split() for meta in metas], dtype=np.float64
+            ).reshape(-1, 3)
+            # height, width, length
+            dimensions = np.array(
+                [meta["dimensions"].split() for meta in metas], dtype=np.float64
+            ).reshape(-1, 3)
+
+            if self.transformed and metas:
+                try:
+                    _, T_c2v = self._get_transforms(pcd_path)
+                except CalibrationFileNotFound as exc:
+                    logging.exception("Calibration file not found")
+                    logging.warning("Skipping loading of labels for this point cloud")
+                    return []
+
+                centroids = transform_points(centroids, T_c2v)
+                # centroid in KITTI located on bottom face of bbox
+                centroids[:, 2] += dimensions[:, 0] / 2
 
+            for meta, centroid, (height, width, length) in zip(
+                metas, centroids.tolist(), dimensions.tolist()
+            ):
                 bbox = BBox(*centroid, length, width, height)  # type: ignore
-                self.bboxes_meta[id(bbox)] = meta
+                self.bboxes_meta[bbox] = meta
 
                 rotation = (
                     -float(meta["rotation_y"]) + math.pi / 2
@@ -140,41 +178,41 @@ class KittiFormat(BaseLabelFormat):
     def export_labels(self, bboxes: List[BBox], pcd_path: Path) -> None:
         data = str()
 
+        centroids = np.array(
+            [bbox.get_center() for bbox in bboxes], dtype=np.float64
+        ).reshape(-1, 3)
+        # invert sequence to height, width, length
+        dimensions = np.array(
+            [bbox.get_dimensions()[::-1] for bbox in bboxes], dtype=np.float64
+        ).reshape(-1, 3)
+
+        if self.transformed and bboxes:
+            try:
+                T_v2c, _ = self._get_transforms(pcd_path)
+            except CalibrationFileNotFound as exc:
+                logging.exception("Calibration file not found")
+                logging.warning("Skipping writing of labels for this point cloud")
+                return
+
+            # centroid in KITTI located on bottom face of bbox
+            centroids[:, 2] -= dimensions[:, 0] / 2
+            centroids = transform_points(centroids, T_v2c)
+
         # Labels
-        for bbox in bboxes:
+        for bbox, centroid, bbox_dimensions in zip(
+            bboxes, self.round_dec(centroids), self.round_dec(dimensions)
+        ):
             obj_type = bbox.get_classname()
-            centroid = bbox.get_center()
-            dimensions = bbox.get_dimensions()
-
-            # invert sequence to height, width, length
-            dimensions = dimensions[2], dimensions[1], dimensions[0]
-
-            if self.transformed:
-                try:
-                    self._get_transforms(pcd_path)
-                except CalibrationFileNotFound as exc:
-                    logging.exception("Calibration file not found")
-                    logging.warning("Skipping writing of labels for this point cloud")
-                    return
-
-                centroid = (
-                    centroid[0],
-                    centroid[1],
-                    centroid[2] - dimensions[2] / 2,
-                )  # centroid in KITTI located on bottom face of bbox
-                xyz1 = np.insert(np.asarray(centroid), 3, values=[1])
-                xyz1 = self.T_v2c @ xyz1
-                centroid = tuple([float(n) for n in xyz1[:-1]])  # type: ignore
 
             rotation = bbox.get_z_rotation()
             rotation = abs2rel_rotation(rotation)
             rotation = -(rotation - math.pi / 2) if self.transformed else rotation
             rotation = str(self.round_dec(rotation))  # type: ignore
 
-            location_str = " ".join([str(self.round_dec(v)) for v in centroid])
-            dimensions_str = " ".join([str(self.round_dec(v)) for v in dimensions])
+            location_str = " ".join([str(v) for v in centroid])
+            dimensions_str = " ".join([str(v) for v in bbox_dimensions])
 
-            out_str = list(self.bboxes_meta[id(bbox)].values())
+            out_str = list(self.bboxes_meta.get(bbox, TEMPLATE_META).values())
             if obj_type != "DontCare":
                 out_str[0] = obj_type
                 out_str[5] = dimensions_str
@@ -189,33 +227,31 @@ class KittiFormat(BaseLabelFormat):
             f"Exported {len(bboxes)} labels to {path_to_file} "
             f"in {self.__class__.__name__} formatting!"
         )
-        self.T_v2c = None
-        self.T_c2v = None
+
+    def copy_elements(self, bboxes: List[BBox]) -> List[BBox]:
+        """Copy the boxes together with the KITTI attributes they were imported with."""
+        copies = copy.deepcopy(bboxes)
+        for bbox, bbox_copy in zip(bboxes, copies):
+            if bbox in self.bboxes_meta:
+                self.bboxes_meta[bbox_copy] = self.bboxes_meta[bbox]
+        return copies
 
     # ---------------------------------------------------------------------------- #
     #                               Helper Functions                               #
     # ---------------------------------------------------------------------------- #
 
-    def _get_transforms(self, pcd_path: Path) -> None:
-        if self.T_v2c is None or self.T_c2v is None:
-            calib_path = self.calib_folder.joinpath(pcd_path.stem + self.FILE_ENDING)
-
-            if not calib_path.is_file():
-                logging.exception(
-                    " Skipping the loading of labels for this point cloud ..."
-                )
-                raise CalibrationFileNotFound(calib_path, pcd_path.name)
-
-            calib_dict = _read_calibration_file(calib_path)
-
-            T_rect = calib_dict["R0_rect"]
-            T_rect = T_rect.reshape(3, 3)
-            T_rect = np.insert(T_rect, 3, values=[0, 0, 0], axis=0)
-            T_rect = np.insert(T_rect, 3, values=[0, 0, 0, 1], axis=1)
-
-            T_v2c = calib_dict["Tr_velo_to_cam"]
-            T_v2c = T_v2c.reshape(3, 4)
-            T_v2c = np.insert(T_v2c, 3, values=[0, 0, 0, 1], axis=0)
-
-            self.T_v2c = T_rect @ T_v2c
-            self.T_c2v = np.linalg.inv(self.T_v2c)  # type: ignore
+    def _get_transforms(
+        self, pcd_path: Path
+    ) -> Tuple[npt.NDArray[np.float64], npt.NDArray[np.float64]]:
+        """Return the velodyne-to-camera transformation of the point cloud and its inverse."""
+        calib_path = self.calib_folder.joinpath(pcd_path.stem + self.FILE_ENDING)
+
+        try:
+            mtime_ns = calib_path.stat().st_mtime_ns
+        except FileNotFoundError:
+            logging.exception(
+                " Skipping the loading of labels for this point cloud ..."
+            )
+            raise CalibrationFileNotFound(calib_path, pcd_path.name)
+
+        return _load_transforms(calib_path, mtime_ns)
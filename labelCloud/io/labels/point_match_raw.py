@@ -23,25 +23,36 @@ class PointMatchRaw(BaseLabelFormat):
         self.name_suffix = "_points" 
     
     def import_labels(self, pcd_path: Path) -> List[PointPairCamera]:
-        points = []
-       
         name = pcd_path.stem.split('_')[0] + self.name_suffix 
         label_path = self.label_folder.joinpath(name + self.FILE_ENDING)
 
         if label_path.is_file():
-            with label_path.open("r") as read_file:
-                lines = read_file.readlines()
-            
-            for line in lines[1:]:
-                try:
-                    cam, p3dx, p3dy, p3dz, p2dx, p2dy = line.split(',')
-                    p3d = Point3D(float(p3dx), float(p3dy), float(p3dz))
-                    p2d = Point2D(float(p2dx), float(p2dy))
-                    point = PointPairCamera(p3d, p2d, int(cam))
-                    points.append(point)
-                except ValueError:
-                    logging.warning(f"Error reading points from {label_path}, it likely has no points")
-                    continue
+            return self.read_label_file(label_path)
+        return []
+
+    def import_all_labels(self) -> List[PointPairCamera]:
+        """Collect the point pairs of all frames in the label folder"""
+        points = []
+        for label_path in sorted(self.label_folder.glob(f"*{self.name_suffix}{self.FILE_ENDING}")):
+            points.extend(self.read_label_file(label_path))
+        return points
+
+    @staticmethod
+    def read_label_file(label_path: Path) -> List[PointPairCamera]:
+        points = []
+        with label_path.open("r") as read_file:
+            lines = read_file.readlines()
+        
+        for line in lines[1:]:
+            try:
+                cam, p3dx, p3dy, p3dz, p2dx, p2dy = line.split(',')
+                p3d = Point3D(float(p3dx), float(p3dy), float(p3dz))
+                p2d = Point2D(float(p2dx), float(p2dy))
+                point = PointPairCamera(p3d, p2d, int(cam))
+                points.append(point)
+            except ValueError:
+                logging.warning(f"Error reading points from {label_path}, it likely has no points")
+                continue
         
         return points
 
@@ -0,0 +1,260 @@
+import logging
+import sqlite3
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable, List, Optional
+
+import numpy as np
+import numpy.typing as npt
+
+from ...definitions import Point2D, Point3D, PointPairCamera
+from .point_match_raw import PointMatchRaw
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS pairs (
+    frame TEXT NOT NULL,
+    revision INTEGER NOT NULL,
+    cam INTEGER NOT NULL,
+    x REAL NOT NULL, y REAL NOT NULL, z REAL NOT NULL,
+    u REAL NOT NULL, v REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS pairs_frame ON pairs (frame, revision, cam);
+CREATE TABLE IF NOT EXISTS frames (
+    frame TEXT PRIMARY KEY,
+    revision INTEGER NOT NULL
+);
+"""
+
+CURRENT_PAIRS = """
+SELECT pairs.frame, pairs.cam, pairs.x, pairs.y, pairs.z, pairs.u, pairs.v
+FROM pairs JOIN frames
+ON pairs.frame = frames.frame AND pairs.revision = frames.revision
+"""
+
+
+@dataclass
+class PointPairArrays:
+    """Columnar view on many point pairs."""
+
+    frames: npt.NDArray[np.str_]
+    cameras: npt.NDArray[np.int64]
+    points_3d: npt.NDArray[np.float64]  # (N, 3)
+    points_2d: npt.NDArray[np.float64]  # (N, 2)
+
+    def __len__(self) -> int:
+        return len(self.cameras)
+
+    def to_point_pairs(self) -> List[PointPairCamera]:
+        return [
+            PointPairCamera(Point3D(*p3d), Point2D(*p2d), int(cam))
+            for cam, p3d, p2d in zip(
+                self.cameras, self.points_3d.tolist(), self.points_2d.tolist()
+            )
+        ]
+
+
+class PointPairStore(object):
+    """Append-only SQLite store of the point pairs of all frames.
+
+    Saving a frame appends its pairs as a new revision and moves the frame's pointer
+    to it, so earlier revisions stay available until `compact` is called. This happens
+    when the store is closed or once the superseded pairs outnumber the current ones
+    (and `COMPACT_MIN_ROWS`). Pairs are indexed by frame, revision and camera.
+    """
+
+    COMPACT_MIN_ROWS = 10_000
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self.connection = sqlite3.connect(str(path))
+        self.connection.executescript(SCHEMA)
+        self.current_rows = self.count_rows(CURRENT_PAIRS)
+        self.superseded_rows = (
+            self.count_rows("SELECT 1 FROM pairs") - self.current_rows
+        )
+
+    def count_rows(self, query: str, parameters: tuple = ()) -> int:
+        row = self.connection.execute(f"SELECT COUNT(*) FROM ({query})", parameters)
+        return row.fetchone()[0]
+
+    def close(self) -> None:
+        if self.superseded_rows:
+            self.compact()
+        self.connection.close()
+
+    def is_empty(self) -> bool:
+        return (
+            self.connection.execute("SELECT 1 FROM frames LIMIT 1").fetchone() is None
+        )
+
+    def has_frame(self, frame: str) -> bool:
+        row = self.connection.execute("SELECT 1 FROM frames WHERE frame = ?", (frame,))
+        return row.fetchone() is not None
+
+    def get_frames(self) -> List[str]:
+        rows = self.connection.execute("SELECT frame FROM frames ORDER BY frame")
+        return [frame for frame, in rows]
+
+    def save_frame(self, frame: str, pairs: Iterable[PointPairCamera]) -> None:
+        """Store the pairs as the new current revision of the frame"""
+        with self.connection:
+            row = self.connection.execute(
+                "SELECT MAX(revision) FROM pairs WHERE frame = ?", (frame,)
+            ).fetchone()
+            revision = 0 if row[0] is None else row[0] + 1
+            inserted = self.connection.executemany(
+                "INSERT INTO pairs VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    (
+                        frame,
+                        revision,
+                        int(pair.cam),
+                        *map(float, pair.p3d),
+                        *map(float, pair.p2d),
+                    )
+                    for pair in pairs
+                ),
+            )
+            previous_rows = self.count_rows(
+                CURRENT_PAIRS + " WHERE pairs.frame = ?", (frame,)
+            )
+            self.connection.execute(
+                "INSERT OR REPLACE INTO frames VALUES (?, ?)", (frame, revision)
+            )
+        self.current_rows += inserted.rowcount - previous_rows
+        self.superseded_rows += previous_rows
+        if self.superseded_rows > max(self.COMPACT_MIN_ROWS, self.current_rows):
+            self.compact()
+
+    def load_frame(self, frame: str) -> List[PointPairCamera]:
+        return self.load_arrays(frame).to_point_pairs()
+
+    def load_arrays(
+        self, frame: Optional[str] = None, cam: Optional[int] = None
+    ) -> PointPairArrays:
+        """Bulk load the current pairs, optionally only of one frame and/ or camera"""
+        query, conditions, parameters = CURRENT_PAIRS, [], []
+        if frame is not None:
+            conditions.append("pairs.frame = ?")
+            parameters.append(frame)
+        if cam is not None:
+            conditions.append("pairs.cam = ?")
+            parameters.append(cam)
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions)
+
+        rows = self.connection.execute(
+            query + " ORDER BY pairs.rowid", parameters
+        ).fetchall()
+        if not rows:
+            return PointPairArrays(
+                np.empty(0, dtype=str),
+                np.empty(0, dtype=np.int64),
+                np.empty((0, 3)),
+                np.empty((0, 2)),
+            )
+        frames, cams, *values = zip(*rows)
+        values = np.array(values, dtype=np.float64).T
+        return PointPairArrays(
+            np.array(frames),
+            np.array(cams, dtype=np.int64),
+            values[:, 0:3],
+            values[:, 3:5],
+        )
+
+    def compact(self) -> None:
+        """Drop all superseded revisions"""
+        with self.connection:
+            self.connection.execute(
+                "DELETE FROM pairs WHERE rowid NOT IN "
+                "(SELECT pairs.rowid FROM pairs JOIN frames "
+                "ON pairs.frame = frames.frame AND pairs.revision = frames.revision)"
+            )
+        self.connection.execute("VACUUM")
+        self.superseded_rows = 0
+
+    # TEXT FORMAT COMPATIBILITY
+    def import_text_folder(self, folder: Path, name_suffix: str = "_points") -> int:
+        """Import all `<frame>_points.txt` files written by PointMatchRaw
+
+        :return: number of imported frames
+        """
+        label_paths = sorted(folder.glob(f"*{name_suffix}{PointMatchRaw.FILE_ENDING}"))
+        for label_path in label_paths:
+            frame = label_path.stem[: -len(name_suffix)]
+            self.save_frame(frame, PointMatchRaw.read_label_file(label_path))
+        return len(label_paths)
+
+    def export_text_folder(self, folder: Path, name_suffix: str = "_points") -> int:
+        """Write every frame as `<frame>_points.txt` in the PointMatchRaw format
+
+        :return: number of exported frames
+        """
+        folder.mkdir(parents=True, exist_ok=True)
+        frames = self.get_frames()
+        for frame in frames:
+            pairs = self.load_frame(frame)
+            output = "camera,point3d_x_y_z,point2d_x_y\n"
+            output += "".join(f"{pair}\n" for pair in pairs)
+            folder.joinpath(frame + name_suffix + PointMatchRaw.FILE_ENDING).write_text(
+                output
+            )
+        return len(frames)
+
+
+class PointMatchStore(PointMatchRaw):
+    """Keeps the point pairs of all frames in one indexed store instead of text files."""
+
+    STORE_NAME = "_points.sqlite"
+    BACKGROUND_EXPORT = (
+        False  # the connection belongs to the GUI thread, commits are atomic
+    )
+
+    def __init__(
+        self,
+        label_folder: Path,
+        export_precision: int,
+        relative_rotation: bool = False,
+        transformed: bool = True,
+    ) -> None:
+        super().__init__(label_folder, export_precision, relative_rotation, transformed)
+        self.store = self.open_store(label_folder)
+
+    def open_store(self, label_folder: Path) -> PointPairStore:
+        """Open the folder's store, importing existing text files on first use"""
+        store = PointPairStore(label_folder.joinpath(self.STORE_NAME))
+        if store.is_empty():
+            imported = store.import_text_folder(label_folder, self.name_suffix)
+            if imported:
+                logging.info(
+                    f"Imported the point pairs of {imported} frames into {store.path}."
+                )
+        return store
+
+    def close(self) -> None:
+        self.store.close()
+
+    def update_label_folder(self, new_label_folder: Path) -> None:
+        self.store.close()
+        self.store = self.open_store(new_label_folder)
+        super().update_label_folder(new_label_folder)
+
+    @staticmethod
+    def get_frame_name(pcd_path: Path) -> str:
+        return pcd_path.stem.split("_")[0]
+
+    def import_labels(self, pcd_path: Path) -> List[PointPairCamera]:
+        return self.store.load_frame(self.get_frame_name(pcd_path))
+
+    def import_all_labels(self) -> List[PointPairCamera]:
+        return self.store.load_arrays().to_point_pairs()
+
+    def export_labels(self, points: List[PointPairCamera], pcd_path: Path) -> None:
+        frame = self.get_frame_name(pcd_path)
+        if len(points) == 0 and not self.store.has_frame(frame):
+            return
+        self.store.save_frame(frame, points)
+        logging.info(
+            f"Exported {len(points)} pairs of frame {frame} to {self.store.path} "
+            f"in {self.__class__.__name__} formatting!"
+        )
@@ -3,11 +3,12 @@ from typing import TYPE_CHECKING, Optional, Tuple
 
 import numpy as np
 import numpy.typing as npt
-import open3d as o3d
 
 from . import BasePointCloudHandler
 
 if TYPE_CHECKING:
+    import open3d as o3d
+
     from ...model import PointCloud
 
 
@@ -19,7 +20,7 @@ class Open3DHandler(BasePointCloudHandler):
 
     @staticmethod
     def to_point_cloud(
-        pointcloud: o3d.geometry.PointCloud,
+        pointcloud: "o3d.geometry.PointCloud",
     ) -> Tuple[npt.NDArray, Optional[npt.NDArray]]:
         return (
             np.asarray(pointcloud.points).astype("float32"),
@@ -27,7 +28,9 @@ class Open3DHandler(BasePointCloudHandler):
         )
 
     @staticmethod
-    def to_open3d_point_cloud(pointcloud: "PointCloud") -> o3d.geometry.PointCloud:
+    def to_open3d_point_cloud(pointcloud: "PointCloud") -> "o3d.geometry.PointCloud":
+        import open3d as o3d
+
         o3d_pointcloud = o3d.geometry.PointCloud(
             o3d.utility.Vector3dVector(pointcloud.points)
         )
@@ -35,11 +38,15 @@ class Open3DHandler(BasePointCloudHandler):
         return o3d_pointcloud
 
     def read_point_cloud(self, path: Path) -> Tuple[npt.NDArray, Optional[npt.NDArray]]:
+        import open3d as o3d
+
         super().read_point_cloud(path)
         return self.to_point_cloud(
             o3d.io.read_point_cloud(str(path), remove_nan_points=True)
         )
 
     def write_point_cloud(self, path: Path, pointcloud: "PointCloud") -> None:
+        import open3d as o3d
+
         super().write_point_cloud(path, pointcloud)
         o3d.io.write_point_cloud(str(path), self.to_open3d_point_cloud(pointcloud))
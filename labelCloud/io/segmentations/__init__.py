@@ -1,2 +1,3 @@
-from .base import BaseSegmentationHandler
+from .base import LABEL_ID_RANGE, BaseSegmentationHandler
 from .numpy import NumpySegmentationHandler
+from .run_length import RunLengthSegmentationHandler
@@ -9,6 +9,10 @@ from ...utils.singleton import SingletonABCMeta
 from ..labels.config import LabelConfig
 
 
+# Number of possible int8 label ids, the size of a label histogram
+LABEL_ID_RANGE = 256
+
+
 class BaseSegmentationHandler(object, metaclass=SingletonABCMeta):
     EXTENSIONS: Set[str] = set()  # should be set in subclasses
 
@@ -31,6 +35,11 @@ class BaseSegmentationHandler(object, metaclass=SingletonABCMeta):
             labels = self._create_labels(num_points)
         return labels
 
+    def count_labels(self, label_path: Path) -> npt.NDArray[np.int64]:
+        """Number of points per label id of a label file, indexed by the id as uint8."""
+        labels = self._read_labels(label_path)
+        return np.bincount(labels.view(np.uint8), minlength=LABEL_ID_RANGE)
+
     def overwrite_labels(self, label_path: Path, labels: npt.NDArray[np.int8]) -> None:
         return self._write_labels(label_path, labels)
 
@@ -46,6 +55,10 @@ class BaseSegmentationHandler(object, metaclass=SingletonABCMeta):
     def _write_labels(self, label_path: Path, labels: npt.NDArray[np.int8]) -> None:
         raise NotImplementedError
 
+    @classmethod
+    def get_supported_extensions(cls) -> Set[str]:
+        return set().union(*[handler.EXTENSIONS for handler in cls.__subclasses__()])
+
     @classmethod
     def get_handler(cls, file_extension: str) -> Type["BaseSegmentationHandler"]:
         for subclass in cls.__subclasses__():
@@ -1,12 +1,22 @@
+import logging
 from pathlib import Path
 
 import numpy as np
 import numpy.typing as npt
 
+from ...control.config_manager import config
 from .base import BaseSegmentationHandler
 
 
 class NumpySegmentationHandler(BaseSegmentationHandler):
+    """Raw labels with one byte per point.
+
+    Existing label files are memory-mapped in read/write mode, so opening them does
+    not depend on the size of the point cloud and labels are assigned in place. Saving
+    a mapped file only writes back its modified pages. As the operating system may
+    write back pages at any time, assigned labels can reach the file before saving.
+    """
+
     EXTENSIONS = {".bin"}
 
     def __init__(self, *args, **kwargs) -> None:
@@ -16,11 +26,34 @@ class NumpySegmentationHandler(BaseSegmentationHandler):
         return np.ones(shape=(num_points,), dtype=np.int8) * self.default_label
 
     def _read_labels(self, label_path: Path) -> npt.NDArray[np.int8]:
+        if config.getboolean("FILE", "segmentation_memory_map", fallback=True):
+            try:
+                if label_path.stat().st_size > 0:  # empty files can't be mapped
+                    return np.memmap(label_path, dtype=np.int8, mode="r+")
+            except OSError as e:
+                logging.warning(f"Could not memory-map {label_path}, reading it: {e}")
         labels = np.fromfile(label_path, dtype=np.int8)
         return labels
 
     def _write_labels(self, label_path: Path, labels: npt.NDArray[np.int8]) -> None:
+        if is_mapped_file(labels, label_path):
+            labels.flush()  # type: ignore
+            return
+
         if not label_path.parent.exists():
             label_path.parent.mkdir(parents=True)
 
         labels.tofile(label_path)
+
+
+def is_mapped_file(labels: npt.NDArray[np.int8], label_path: Path) -> bool:
+    """Whether the labels are a writable memory map of the whole label file."""
+    return (
+        isinstance(labels, np.memmap)
+        and labels.mode == "r+"
+        and labels.offset == 0
+        and labels.filename is not None
+        and label_path.exists()
+        and Path(labels.filename).samefile(label_path)
+        and labels.nbytes == label_path.stat().st_size
+    )
@@ -0,0 +1,125 @@
+"""
+Run-length encoded segmentation labels.
+
+Segmentation labels are mostly long runs of the same class (the default class and
+the points of a box are stored next to each other), so the runs are stored instead of
+one byte per point. The file starts with a header that is followed by the run lengths
+and the run values, where the values are bit-packed with as many bits as the largest
+class id of the label config needs:
+
+    magic (4 bytes) | version, value bits, length bytes, 0 (uint8) |
+    number of points, number of runs (little-endian uint64) |
+    run lengths (little-endian uint16 or uint32) | packed run values
+"""
+from pathlib import Path
+from typing import Tuple
+
+import numpy as np
+import numpy.typing as npt
+
+from ..labels.config import LabelConfig
+from .base import LABEL_ID_RANGE, BaseSegmentationHandler
+
+MAGIC = b"LCRL"
+VERSION = 1
+HEADER_SIZE = 4 + 4 + 16
+
+
+class RunLengthSegmentationHandler(BaseSegmentationHandler):
+    EXTENSIONS = {".rle"}
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+
+    def _create_labels(self, num_points: int) -> npt.NDArray[np.int8]:
+        return np.full(
+            shape=(num_points,), fill_value=self.default_label, dtype=np.int8
+        )
+
+    def _read_labels(self, label_path: Path) -> npt.NDArray[np.int8]:
+        num_points, lengths, values = self._read_runs(label_path)
+        # Expands the runs into one new array, no intermediate copies of the points
+        labels = np.repeat(values, lengths.astype(np.intp, copy=False))
+        if labels.shape[0] != num_points:
+            raise ValueError(
+                f"The runs of {label_path} don't add up to {num_points} points."
+            )
+        return labels
+
+    def count_labels(self, label_path: Path) -> npt.NDArray[np.int64]:
+        """Count the labels from the runs without expanding them."""
+        _, lengths, values = self._read_runs(label_path)
+        counts = np.bincount(
+            values.view(np.uint8), weights=lengths, minlength=LABEL_ID_RANGE
+        )
+        return counts.astype(np.int64)
+
+    def _read_runs(
+        self, label_path: Path
+    ) -> Tuple[int, npt.NDArray[np.unsignedinteger], npt.NDArray[np.int8]]:
+        """Read the number of points and the lengths and values of the runs."""
+        data = label_path.read_bytes()
+        if data[:4] != MAGIC:
+            raise ValueError(f"{label_path} is not a run-length encoded label file.")
+        version, value_bits, length_bytes, _ = data[4:8]
+        if version != VERSION:
+            raise ValueError(f"Unsupported version {version} of {label_path}.")
+        num_points, num_runs = np.frombuffer(data, dtype="<u8", count=2, offset=8)
+        num_runs = int(num_runs)
+
+        lengths = np.frombuffer(
+            data, dtype=f"<u{length_bytes}", count=num_runs, offset=HEADER_SIZE
+        )
+        values = unpack_values(
+            np.frombuffer(data, dtype=np.uint8, offset=HEADER_SIZE + lengths.nbytes),
+            num_runs,
+            value_bits,
+        ).view(np.int8)
+        return int(num_points), lengths, values
+
+    def _write_labels(self, label_path: Path, labels: npt.NDArray[np.int8]) -> None:
+        if not label_path.parent.exists():
+            label_path.parent.mkdir(parents=True)
+
+        values = np.asarray(labels, dtype=np.int8).view(np.uint8)
+        run_starts = np.flatnonzero(np.diff(values)) + 1
+        if len(values):
+            run_starts = np.concatenate(([0], run_starts))
+        lengths = np.diff(np.append(run_starts, len(values)))
+        run_values = values[run_starts]
+
+        value_bits = self.get_value_bits(run_values)
+        length_bytes = 2 if lengths.size == 0 or lengths.max() <= 0xFFFF else 4
+        header = MAGIC + bytes((VERSION, value_bits, length_bytes, 0))
+        with label_path.open("wb") as write_file:
+            write_file.write(header)
+            write_file.write(
+                np.array([len(values), len(lengths)], dtype="<u8").tobytes()
+            )
+            write_file.write(lengths.astype(f"<u{length_bytes}").tobytes())
+            write_file.write(pack_values(run_values, value_bits).tobytes())
+
+    @staticmethod
+    def get_value_bits(values: npt.NDArray[np.uint8]) -> int:
+        """Bits per run value, enough for every class of the label config and for
+        labels that are not defined there (e.g. negative ids)."""
+        largest_id = max((c.id for c in LabelConfig().classes), default=0)
+        largest_value = int(values.max()) if values.size else 0
+        return max(largest_id, largest_value, 1).bit_length()
+
+
+def pack_values(
+    values: npt.NDArray[np.uint8], value_bits: int
+) -> npt.NDArray[np.uint8]:
+    """Concatenate the lowest `value_bits` bits of the values into a byte array."""
+    bits = np.unpackbits(values[:, None], axis=1, count=value_bits, bitorder="little")
+    return np.packbits(bits)
+
+
+def unpack_values(
+    packed: npt.NDArray[np.uint8], num_values: int, value_bits: int
+) -> npt.NDArray[np.uint8]:
+    bits = np.unpackbits(packed, count=num_values * value_bits)
+    return np.packbits(
+        bits.reshape(num_values, value_bits), axis=1, bitorder="little"
+    ).reshape(num_values)
@@ -4,7 +4,7 @@ from typing import TYPE_CHECKING, Optional
 import numpy as np
 
 from . import BaseLabelingStrategy
-from ..control.config_manager import config
+from ..control.config_manager import settings
 from ..definitions import Mode, Point3D
 from ..definitions.types import Point3D
 from ..model import BBox
@@ -45,13 +45,13 @@ class PickingStrategy(BaseLabelingStrategy):
         self.bbox_z_rotation += distance // 30
         
     def register_trans_y(self, perspective, forward: bool = False, boost: bool = False):
-        distance = config.getfloat("LABEL", "std_translation")
+        distance = settings.std_translation
         
         if forward:
             distance *= -1
 
         if boost:
-            distance *= config.getfloat("LABEL", "boost_multiplier")
+            distance *= settings.boost_multiplier
 
         cosz, sinz, bu = perspective
 
@@ -65,13 +65,13 @@ class PickingStrategy(BaseLabelingStrategy):
         # self.register_tmp_point(self.tmp_p1)
         
     def register_trans_x(self, perspective, left: bool = False, boost: bool = False):
-        distance = config.getfloat("LABEL", "std_translation")
+        distance = settings.std_translation
         
         if left:
             distance *= -1
 
         if boost:
-            distance *= config.getfloat("LABEL", "boost_multiplier")
+            distance *= settings.boost_multiplier
         
         cosz, sinz, bu = perspective
         
@@ -85,13 +85,13 @@ class PickingStrategy(BaseLabelingStrategy):
         # self.register_tmp_point(self.tmp_p1)
         
     def register_trans_z(self, down: bool = False, boost: bool = False):
-        distance = config.getfloat("LABEL", "std_translation")
+        distance = settings.std_translation
 
         if down:
             distance *= -1
 
         if boost:
-            distance *= config.getfloat("LABEL", "boost_multiplier")
+            distance *= settings.boost_multiplier
             
         tx, ty, tz = self.trans
         
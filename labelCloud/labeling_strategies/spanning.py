@@ -4,7 +4,7 @@ from typing import TYPE_CHECKING, List, Optional, cast
 import numpy as np
 
 from . import BaseLabelingStrategy
-from ..control.config_manager import config
+from ..control.config_manager import settings
 from ..definitions import Mode, Point3D
 from ..model import BBox
 from ..utils import math3d as math3d
@@ -105,7 +105,7 @@ class SpanningStrategy(BaseLabelingStrategy):
         bbox = BBox(*center, length=length, width=width, height=abs(height))  # type: ignore
         bbox.set_z_rotation(math3d.radians_to_degrees(z_angle))
 
-        if not config.getboolean("USER_INTERFACE", "z_rotation_only"):
+        if not settings.z_rotation_only:
             # Also calculate y_angle
             y_angle = np.arctan(len_vec_2d[2] / len_vec_2d[0])
             bbox.set_y_rotation(-math3d.radians_to_degrees(y_angle))
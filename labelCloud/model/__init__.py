@@ -1,4 +1,13 @@
 from .bbox import BBox
 from .perspective import Perspective
-from .point_cloud import PointCloud
-from .element import Element
\ No newline at end of file
+from .element import Element
+
+
+def __getattr__(name: str):
+    # The point cloud pulls in OpenGL and PyQt5, so it is only loaded on first use
+    # to keep the label formats importable in headless tools.
+    if name == "PointCloud":
+        from .point_cloud import PointCloud
+
+        return PointCloud
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
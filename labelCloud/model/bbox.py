@@ -4,24 +4,32 @@ from typing import List, Optional
 import numpy as np
 import numpy.typing as npt
 
-import OpenGL.GL as GL
-
 from ..control.config_manager import config
 from ..definitions import (
-    BBOX_EDGES,
-    BBOX_SIDES,
     Color3f,
     Dimensions3D,
     Point3D,
     Rotations3D,
 )
-from ..io.labels.config import LabelConfig
-from ..utils import math3d, oglhelper
+from ..utils import math3d
 
 
 class BBox(object):
     MIN_DIMENSION: float = config.getfloat("LABEL", "MIN_BOUNDINGBOX_DIMENSION")
     HIGHLIGHTED_COLOR: Color3f = Color3f(0, 1, 0)
+    # Every assignment to one of these attributes counts as a new revision of the box
+    REVISED_ATTRIBUTES = frozenset(
+        (
+            "center",
+            "length",
+            "width",
+            "height",
+            "x_rotation",
+            "y_rotation",
+            "z_rotation",
+            "classname",
+        )
+    )
 
     def __init__(
         self,
@@ -32,6 +40,10 @@ class BBox(object):
         width: Optional[float] = None,
         height: Optional[float] = None,
     ) -> None:
+        # Imported here as the label formats of io.labels import the model themselves
+        from ..io.labels.config import LabelConfig
+
+        self.revision: int = 0  # increased with every change, see `REVISED_ATTRIBUTES`
         self.center: Point3D = (cx, cy, cz)
         self.length: float = length or config.getfloat(
             "LABEL", "STD_BOUNDINGBOX_LENGTH"
@@ -47,6 +59,11 @@ class BBox(object):
         self.verticies: npt.NDArray = np.zeros((8, 3))
         self.set_axis_aligned_verticies()
 
+    def __setattr__(self, name: str, value) -> None:
+        if name in self.REVISED_ATTRIBUTES:
+            self.__dict__["revision"] = self.__dict__.get("revision", 0) + 1
+        super().__setattr__(name, value)
+
     # GETTERS
 
     def get_center(self) -> Point3D:
@@ -157,64 +174,6 @@ class BBox(object):
             ]
         )
 
-    # Draw the BBox using verticies
-    def draw_bbox(self, highlighted: bool = False) -> None:
-        self.set_axis_aligned_verticies()
-
-        GL.glPushMatrix()
-        bbox_color = LabelConfig().get_class_color(self.classname)
-        if highlighted:
-            bbox_color = self.HIGHLIGHTED_COLOR
-
-        vertices = self.get_vertices()
-        drawing_sequence = []
-        for edge in BBOX_EDGES:
-            for vertex_id in edge:
-                drawing_sequence.append(vertices[vertex_id])
-
-        oglhelper.draw_lines(drawing_sequence, color=Color3f.to_rgba(bbox_color))
-        GL.glPopMatrix()
-
-    def draw_orientation(self, crossed_side: bool = True) -> None:
-        # Get object coordinates for arrow
-        arrow_length = self.length * 0.4
-        bp2 = [arrow_length, 0, 0]
-        first_edge = [
-            arrow_length * 0.8,
-            arrow_length * 0.3,
-            0,
-        ]  # TODO: Refactor to OGL helper
-        second_edge = [arrow_length * 0.8, arrow_length * -0.3, 0]
-        third_edge = [arrow_length * 0.8, 0, arrow_length * 0.3]
-
-        GL.glPushMatrix()
-        GL.glLineWidth(5)
-
-        # Apply translation and rotation
-        GL.glTranslate(*self.get_center())
-
-        GL.glRotate(self.get_z_rotation(), 0.0, 0.0, 1.0)
-        GL.glRotate(self.get_y_rotation(), 0.0, 1.0, 0.0)
-        GL.glRotate(self.get_x_rotation(), 1.0, 0.0, 0.0)
-
-        GL.glBegin(GL.GL_LINES)
-        GL.glVertex3fv([0, 0, 0])
-        GL.glVertex3fv(bp2)
-        GL.glVertex3fv(bp2)
-        GL.glVertex3fv(first_edge)
-        GL.glVertex3fv(bp2)
-        GL.glVertex3fv(second_edge)
-        GL.glVertex3fv(bp2)
-        GL.glVertex3fv(third_edge)
-        if crossed_side:
-            GL.glVertex3fv(self.verticies[BBOX_SIDES["right"][0]])
-            GL.glVertex3fv(self.verticies[BBOX_SIDES["right"][2]])
-            GL.glVertex3fv(self.verticies[BBOX_SIDES["right"][1]])
-            GL.glVertex3fv(self.verticies[BBOX_SIDES["right"][3]])
-        GL.glEnd()
-        GL.glLineWidth(1)
-        GL.glPopMatrix()
-
     # MANIPULATORS
 
     # Translate bbox by cx, cy, cz
@@ -1,28 +1,22 @@
-import ctypes
 import logging
 from pathlib import Path
-from typing import List, Optional, Tuple, cast
+from typing import TYPE_CHECKING, Dict, List, Optional, Set, Tuple, cast
 
 import numpy as np
 import numpy.typing as npt
-import OpenGL.GL as GL
-from PyQt5.QtWidgets import QMessageBox
 
 from labelCloud.io.labels.config import LabelConfig
 
-from ..control.config_manager import config
+from ..control.config_manager import config, settings
 from ..definitions import LabelingMode, Point3D, Rotations3D, Translation3D, Color3f
 from ..io.pointclouds import BasePointCloudHandler
-from ..io.segmentations import BaseSegmentationHandler
+from ..io.segmentations import LABEL_ID_RANGE, BaseSegmentationHandler
 from ..utils.color import colorize_points_with_height
 from ..utils.logger import end_section, green, print_column, red, start_section, yellow
-from . import Perspective
+from .perspective import Perspective
 
-from scipy import spatial
-
-
-# Get size of float (4 bytes) for VBOs
-SIZE_OF_FLOAT = ctypes.sizeof(ctypes.c_float)
+if TYPE_CHECKING:
+    from scipy.spatial import KDTree
 
 
 def calculate_init_translation(
@@ -41,9 +35,23 @@ def calculate_init_translation(
     return tuple(-np.add(center, [0, 0, zoom]))  # type: ignore
 
 
-def consecutive(data: npt.NDArray[np.int64], stepsize=1) -> List[npt.NDArray[np.int64]]:
-    """Split an 1-d array of integers to a list of 1-d array where the elements are consecutive"""
-    return np.split(data, np.where(np.diff(data) != stepsize)[0] + 1)
+def get_segmentation_extension() -> str:
+    return config.get("FILE", "segmentation_extension", fallback=".bin")
+
+
+def find_segmentation_label(path: Path) -> Path:
+    """Path of the segmentation labels of a point cloud in the configured format.
+
+    Labels that only exist in another supported format are read from there instead,
+    they are converted to the configured format on the next save.
+    """
+    folder = config.getpath("FILE", "segmentation_folder")
+    label_path = folder / f"{path.stem}{get_segmentation_extension()}"
+    if not label_path.exists():
+        for extension in sorted(BaseSegmentationHandler.get_supported_extensions()):
+            if folder.joinpath(f"{path.stem}{extension}").exists():
+                return folder / f"{path.stem}{extension}"
+    return label_path
 
 
 class PointCloud(object):
@@ -55,23 +63,26 @@ class PointCloud(object):
         segmentation_labels: Optional[npt.NDArray[np.int8]] = None,
         init_translation: Optional[Tuple[float, float, float]] = None,
         init_rotation: Optional[Tuple[float, float, float]] = None,
-        write_buffer: bool = True,
     ) -> None:
         start_section(f"Loading {path.name}")
         self.path = path
         self.points = points
         self.colors = colors if type(colors) == np.ndarray and len(colors) > 0 else None
-    
-        # For point snapping        
-        self.kd_tree = spatial.KDTree(self.points)
+        self._kd_tree: Optional["KDTree"] = None  # for point snapping, built on first use
+
+        # Indices of points whose label colors changed since the renderer uploaded them
+        self.label_updates: List[npt.NDArray[np.int64]] = []
+        # Blended label colors, updated in place and rebuilt if the class colors change
+        self._label_colors: Optional[npt.NDArray[np.float32]] = None
+        self._label_colors_version = -1  # of the LabelConfig tables used for blending
+        self._label_counts: Optional[npt.NDArray[np.int64]] = None  # see label_counts
 
         self.labels = None
         if LabelConfig().type == LabelingMode.SEMANTIC_SEGMENTATION:
             self.labels = segmentation_labels
             self.validate_segmentation_label()
-            self.mix_ratio = config.getfloat("POINTCLOUD", "label_color_mix_ratio")
+            self.mix_ratio = settings.label_color_mix_ratio
 
-        self.vbo = None
         self.center: Point3D = tuple(np.sum(points[:, i]) / len(points) for i in range(3))  # type: ignore
         self.pcd_mins: npt.NDArray[np.float32] = np.amin(points, axis=0)
         self.pcd_maxs: npt.NDArray[np.float32] = np.amax(points, axis=0)
@@ -107,48 +118,68 @@ class PointCloud(object):
                 logging.info(
                     "Generated colors for colorless point cloud based on `colorless_color`."
                 )
-        if write_buffer:
-            self.create_buffers()
-
         logging.info(green(f"Successfully loaded point cloud from {path}!"))
         self.print_details()
         end_section()
 
     @property
     def point_size(self) -> float:
-        return config.getfloat("POINTCLOUD", "point_size")
+        return settings.point_size
 
-    def create_buffers(self) -> None:
-        """Create 3 different buffers holding points, colors and label colors information"""
-        self.colors = cast(npt.NDArray[np.float32], self.colors)
-        (
-            self.position_vbo,
-            self.color_vbo,
-            self.label_vbo,
-        ) = GL.glGenBuffers(3)
-        for data, vbo in [
-            (self.points, self.position_vbo),
-            (self.colors, self.color_vbo),
-            (self.label_colors, self.label_vbo),
-        ]:
-            GL.glBindBuffer(GL.GL_ARRAY_BUFFER, vbo)
-            GL.glBufferData(GL.GL_ARRAY_BUFFER, data.nbytes, data, GL.GL_DYNAMIC_DRAW)
-            GL.glBindBuffer(GL.GL_ARRAY_BUFFER, 0)
+    @property
+    def kd_tree(self) -> "KDTree":
+        if self._kd_tree is None:
+            from scipy.spatial import KDTree
+
+            self._kd_tree = KDTree(self.points)
+        return self._kd_tree
 
     @property
     def label_colors(self) -> npt.NDArray[np.float32]:
-        """blend the points with label color map"""
+        """blend the points with label color map (read-only, kept between accesses)"""
         self.colors = cast(npt.NDArray[np.float32], self.colors)
-        if self.labels is not None:
-            colors = LabelConfig().color_map[LabelConfig().class_order[self.labels]]
-            return colors * self.mix_ratio + self.colors * (1 - self.mix_ratio)
-        else:
+        if self.labels is None:
             return self.colors
+        if (
+            self._label_colors is None
+            or self._label_colors_version != LabelConfig().version
+        ):
+            self.blend_label_colors()
+        label_colors = self._label_colors.view()  # type: ignore
+        label_colors.flags.writeable = False
+        return label_colors
+
+    def blend_label_colors(self, indices: Optional[npt.NDArray[np.int64]] = None) -> None:
+        """Blend the label colors of all points or only of the given indices in place."""
+        label_config = LabelConfig()
+        if indices is None or self._label_colors is None:
+            if self._label_colors is None:
+                self._label_colors = np.empty(self.colors.shape, dtype=np.float32)  # type: ignore
+            blended = self._label_colors
+            # mix * label + (1 - mix) * color, without temporary (N, 3) arrays
+            np.take(label_config.id_color_map, self.labels, axis=0, out=blended)
+            blended -= self.colors
+            blended *= self.mix_ratio
+            blended += self.colors
+            self._label_colors_version = label_config.version
+        else:
+            label_colors = label_config.id_color_map[self.labels[indices]]  # type: ignore
+            self._label_colors[indices] = (
+                label_colors * self.mix_ratio
+                + self.colors[indices] * (1 - self.mix_ratio)  # type: ignore
+            )
+
+    def set_mix_ratio(self, mix_ratio: float) -> None:
+        """Change the share of the label colors, the points are blended again."""
+        self.mix_ratio = mix_ratio
+        if self._label_colors is not None:
+            self._label_colors = None
+            self.label_updates.append(np.arange(len(self.points)))
 
-    def save_segmentation_labels(self, extension=".bin") -> None:
+    def save_segmentation_labels(self, extension: Optional[str] = None) -> Path:
         label_path = (
             config.getpath("FILE", "segmentation_folder")
-            / f"{self.path.stem}{extension}"
+            / f"{self.path.stem}{extension or get_segmentation_extension()}"
         )
         seg_handler: BaseSegmentationHandler = BaseSegmentationHandler.get_handler(
             label_path.suffix
@@ -157,13 +188,13 @@ class PointCloud(object):
         self.validate_segmentation_label()
         seg_handler.overwrite_labels(label_path=label_path, labels=self.labels)
         logging.info(f"Writing segmentation labels to {label_path}")
+        return label_path
 
     @classmethod
     def from_file(
         cls,
         path: Path,
         perspective: Optional[Perspective] = None,
-        write_buffer: bool = True,
     ) -> "PointCloud":
         init_translation, init_rotation = (None, None)
         if perspective:
@@ -178,9 +209,7 @@ class PointCloud(object):
 
         labels = None
         if LabelConfig().type == LabelingMode.SEMANTIC_SEGMENTATION:
-            label_path = (
-                config.getpath("FILE", "segmentation_folder") / f"{path.stem}.bin"
-            )
+            label_path = find_segmentation_label(path)
             logging.info(f"Loading segmentation labels from {label_path}.")
             seg_handler = BaseSegmentationHandler.get_handler(label_path.suffix)()
             labels = seg_handler.read_or_create_labels(
@@ -194,37 +223,62 @@ class PointCloud(object):
             labels,
             init_translation,
             init_rotation,
-            write_buffer,
         )
 
+    @property
+    def label_counts(self) -> npt.NDArray[np.int64]:
+        """Number of points per label id, indexed by the id as uint8 (negative ids at
+        256 + id). Counted once and then kept up to date by `set_labels`."""
+        if self._label_counts is None:
+            self.count_labels()
+        return self._label_counts  # type: ignore
+
+    def count_labels(self) -> None:
+        """Count the labels again, needed after changing `labels` directly."""
+        assert self.labels is not None
+        self._label_counts = np.bincount(
+            self.labels.view(np.uint8), minlength=LABEL_ID_RANGE
+        )
+
+    def get_class_point_counts(self) -> Dict[str, int]:
+        """Number of points of every class of the label config."""
+        counts = self.label_counts
+        return {c.name: int(counts[c.id & 0xFF]) for c in LabelConfig().classes}
+
+    def set_labels(self, points_inside: npt.NDArray, label_id: int) -> None:
+        """Assign a label to the selected points (boolean mask or indices)."""
+        assert self.labels is not None
+        if self._label_counts is not None:
+            previous_labels = self.labels[points_inside].view(np.uint8)
+            self._label_counts -= np.bincount(previous_labels, minlength=LABEL_ID_RANGE)
+            self._label_counts[label_id & 0xFF] += len(previous_labels)
+        self.labels[points_inside] = label_id
+        self.update_label_colors(points_inside)
+
+    def get_undefined_label_ids(self) -> Set[int]:
+        """Segmentation label ids that are missing in the label config."""
+        present = np.zeros(LABEL_ID_RANGE, dtype=np.bool_)
+        present[self.label_counts > 0] = True
+        present[[c.id & 0xFF for c in LabelConfig().classes]] = False
+        return set(np.flatnonzero(present).astype(np.uint8).view(np.int8).tolist())
+
     def validate_segmentation_label(self) -> None:
-        unique_label_ids = set(np.unique(self.labels))  # type: ignore
-        unique_class_ids = set(c.id for c in LabelConfig().classes)
-        if not unique_class_ids.issuperset(unique_label_ids):
-            msg = QMessageBox()
-            msg.setWindowTitle("Invalid segmentation label")
-            msg.setText(
-                f"Segmentation labels {unique_label_ids} of `{self.path}` don't match with the label config {unique_class_ids}."
+        undefined_label_ids = self.get_undefined_label_ids()
+        if undefined_label_ids:
+            logging.warning(
+                f"Segmentation labels {undefined_label_ids} of `{self.path}` are not "
+                "defined in the label config."
             )
-            labels_to_replace = unique_label_ids.difference(unique_class_ids)
-            msg.setInformativeText(
-                f"""
-                Do you want to overwrite 
-                the undefined labels {labels_to_replace} with 
-                default label `{LabelConfig().get_default_class_name()}` of id `{LabelConfig().default}`?
-                """
-            )
-            msg.setIcon(QMessageBox.Critical)
-            msg.setStandardButtons(QMessageBox.Cancel | QMessageBox.Ok)
-
-            msg.accepted.connect(self.replace_missing_labels_with_default)
-            msg.exec_()
 
     def replace_missing_labels_with_default(self):
-        unique_label_ids = set(np.unique(self.labels))
-        unique_class_ids = set(c.id for c in LabelConfig().classes)
-        labels_to_replace = list(unique_label_ids.difference(unique_class_ids))
-        self.labels[np.isin(self.labels, labels_to_replace)] = LabelConfig().default
+        to_replace = np.zeros(LABEL_ID_RANGE, dtype=np.bool_)
+        to_replace[[label_id & 0xFF for label_id in self.get_undefined_label_ids()]] = True
+        default = LabelConfig().default
+        self.labels[to_replace[self.labels.view(np.uint8)]] = default
+        self.label_counts[default & 0xFF] += self.label_counts[to_replace].sum()
+        self.label_counts[to_replace] = 0
+        self._label_colors = None
+        self.label_updates.append(np.arange(len(self.points)))
 
     def to_file(self, path: Optional[Path] = None) -> None:
         if not path:
@@ -239,41 +293,27 @@ class PointCloud(object):
 
     @property
     def color_with_label(self) -> bool:
-        return config.getboolean("POINTCLOUD", "color_with_label")
+        return settings.color_with_label
 
     @property
     def has_label(self) -> bool:
         return self.labels is not None
 
-    def update_selected_points_in_label_vbo(
-        self, points_inside: npt.NDArray[np.bool_]
-    ) -> None:
-        """Send the selected updated label colors to label vbo. This function
-        assumes the `self.label_colors[points_inside]` have been altered.
-        This function only partially updates the label vbo to minimise the
-        data sent to gpu. It leverages `glBufferSubData` method to perform
-        partial update and `consecutive` method to find consecutive indexes
-        so they can be updated in one single `glBufferSubData` call.
+    def update_label_colors(self, points_inside: npt.NDArray) -> None:
+        """Update the label colors of the selected points (boolean mask or indices).
+
+        The renderer only sends these points to the gpu on the next draw.
         """
-        GL.glBindBuffer(GL.GL_ARRAY_BUFFER, self.label_vbo)
-        inside_idx = np.where(points_inside)[0]
+        if points_inside.dtype == np.bool_:
+            inside_idx = np.flatnonzero(points_inside)
+        else:
+            inside_idx = points_inside
         if inside_idx.shape[0] == 0:
             logging.warning("No points are found inside the selected boxes.")
             return
-        logging.debug(f"Update {len(inside_idx)} point colors in label VBO.")
-        # find contiguous points so they can be updated together in one glBufferSubData call
-        arrays = consecutive(inside_idx)
-        label_color = self.label_colors
-        stride = label_color.shape[1] * SIZE_OF_FLOAT
-        for arr in arrays:
-            colors: npt.NDArray[np.float32] = label_color[arr]
-            # partially update label_vbo from positions arr[0] to arr[-1]
-            GL.glBufferSubData(
-                GL.GL_ARRAY_BUFFER,
-                offset=arr[0] * stride,
-                size=colors.nbytes,
-                data=colors,
-            )
+        if self._label_colors is not None:
+            self.blend_label_colors(inside_idx)
+        self.label_updates.append(inside_idx)
 
     # GETTERS AND SETTERS
     def get_no_of_points(self) -> int:
@@ -336,104 +376,6 @@ class PointCloud(object):
     def unset_focus(self):
         self.focus = None
         
-    def draw_orientation_arrow(self):
-        # Get object coordinates for arrow
-        center = np.array([0., 0., 0.])
-        end = np.array([2, 2, 2])
-        yaw = 180
-        pitch = 0
-        roll = 0
-        arrow_length = 3
-        bp2 = [arrow_length, 0, 0]
-        first_edge = [
-            arrow_length * 0.8,
-            arrow_length * 0.3,
-            0,
-        ]  # TODO: Refactor to OGL helper
-        second_edge = [arrow_length * 0.8, arrow_length * -0.3, 0]
-        third_edge = [arrow_length * 0.8, 0, arrow_length * 0.3]
-
-        GL.glPushMatrix()
-        GL.glLineWidth(10)
-        # Apply translation and rotation
-        GL.glTranslate(*center)
-
-        GL.glRotate(yaw, 0.0, 0.0, 1.0)
-        GL.glRotate(pitch, 0.0, 1.0, 0.0)
-        GL.glRotate(roll, 1.0, 0.0, 0.0)
-
-        GL.glBegin(GL.GL_LINES)
-        GL.glVertex3fv([0, 0, 0])
-        GL.glVertex3fv(bp2)
-        GL.glVertex3fv(bp2)
-        GL.glVertex3fv(first_edge)
-        GL.glVertex3fv(bp2)
-        GL.glVertex3fv(second_edge)
-        GL.glVertex3fv(bp2)
-        GL.glVertex3fv(third_edge)
-
-        GL.glEnd()
-        GL.glLineWidth(1)
-        GL.glPopMatrix()
-
-    def set_gl_background(self) -> None:
-        
-        # Translate cloud to set translation
-        GL.glTranslate(
-            self.trans_x, self.trans_y, self.trans_z
-        )
-
-        # Draw a blue dot at the rotation origin
-        GL.glColor3f(0, 255, 255)
-        GL.glPointSize(10)
-        GL.glBegin(GL.GL_POINTS)
-        GL.glVertex3fv((0., 0., 0.))
-        GL.glEnd()
-
-        # Rotate the pointcloud to the desired rotation
-        GL.glRotate(self.rot_x, 1.0, 0.0, 0.0)
-        GL.glRotate(self.rot_y, 0.0, 1.0, 0.0) 
-        GL.glRotate(self.rot_z, 0.0, 0.0, 1.0)
-        
-        # TODO : Can't remember what this was for
-        if self.focus is not None:
-            GL.glTranslate(-self.focus[0], -self.focus[1], -self.focus[2])
-            
-        self.draw_orientation_arrow()
-        
-        # Draw rotation origin        
-        GL.glColor3f(0, 255, 0)
-        GL.glPointSize(10)
-        GL.glBegin(GL.GL_POINTS)
-        GL.glVertex3fv((0., 0., 0.))
-        GL.glEnd()
-        
-        GL.glPointSize(self.point_size)
-
-    def draw_pointcloud(self) -> None:
-        self.set_gl_background()
-        stride = 3 * SIZE_OF_FLOAT
-
-        # Bind position buffer
-        GL.glBindBuffer(GL.GL_ARRAY_BUFFER, self.position_vbo)
-        GL.glEnableClientState(GL.GL_VERTEX_ARRAY)
-        GL.glVertexPointer(3, GL.GL_FLOAT, stride, None)
-
-        # Bind color buffer
-        if self.color_with_label:
-            color_vbo = self.label_vbo
-        else:
-            color_vbo = self.color_vbo
-        GL.glBindBuffer(GL.GL_ARRAY_BUFFER, color_vbo) # Just gotta crack the layer issue
-        GL.glEnableClientState(GL.GL_COLOR_ARRAY)
-        GL.glColorPointer(3, GL.GL_FLOAT, stride, None)
-        GL.glDrawArrays(GL.GL_POINTS, 0, self.get_no_of_points())  # Draw the points
-
-        GL.glDisableClientState(GL.GL_VERTEX_ARRAY)
-        GL.glDisableClientState(GL.GL_COLOR_ARRAY)
-        # Release the buffer binding
-        GL.glBindBuffer(GL.GL_ARRAY_BUFFER, 0)
-
     def reset_perspective(self) -> None:
         self.trans_x, self.trans_y, self.trans_z = self.init_rotation
         self.rot_x, self.rot_y, self.rot_z = self.init_rotation
@@ -454,7 +396,6 @@ class PointCloud(object):
             points=points,
             colors=colors,
             segmentation_labels=labels,
-            write_buffer=False,
         )
 
     def print_details(self) -> None:
@@ -29,6 +29,15 @@ class BaseProjCorrection:
     def register_tmp_point_2d(self, tmp_pt: Point2D) -> None:
         pass
 
+    def register_suggestion(self, new_point: Point2D, new_cam) -> None:
+        pass
+
+    def has_suggestion(self) -> bool:
+        return False
+
+    def accept_suggestion(self) -> None:
+        pass
+
     def register_tmp_point(self, tmp_pt: Point3D) -> None:
         pass
 
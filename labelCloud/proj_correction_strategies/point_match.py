@@ -29,6 +29,10 @@ class PointMatchCorrection(BaseProjCorrection):
         self.point_3d : Optional[Point3D] = None
         self.camera : Optional[Camera] = None
 
+        # Pre-filled 2d point from the correspondence suggestion
+        self.suggested_point_2d : Optional[Point2D] = None
+        self.suggested_camera : Optional[Camera] = None
+
     def hold_3d(self) -> bool:
         return (self.point_3d is not None)
 
@@ -41,6 +45,17 @@ class PointMatchCorrection(BaseProjCorrection):
         self.camera = new_cam
          
         
+    def register_suggestion(self, new_point: Point2D, new_cam: Camera) -> None:
+        self.suggested_point_2d = new_point
+        self.suggested_camera = new_cam
+
+    def has_suggestion(self) -> bool:
+        return self.point_2d is None and self.suggested_point_2d is not None
+
+    def accept_suggestion(self) -> None:
+        if self.has_suggestion():
+            self.register_point_2d(self.suggested_point_2d, self.suggested_camera)
+
     def register_tmp_point(self, new_point: Point3D) -> None:
         self.tmp_p3d = new_point
         
@@ -71,4 +86,6 @@ class PointMatchCorrection(BaseProjCorrection):
         self.camera = None
         self.tmp_p3d = None
         self.tmp_p2d = None
-        self.tmp_cam = None
\ No newline at end of file
+        self.tmp_cam = None
+        self.suggested_point_2d = None
+        self.suggested_camera = None
\ No newline at end of file
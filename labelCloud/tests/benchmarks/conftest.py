@@ -0,0 +1,38 @@
+import logging
+import os
+from pathlib import Path
+from typing import List
+
+import numpy as np
+import pytest
+
+from labelCloud.model import BBox
+
+from .synthetic import BOX_COUNTS, POINT_COUNTS, random_bboxes, random_points
+
+
+def pytest_configure(config):
+    os.chdir("../labelCloud")
+    logging.info(f"Set working directory to {os.getcwd()}.")
+    # The loaders log every call, which would be measured as well
+    logging.getLogger().setLevel(logging.WARNING)
+    # PyOpenGL chooses its platform on the first import, off-screen rendering needs EGL
+    try:
+        import labelCloud.view.offscreen  # noqa: F401
+    except Exception as exc:
+        logging.warning(f"Off-screen rendering is not available: {exc}")
+
+
+@pytest.fixture
+def tmppath(tmpdir):
+    return Path(tmpdir)
+
+
+@pytest.fixture(params=POINT_COUNTS, ids=lambda n: f"{n}pts", scope="session")
+def points(request) -> np.ndarray:
+    return random_points(request.param)
+
+
+@pytest.fixture(params=BOX_COUNTS, ids=lambda n: f"{n}boxes", scope="session")
+def bboxes(request) -> List[BBox]:
+    return random_bboxes(request.param)
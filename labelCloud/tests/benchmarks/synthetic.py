@@ -0,0 +1,59 @@
+"""Synthetic scenes for the benchmarks, seeded to be equal in every run."""
+from typing import List
+
+import numpy as np
+
+from labelCloud.definitions import Point2D, Point3D, PointPairCamera
+from labelCloud.model import BBox
+
+POINT_COUNTS = [10_000, 100_000, 1_000_000]
+BOX_COUNTS = [10, 100, 1_000]
+
+
+def random_points(nb_points: int, seed: int = 0) -> np.ndarray:
+    """Points of a 100 m x 100 m scene with 10 m height."""
+    rng = np.random.default_rng(seed)
+    points = rng.uniform((-50, -50, -2), (50, 50, 8), size=(nb_points, 3))
+    return points.astype(np.float32)
+
+
+def random_bboxes(nb_boxes: int, seed: int = 0) -> List[BBox]:
+    rng = np.random.default_rng(seed)
+    bboxes = []
+    for center, dimensions, z_rotation in zip(
+        rng.uniform((-45, -45, 0), (45, 45, 2), size=(nb_boxes, 3)),
+        rng.uniform(0.5, 5, size=(nb_boxes, 3)),
+        rng.uniform(0, 360, size=nb_boxes),
+    ):
+        bbox = BBox(*center.tolist(), *dimensions.tolist())
+        bbox.set_rotations(0, 0, float(z_rotation))
+        bbox.set_classname("cart")
+        bboxes.append(bbox)
+    return bboxes
+
+
+def random_point_pairs(nb_pairs: int, seed: int = 0) -> List[PointPairCamera]:
+    rng = np.random.default_rng(seed)
+    return [
+        PointPairCamera(Point3D(*p3d), Point2D(*p2d), int(cam))
+        for p3d, p2d, cam in zip(
+            rng.uniform(-50, 50, size=(nb_pairs, 3)).round(4).tolist(),
+            rng.uniform(0, 1000, size=(nb_pairs, 2)).round(2).tolist(),
+            rng.integers(0, 3, size=nb_pairs),
+        )
+    ]
+
+
+def random_segmentation_labels(nb_points: int, seed: int = 0) -> np.ndarray:
+    """Sparse labels: mostly the default class 0 with a few objects, whose points are
+    split into runs like the scan lines of a lidar cross them."""
+    rng = np.random.default_rng(seed)
+    labels = np.zeros(nb_points, dtype=np.int8)
+    nb_runs = max(1, nb_points // 2_000)
+    starts = rng.integers(0, nb_points, size=nb_runs)
+    lengths = rng.integers(10, 500, size=nb_runs)
+    for start, length, class_id in zip(
+        starts, lengths, rng.integers(1, 5, size=nb_runs)
+    ):
+        labels[start : start + length] = class_id
+    return labels
@@ -0,0 +1,33 @@
+# Benchmarking the geometry of bounding boxes
+import numpy as np
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from labelCloud.utils import oglhelper
+
+from .synthetic import random_bboxes
+
+
+def test_is_inside(benchmark, points):
+    bbox = random_bboxes(1)[0]
+    bbox.set_dimensions(20, 20, 5)
+
+    points_inside = benchmark(bbox.is_inside, points)
+    assert points_inside.shape == (len(points),)
+
+
+def test_get_vertices(benchmark, bboxes):
+    vertices = benchmark(lambda: [bbox.get_vertices() for bbox in bboxes])
+    assert len(vertices) == len(bboxes)
+
+
+def test_pick_bbox(benchmark, bboxes, monkeypatch):
+    # Vertical pick ray through the first box (unprojecting the cursor needs a GL context)
+    x, y, z = bboxes[0].get_center()
+    monkeypatch.setattr(
+        oglhelper, "get_pick_ray", lambda *args: ((x, y, z + 100), (x, y, z - 100))
+    )
+
+    picked = benchmark(oglhelper.get_intersected_bboxes, 0, 0, bboxes, None, None)
+    assert picked is not None
@@ -0,0 +1,63 @@
+# Benchmarking the import and export of every label format
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from labelCloud.cli import LABEL_FORMATS, create_label_format
+from labelCloud.io.labels import PointMatchRaw
+
+from .synthetic import BOX_COUNTS, random_bboxes, random_point_pairs
+
+# The formats derive the label file name differently from the point cloud name, these
+# names lead to the same file for export and import
+PCD_PATHS = {
+    "centroid_rel": Path("pointclouds/0000_oust.txt"),
+    "centroid_abs": Path("pointclouds/0000_oust.txt"),
+    "centroid_compact": Path("pointclouds/0000_oust.txt"),
+}
+DEFAULT_PCD_PATH = Path("pointclouds/0000_label3d.txt")
+
+KITTI_CALIBRATION = """P0: 1 0 0 0 0 1 0 0 0 0 1 0
+R0_rect: 1 0 0 0 1 0 0 0 1
+Tr_velo_to_cam: 0 -1 0 0 0 0 -1 0 1 0 0 0
+"""
+
+
+def create_elements(format_name: str, nb_elements: int) -> list:
+    label_format, _ = LABEL_FORMATS[format_name]
+    if issubclass(label_format, PointMatchRaw):
+        return random_point_pairs(nb_elements)
+    return random_bboxes(nb_elements)
+
+
+@pytest.fixture(params=list(LABEL_FORMATS))
+def label_format(request, tmppath):
+    label_format = create_label_format(request.param, tmppath)
+    pcd_path = PCD_PATHS.get(request.param, DEFAULT_PCD_PATH)
+    if request.param == "kitti":
+        label_format.calib_folder = tmppath / "calib"
+        label_format.calib_folder.mkdir()
+        label_format.calib_folder.joinpath(pcd_path.stem + ".txt").write_text(
+            KITTI_CALIBRATION
+        )
+    return request.param, label_format, pcd_path
+
+
+@pytest.mark.parametrize("nb_elements", BOX_COUNTS, ids=lambda n: f"{n}elements")
+def test_export_labels(benchmark, label_format, nb_elements):
+    format_name, label_format, pcd_path = label_format
+    elements = create_elements(format_name, nb_elements)
+
+    benchmark(label_format.export_labels, elements, pcd_path)
+    assert len(label_format.import_labels(pcd_path)) == nb_elements
+
+
+@pytest.mark.parametrize("nb_elements", BOX_COUNTS, ids=lambda n: f"{n}elements")
+def test_import_labels(benchmark, label_format, nb_elements):
+    format_name, label_format, pcd_path = label_format
+    label_format.export_labels(create_elements(format_name, nb_elements), pcd_path)
+
+    elements = benchmark(label_format.import_labels, pcd_path)
+    assert len(elements) == nb_elements
@@ -0,0 +1,104 @@
+# Benchmarking the loading and render preparation of point clouds
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from labelCloud.control.config_manager import config
+from labelCloud.io.labels.config import LabelConfig
+from labelCloud.io.pointclouds import NumpyHandler, Open3DHandler
+from labelCloud.model import PointCloud
+from labelCloud.utils.color import colorize_points_with_height
+
+
+@pytest.fixture
+def pointcloud(points) -> PointCloud:
+    return PointCloud(Path("benchmark.txt"), points)
+
+
+@pytest.mark.parametrize("intensity", [False, True], ids=["xyz", "intensity"])
+def test_read_numpy(benchmark, points, tmppath, monkeypatch, intensity):
+    monkeypatch.setitem(config["POINTCLOUD"], "do_intensity", str(intensity))
+    path = tmppath / "benchmark.txt"
+    intensities = np.random.default_rng(0).uniform(0, 255, size=(len(points), 1))
+    np.savetxt(path, np.hstack([points, intensities]), fmt="%.4f")
+
+    read_points, _ = benchmark(NumpyHandler().read_point_cloud, path)
+    assert len(read_points) == len(points)
+
+
+@pytest.mark.parametrize("extension", [".pcd", ".ply"])
+def test_read_open3d(benchmark, points, tmppath, extension):
+    import open3d as o3d
+
+    path = tmppath / f"benchmark{extension}"
+    o3d_pointcloud = o3d.geometry.PointCloud(o3d.utility.Vector3dVector(points))
+    o3d_pointcloud.colors = o3d.utility.Vector3dVector(np.ones_like(points) * 0.5)
+    o3d.io.write_point_cloud(str(path), o3d_pointcloud)
+
+    read_points, _ = benchmark(Open3DHandler().read_point_cloud, path)
+    assert len(read_points) == len(points)
+
+
+def test_colorize_points_with_height(benchmark, points):
+    colors = benchmark(colorize_points_with_height, points, -2, 8)
+    assert colors.shape == points.shape
+
+
+def test_create_pointcloud(benchmark, points):
+    pointcloud = benchmark(PointCloud, Path("benchmark.txt"), points)
+    assert pointcloud.get_no_of_points() == len(points)
+
+
+def test_label_colors(benchmark, pointcloud):
+    class_ids = [c.id for c in LabelConfig().classes]
+    rng = np.random.default_rng(0)
+    pointcloud.labels = rng.choice(class_ids, size=pointcloud.get_no_of_points())
+    pointcloud.mix_ratio = 0.5
+
+    benchmark(pointcloud.blend_label_colors)  # full blend, e.g. after a color change
+    assert pointcloud.label_colors.shape == pointcloud.points.shape
+
+
+def test_validate_segmentation_label(benchmark, pointcloud):
+    rng = np.random.default_rng(0)
+    pointcloud.labels = rng.integers(
+        -1, 5, size=pointcloud.get_no_of_points(), dtype=np.int8
+    )
+
+    def validate():
+        pointcloud.count_labels()  # the first validation after loading
+        pointcloud.validate_segmentation_label()
+
+    benchmark(validate)
+    assert -1 in pointcloud.get_undefined_label_ids()
+
+
+def test_update_label_colors(benchmark, pointcloud):
+    pointcloud.labels = np.zeros(pointcloud.get_no_of_points(), dtype=np.int8)
+    pointcloud.mix_ratio = 0.5
+    pointcloud.label_colors  # blended once when the point cloud is drawn first
+    box = np.random.default_rng(0).random(pointcloud.get_no_of_points()) < 0.01
+
+    def assign_label():
+        pointcloud.labels[box] = LabelConfig().classes[-1].id
+        pointcloud.update_label_colors(box)
+        pointcloud.label_updates.clear()
+
+    benchmark(assign_label)
+    expected = (
+        LabelConfig().id_color_map[pointcloud.labels] * 0.5 + pointcloud.colors * 0.5
+    )
+    assert np.allclose(pointcloud.label_colors, expected)
+
+
+def test_pick_nearest_point(benchmark, pointcloud):
+    pointcloud.kd_tree  # built once when the first point is picked
+    queries = np.random.default_rng(1).uniform(-50, 50, size=(100, 3))
+
+    def pick_points():
+        return [pointcloud.get_nearest_point(query) for query in queries]
+
+    assert len(benchmark(pick_points)) == len(queries)
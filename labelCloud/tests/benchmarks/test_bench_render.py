@@ -0,0 +1,86 @@
+# Benchmarking the rendering of the viewer scene in an off-screen context
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+offscreen = pytest.importorskip("labelCloud.view.offscreen")
+
+from labelCloud.model import PointCloud
+from labelCloud.view import renderer
+
+from .synthetic import random_bboxes, random_points
+
+GOLDEN_FOLDER = Path(__file__).parent / "golden"
+
+
+@pytest.fixture(scope="module")
+def viewer():
+    try:
+        viewer = offscreen.OffscreenViewer(640, 480)
+    except offscreen.OffscreenContextError as exc:
+        pytest.skip(str(exc))
+    yield viewer
+    viewer.close()
+
+
+def test_draw_frame(benchmark, viewer, points, bboxes):
+    viewer.show(PointCloud(Path("benchmark.txt"), points), bboxes, active_bbox_id=0)
+    viewer.render()  # upload the point cloud
+
+    benchmark(viewer.render)
+    benchmark.extra_info["fps"] = viewer.measure_fps(10)
+
+
+@pytest.mark.parametrize("selection", ["clustered", "scattered"])
+def test_update_label_buffer(benchmark, viewer, points, selection):
+    """Upload the colors of 1% of the points after assigning a label to them."""
+    pointcloud = PointCloud(Path("benchmark.txt"), points)
+    pointcloud.labels = np.zeros(len(points), dtype=np.int8)
+    pointcloud.mix_ratio = 0.5
+    viewer.show(pointcloud)
+    viewer.render()  # upload the point cloud
+
+    rng = np.random.default_rng(0)
+    if selection == "clustered":  # points inside a box are often stored together
+        starts = rng.choice(len(points), size=10, replace=False)
+        selected = np.unique(
+            np.clip(
+                starts[:, None] + np.arange(len(points) // 1000), 0, len(points) - 1
+            )
+        )
+    else:
+        selected = np.sort(
+            rng.choice(len(points), size=len(points) // 100, replace=False)
+        )
+    starts, _ = renderer.plan_uploads(selected)
+    benchmark.extra_info["gl_calls"] = len(starts)
+
+    def upload():
+        pointcloud.update_label_colors(selected)
+        viewer.renderer.update_label_buffer(pointcloud)
+        offscreen.GL.glFinish()
+
+    benchmark(upload)
+    assert not pointcloud.label_updates
+
+
+def test_golden_image(viewer):
+    """Compare a small scene with the stored image (created on the first run)."""
+    pointcloud = PointCloud(Path("golden.txt"), random_points(20_000) / 5)
+    pointcloud.set_rotations(-60, 0, 30)
+    bboxes = random_bboxes(5)
+    for bbox in bboxes:
+        bbox.set_x_translation(bbox.center[0] / 5)
+        bbox.set_y_translation(bbox.center[1] / 5)
+    viewer.show(pointcloud, bboxes, active_bbox_id=0)
+    image = viewer.render()
+
+    golden_path = GOLDEN_FOLDER / "scene.png"
+    if not golden_path.is_file():
+        GOLDEN_FOLDER.mkdir(exist_ok=True)
+        offscreen.save_image(image, golden_path)
+        pytest.skip(f"Created golden image {golden_path}.")
+    # Allow some pixels to differ for other rasterizers than Mesa's llvmpipe
+    assert offscreen.image_difference(image, offscreen.load_image(golden_path)) < 0.02
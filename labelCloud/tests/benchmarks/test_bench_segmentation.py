@@ -0,0 +1,73 @@
+# Benchmarking the reading and writing of segmentation labels
+import os
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from labelCloud.control.config_manager import config
+from labelCloud.io.segmentations import (
+    BaseSegmentationHandler,
+    NumpySegmentationHandler,
+)
+
+from .synthetic import POINT_COUNTS, random_segmentation_labels
+
+EXTENSIONS = [".bin", ".rle"]
+
+
+def drop_from_page_cache(path: Path) -> None:
+    """Make the next read come from the disk instead of memory, if the OS allows it."""
+    if hasattr(os, "posix_fadvise"):
+        fd = os.open(path, os.O_RDONLY)
+        try:
+            os.fsync(fd)
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+        finally:
+            os.close(fd)
+
+
+@pytest.fixture(params=POINT_COUNTS, ids=lambda n: f"{n}pts", scope="session")
+def labels(request):
+    return random_segmentation_labels(request.param)
+
+
+@pytest.mark.parametrize("extension", EXTENSIONS)
+def test_write_labels(benchmark, labels, tmppath, extension):
+    handler = BaseSegmentationHandler.get_handler(extension)()
+    path = tmppath / f"benchmark{extension}"
+
+    benchmark(handler.overwrite_labels, path, labels)
+    benchmark.extra_info["file_size"] = path.stat().st_size
+
+
+@pytest.mark.parametrize("extension", EXTENSIONS)
+def test_read_labels_cold(benchmark, labels, tmppath, extension):
+    handler = BaseSegmentationHandler.get_handler(extension)()
+    path = tmppath / f"benchmark{extension}"
+    handler.overwrite_labels(path, labels)
+
+    read_labels = benchmark.pedantic(
+        handler.read_or_create_labels,
+        args=(path, len(labels)),
+        setup=lambda: drop_from_page_cache(path),
+        rounds=20,
+    )
+    assert (read_labels == labels).all()
+    benchmark.extra_info["file_size"] = path.stat().st_size
+
+
+@pytest.mark.parametrize("memory_map", [False, True], ids=["loaded", "mapped"])
+def test_open_assign_save(benchmark, labels, tmppath, monkeypatch, memory_map):
+    monkeypatch.setitem(config["FILE"], "segmentation_memory_map", str(memory_map))
+    handler = NumpySegmentationHandler()
+    path = tmppath / "benchmark.bin"
+    handler.overwrite_labels(path, labels)
+
+    def assign_box():
+        opened_labels = handler.read_or_create_labels(path, len(labels))
+        opened_labels[1000:2000] = 1  # the points of one box
+        handler.overwrite_labels(path, opened_labels)
+
+    benchmark(assign_box)
@@ -13,3 +13,13 @@ def pytest_configure(config):
 @pytest.fixture
 def tmppath(tmpdir):
     return Path(tmpdir)
+
+
+@pytest.fixture
+def object_detection(monkeypatch):
+    """Label boxes, whatever class definitions the config file points to."""
+    # Imported here, the config is read relative to the working directory set above
+    from labelCloud.definitions import LabelingMode
+    from labelCloud.io.labels.config import LabelConfig
+
+    monkeypatch.setattr(LabelConfig(), "type", LabelingMode.OBJECT_DETECTION)
@@ -1,9 +1,11 @@
 from labelCloud.io.segmentations import (
     BaseSegmentationHandler,
     NumpySegmentationHandler,
+    RunLengthSegmentationHandler,
 )
 
 
 def test_get_subclass() -> None:
     handler = BaseSegmentationHandler.get_handler(".bin")
     assert handler is NumpySegmentationHandler
+    assert BaseSegmentationHandler.get_handler(".rle") is RunLengthSegmentationHandler
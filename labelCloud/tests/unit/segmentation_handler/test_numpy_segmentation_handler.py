@@ -119,3 +119,22 @@ def test_overwrite_labels(handler: NumpySegmentationHandler) -> None:
 
     assert saved_labels.dtype == np.int8
     assert (labels == saved_labels).all()
+
+
+def test_labels_are_edited_in_place(
+    handler: NumpySegmentationHandler, tmp_path: Path
+) -> None:
+    label_path = tmp_path / "foo.bin"
+    np.zeros(420, dtype=np.int8).tofile(label_path)
+
+    labels = handler.read_or_create_labels(label_path=label_path, num_points=420)
+    assert isinstance(labels, np.memmap)
+    labels[10:20] = 3
+    handler.overwrite_labels(label_path=label_path, labels=labels)  # flushes the map
+
+    saved_labels = np.fromfile(label_path, dtype=np.int8)
+    assert (saved_labels[10:20] == 3).all() and saved_labels.sum() == 30
+
+    other_path = tmp_path / "other.bin"  # a mapped file saved under another name
+    handler.overwrite_labels(label_path=other_path, labels=labels)
+    assert (np.fromfile(other_path, dtype=np.int8) == saved_labels).all()
@@ -0,0 +1,49 @@
+from pathlib import Path
+
+import numpy as np
+import pytest
+from labelCloud.io.segmentations import RunLengthSegmentationHandler
+
+
+@pytest.fixture
+def handler() -> RunLengthSegmentationHandler:
+    return RunLengthSegmentationHandler()
+
+
+@pytest.mark.parametrize(
+    "labels",
+    [
+        np.zeros(0, dtype=np.int8),
+        np.array([-1], dtype=np.int8),
+        np.repeat(np.array([0, 2, 4, 1, 0], dtype=np.int8), [70000, 5, 3, 100000, 1]),
+        np.random.default_rng(0).integers(-128, 128, size=420).astype(np.int8),
+    ],
+    ids=["empty", "negative", "long_runs", "random"],
+)
+def test_write_read_labels(
+    handler: RunLengthSegmentationHandler, labels: np.ndarray, tmp_path: Path
+) -> None:
+    label_path = tmp_path / "segmentation" / "foo.rle"
+    handler._write_labels(label_path, labels)
+    read_labels = handler._read_labels(label_path)
+    assert read_labels.dtype == np.int8
+    assert np.array_equal(read_labels, labels)
+
+
+def test_sparse_labels_are_compact(
+    handler: RunLengthSegmentationHandler, tmp_path: Path
+) -> None:
+    labels = np.zeros(100_000, dtype=np.int8)
+    labels[1000:2000] = 3
+    label_path = tmp_path / "foo.rle"
+    handler._write_labels(label_path, labels)
+    assert label_path.stat().st_size < 64
+
+
+def test_read_other_format(
+    handler: RunLengthSegmentationHandler, tmp_path: Path
+) -> None:
+    label_path = tmp_path / "foo.rle"
+    np.zeros(8, dtype=np.int8).tofile(label_path)
+    with pytest.raises(ValueError):
+        handler._read_labels(label_path)
@@ -0,0 +1,56 @@
+import numpy as np
+import pytest
+
+from labelCloud.utils.calibration import (
+    CalibrationError,
+    calibrate_camera,
+    canonicalize_pmatrix,
+    reprojection_errors,
+    solve_dlt,
+)
+from labelCloud.utils.projection import project_points
+
+PMATRIX = np.array(
+    [
+        [800.0, 0.0, 1024.0, 10.0],
+        [0.0, 800.0, 768.0, -5.0],
+        [0.0, 0.0, 1.0, 0.5],
+    ]
+)
+
+
+@pytest.fixture
+def point_pairs():
+    rng = np.random.default_rng(42)
+    points_3d = rng.uniform([-5, -4, 5], [5, 4, 30], size=(40, 3))
+    points_2d, _ = project_points(points_3d, PMATRIX)
+    return points_3d, points_2d
+
+
+def test_solve_dlt_recovers_exact_matrix(point_pairs) -> None:
+    points_3d, points_2d = point_pairs
+
+    pmatrix = solve_dlt(points_3d, points_2d)
+
+    assert np.allclose(pmatrix, canonicalize_pmatrix(PMATRIX, points_3d), atol=1e-6)
+
+
+def test_calibrate_camera_rejects_outliers(point_pairs) -> None:
+    points_3d, points_2d = point_pairs
+    rng = np.random.default_rng(0)
+    noisy_2d = points_2d + rng.normal(0, 0.5, points_2d.shape)
+    noisy_2d[:5] += 150
+
+    result = calibrate_camera(points_3d, noisy_2d, seed=0)
+
+    assert not result.inliers[:5].any()
+    assert result.inliers[5:].all()
+    assert result.rms < 1.0
+    assert reprojection_errors(result.pmatrix, points_3d, points_2d).max() < 2.0
+
+
+def test_calibrate_camera_needs_six_pairs(point_pairs) -> None:
+    points_3d, points_2d = point_pairs
+
+    with pytest.raises(CalibrationError):
+        calibrate_camera(points_3d[:5], points_2d[:5])
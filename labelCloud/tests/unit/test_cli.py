@@ -0,0 +1,83 @@
+# Testing the headless batch commands
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+from labelCloud.cli import BatchTask, check_element, run_batch
+from labelCloud.model.bbox import BBox
+
+CENTROID_LABEL = """name: '{name}'
+labels:
+- id: 1
+  category: {category}
+  box3d:
+    dimension: {{length: {length}, width: 1.0, height: 1.5}}
+    location: {{x: 1.0, y: 2.0, z: 0.5}}
+    orientation: {{x_rotation: 0.0, y_rotation: 0.0, z_rotation: 0.5}}
+"""
+
+
+@pytest.fixture
+def label_project(tmppath):
+    pcd_folder = tmppath.joinpath("pointclouds")
+    label_folder = tmppath.joinpath("labels")
+    pcd_folder.mkdir()
+    label_folder.mkdir()
+    for name, category, length in [("0001", "cart", 2.0), ("0002", "cart", -2.0)]:
+        pcd_folder.joinpath(f"{name}_oust.txt").touch()
+        label_folder.joinpath(f"{name}_label3d.yaml").write_text(
+            CENTROID_LABEL.format(name=name, category=category, length=length)
+        )
+    pcd_folder.joinpath("0003_oust.txt").touch()  # unlabeled
+    return sorted(pcd_folder.glob("*_oust.txt")), label_folder
+
+
+def test_cli_without_gui_modules():
+    code = (
+        "import sys, labelCloud.cli; "
+        "print(sorted({m.split('.')[0] for m in sys.modules} & {'PyQt5', 'OpenGL'}))"
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    ).stdout
+    assert output.strip().endswith("[]")
+
+
+def test_check_element():
+    bbox = BBox(0, 0, 0, 1, 1, 1)
+    bbox.set_classname("cart")
+    assert check_element(bbox, {"cart"}) == []
+
+    bbox.set_classname("bike")
+    bbox.length = -1
+    assert check_element(bbox, {"cart"}) == [
+        "unknown class 'bike'",
+        "invalid dimensions (-1, 1, 1)",
+    ]
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_validate(label_project, jobs):
+    pcd_paths, label_folder = label_project
+    task = BatchTask("validate", "centroid_abs", label_folder, known_classes={"cart"})
+    results, _ = run_batch(task, pcd_paths, jobs, progress=None)
+
+    assert [result.pcd_path for result in results] == pcd_paths
+    assert [result.nb_labels for result in results] == [1, 1, 0]
+    assert results[0].problems == []
+    assert results[1].problems == ["label 0: invalid dimensions (-2.0, 1.0, 1.5)"]
+
+
+def test_convert(label_project, tmppath):
+    pcd_paths, label_folder = label_project
+    output_folder = tmppath.joinpath("converted")
+    task = BatchTask("convert", "centroid_abs", label_folder, "vertices", output_folder)
+    results, _ = run_batch(task, pcd_paths, 2, progress=None)
+
+    assert not any(result.problems for result in results)
+    with output_folder.joinpath("0001_label3d.json").open("r") as read_file:
+        data = json.load(read_file)
+    assert data["filename"] == "0001_oust.txt"
+    assert [label["name"] for label in data["objects"]] == ["cart"]
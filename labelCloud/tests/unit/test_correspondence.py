@@ -0,0 +1,64 @@
+import numpy as np
+
+from labelCloud.utils.correspondence import refine_pixel, select_camera
+
+PMATRIX = np.array(
+    [
+        [100.0, 0.0, 50.0, 0.0],
+        [0.0, 100.0, 40.0, 0.0],
+        [0.0, 0.0, 1.0, 0.0],
+    ]
+)
+
+
+def test_select_camera_prefers_centered_view() -> None:
+    shifted = PMATRIX.copy()
+    shifted[0, 3] = 30.0  # moves the projection 30 pixels to the right
+    behind = -PMATRIX
+
+    cam, pixel = select_camera(
+        np.array([0.0, 0.0, 1.0]), [behind, shifted, PMATRIX], [(100, 80)] * 3
+    )
+
+    assert cam == 2
+    assert tuple(pixel) == (50, 40)
+
+
+def test_select_camera_without_view() -> None:
+    assert select_camera(np.array([5.0, 0.0, 1.0]), [PMATRIX], [(100, 80)]) is None
+
+
+def test_select_camera_with_image_sizes() -> None:
+    point = np.array([0.9, 0.0, 1.0])  # at pixel 140 of the first camera
+
+    assert select_camera(point, [PMATRIX], [(100, 80)]) is None
+    assert select_camera(point, [PMATRIX], [(200, 80)])[0] == 0
+    assert select_camera(point, [PMATRIX, PMATRIX], [None, (200, 80)])[0] == 1
+
+
+def test_refine_pixel_snaps_to_corner() -> None:
+    image = np.zeros((61, 61))
+    image[30:, 35:] = 255.0  # single corner at (35, 30)
+
+    refined = refine_pixel(image, np.array([28.0, 24.0]), search_radius=15)
+
+    assert np.allclose(refined, (35, 30), atol=1.0)
+
+
+def test_refine_pixel_keeps_projection_on_flat_image() -> None:
+    refined = refine_pixel(
+        np.full((41, 41), 128.0), np.array([20.0, 20.0]), search_radius=10
+    )
+
+    assert tuple(refined) == (20, 20)
+
+
+def test_read_image_size(tmp_path) -> None:
+    from PyQt5 import QtGui
+
+    from labelCloud.control.correspondence_suggester import read_image_size
+
+    image_path = str(tmp_path / "camera.png")
+    assert QtGui.QImage(64, 48, QtGui.QImage.Format_RGB32).save(image_path)
+    assert read_image_size(image_path) == (64, 48)
+    assert read_image_size(str(tmp_path / "missing.png")) is None
@@ -0,0 +1,86 @@
+# Testing the undo/redo history of element edits
+from labelCloud.control.base_element_controller import (
+    BaseElementController,
+    marks_dirty_decorator,
+)
+from labelCloud.control.edit_history import Edit, EditHistory
+from labelCloud.model.bbox import BBox
+
+
+class BoxController(BaseElementController):
+    EDITABLE_FIELDS = tuple(sorted(BBox.REVISED_ATTRIBUTES))
+
+    def __init__(self) -> None:
+        super().__init__(BBox)
+
+    def update_all(self) -> None:
+        pass
+
+    def deselect_element(self) -> None:
+        self.active_element_id = -1
+
+    @marks_dirty_decorator
+    def translate_along_x(self, distance: float) -> None:
+        self.get_active_element().translate_bbox(distance, 0, 0)
+
+    @marks_dirty_decorator
+    def set_classname(self, classname: str) -> None:
+        self.get_active_element().set_classname(classname)
+
+
+def test_history_merges_bursts() -> None:
+    history = EditHistory(max_size=2, merge_interval=1.0)
+    history.push(Edit("set", 0, {"length": 1}, {"length": 2}, time=0.0))
+    history.push(Edit("set", 0, {"length": 2}, {"length": 3}, time=0.5))
+    history.push(Edit("set", 0, {"length": 3}, {"length": 4}, time=2.0))  # too late
+    assert [(e.old, e.new) for e in history.undo_stack] == [
+        ({"length": 1}, {"length": 3}),
+        ({"length": 3}, {"length": 4}),
+    ]
+
+    history.push(Edit("set", 1, {"width": 1}, {"width": 2}, time=2.1))
+    assert len(history.undo_stack) == 2  # bounded, the oldest edit is dropped
+    assert history.pop_undo().element_id == 1
+    history.push(Edit("add", 1))
+    assert not history.can_redo()
+
+
+def test_undo_redo_field_changes() -> None:
+    controller = BoxController()
+    controller.add_element(BBox(0, 0, 0))
+    for _ in range(5):
+        controller.translate_along_x(1)
+    controller.set_classname("bicycle")
+    assert len(controller.history.undo_stack) == 3  # add, translations, class
+
+    controller.undo()
+    assert controller.get_active_element().get_classname() != "bicycle"
+    controller.undo()
+    assert controller.get_active_element().get_center() == (0, 0, 0)
+    controller.redo()
+    assert controller.get_active_element().get_center() == (5, 0, 0)
+
+
+def test_undo_redo_element_list() -> None:
+    controller = BoxController()
+    first, second = BBox(0, 0, 0), BBox(1, 1, 1)
+    controller.add_element(first)
+    controller.add_element(second)
+    controller.set_active_element(0)
+    controller.delete_current_element()
+    assert controller.elements == [second]
+
+    controller.undo()
+    assert controller.elements == [first, second]
+    controller.undo()
+    assert controller.elements == [first]
+    controller.redo()
+    controller.redo()
+    assert controller.elements == [second]
+
+    controller.delete_all_elements()
+    controller.undo()
+    assert controller.elements == [second]
+
+    controller.set_elements([])  # another point cloud
+    assert not controller.history.can_undo()
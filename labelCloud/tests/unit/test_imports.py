@@ -0,0 +1,31 @@
+# Testing that the data model and I/O can be used without the GUI and rendering stack
+import subprocess
+import sys
+
+GUI_MODULES = {"PyQt5", "OpenGL", "open3d", "scipy"}
+
+
+def run_python(code: str) -> str:
+    return subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    ).stdout.strip()
+
+
+def test_io_and_model_without_gui_modules():
+    code = (
+        "import sys; import labelCloud.io.labels, labelCloud.io.pointclouds, "
+        "labelCloud.io.segmentations, labelCloud.model.point_cloud; "
+        f"print(sorted({{m.split('.')[0] for m in sys.modules}} & {GUI_MODULES!r}))"
+    )
+    assert run_python(code).splitlines()[-1] == "[]"
+
+
+def test_io_import_time():
+    code = (
+        "import time; start = time.perf_counter(); "
+        "import labelCloud.io.labels, labelCloud.io.pointclouds; "
+        "print(time.perf_counter() - start)"
+    )
+    # Best of three to be robust against a busy machine
+    durations = [float(run_python(code).splitlines()[-1]) for _ in range(3)]
+    assert min(durations) < 0.2
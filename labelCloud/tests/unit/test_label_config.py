@@ -0,0 +1,38 @@
+# Testing the lookup tables of the class definitions
+import numpy as np
+import pytest
+
+from labelCloud.definitions import Color3f
+from labelCloud.io.labels.config import ClassConfig, LabelConfig
+
+
+@pytest.fixture
+def label_config():
+    label_config = LabelConfig()
+    classes, callbacks = label_config.classes, list(label_config.update_callbacks)
+    yield label_config
+    label_config.update_callbacks = callbacks
+    label_config.classes = classes
+
+
+def test_lookup_tables(label_config) -> None:
+    updates = []
+    label_config.register_update_callback(lambda: updates.append(label_config.version))
+    version = label_config.version
+
+    label_config.classes = [
+        ClassConfig("car", 3, color=Color3f(1, 0, 0), dimension=(1, 1, 1)),
+        ClassConfig("bike", 1, color=Color3f(0, 0, 1), dimension=(1, 1, 1)),
+    ]
+    assert updates == [version + 1]
+
+    assert label_config.get_class("car").id == 3
+    assert label_config.class_order.tolist() == [-1, 1, -1, 0]
+    assert np.array_equal(
+        label_config.id_color_map[[3, 1]], label_config.color_map[[0, 1]]
+    )
+    assert not label_config.color_map.flags.writeable
+
+    assert label_config.get_relative_class("bike", 1) == "bike"  # no class with id 2
+    assert label_config.get_relative_class("bike", -1) == "car"
+    assert label_config.get_class_color("car") == (1, 0, 0)
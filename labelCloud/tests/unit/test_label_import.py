@@ -88,3 +88,86 @@ def test_kitti(label_kitti, tmppath):
     assert bbox.get_rotations() == pytest.approx(
         (0, 0, 25)
     )  # apply for rounding errors
+
+
+def test_kitti_meta_of_new_boxes(tmppath, object_detection):
+    from labelCloud.io.labels.kitti import TEMPLATE_META
+    from labelCloud.model.bbox import BBox
+
+    tmppath.joinpath("test.txt").write_text(
+        "cart 0.5 1 0.2 1 2 3 4 0.75 0.55 0.15 -0.409794 -0.012696 0.076757 0.436332"
+    )
+    label_manager = LabelManager(
+        strategy="kitti_untransformed", path_to_label_folder=tmppath
+    )
+    label_format = label_manager.label_strategy
+    imported = label_manager.import_labels(Path("test.txt"))
+    copies = label_format.copy_elements(imported)
+    assert label_format.bboxes_meta[copies[0]]["truncated"] == "0.5"
+
+    for _ in range(50):  # background saves, whose copies are dropped afterwards
+        label_format.copy_elements(imported)
+    new_bboxes = [BBox(0, 0, 0) for _ in range(200)]
+    assert all(bbox not in label_format.bboxes_meta for bbox in new_bboxes)
+
+    label_manager.export_labels(Path("test.txt"), new_bboxes[:1])
+    fields = tmppath.joinpath("test_label3d.txt").read_text().split()
+    assert fields[1:8] == " ".join(list(TEMPLATE_META.values())[1:5]).split()
+
+
+@pytest.mark.parametrize("label_format", ["centroid_abs", "centroid_compact"])
+def test_centroid_yaml_round_trip(tmppath, object_detection, label_format):
+    from labelCloud.io.labels import read_centroid_folder
+    from labelCloud.model.bbox import BBox
+
+    bboxes = [BBox(1, 2, 3, 4, 5, 6), BBox(-1, -2, -3, 0.5, 0.5, 0.5)]
+    bboxes[0].set_rotations(0, 0, 90)
+    bboxes[1].set_classname("cart")
+    label_manager = LabelManager(strategy=label_format, path_to_label_folder=tmppath)
+    for frame in ["0000_oust.txt", "0001_oust.txt"]:
+        label_manager.export_labels(Path(frame), bboxes)
+
+    imported = label_manager.import_labels(Path("0001_oust.txt"))
+    assert [bbox.get_center() for bbox in imported] == [(1, 2, 3), (-1, -2, -3)]
+    assert imported[0].get_z_rotation() == pytest.approx(90)
+    assert imported[1].get_classname() == "cart"
+
+    arrays = read_centroid_folder(tmppath, processes=2)
+    assert len(arrays) == 4
+    assert arrays.frames.tolist() == ["0000_label3d"] * 2 + ["0001_label3d"] * 2
+    assert arrays.categories[1] == "cart"
+    assert arrays.dimensions[2].tolist() == [4, 5, 6]
+    assert arrays.z_rotations[2] == pytest.approx(90)
+
+
+def test_kitti_transformed_round_trip(tmppath, object_detection):
+    from labelCloud.io.labels.kitti import _load_transforms
+    from labelCloud.model.bbox import BBox
+
+    # Export and import derive the same label file name from this point cloud name
+    pcd_path = Path("0000_label3d.bin")
+    label_manager = LabelManager(strategy="kitti", path_to_label_folder=tmppath)
+    label_format = label_manager.label_strategy
+    label_format.calib_folder = tmppath / "calib"
+    label_format.calib_folder.mkdir()
+    calib_path = label_format.calib_folder / "0000_label3d.txt"
+    calib_path.write_text(
+        "R0_rect: 1 0 0 0 1 0 0 0 1\nTr_velo_to_cam: 0 -1 0 0 0 0 -1 0 1 0 0 0\n"
+    )
+
+    bboxes = [BBox(1, 2, 3, 4, 5, 6), BBox(-1, 0, 1, 1, 2, 3)]
+    bboxes[1].set_rotations(0, 0, 45)
+    label_manager.export_labels(pcd_path, bboxes)
+    imported = label_manager.import_labels(pcd_path)
+
+    assert [bbox.get_center() for bbox in imported] == [(1, 2, 3), (-1, 0, 1)]
+    assert [bbox.get_dimensions() for bbox in imported] == [(4, 5, 6), (1, 2, 3)]
+    assert imported[1].get_z_rotation() == pytest.approx(45)
+    assert _load_transforms.cache_info().currsize >= 1
+
+    # An edited calibration file is parsed again
+    calib_path.write_text(
+        "R0_rect: 1 0 0 0 1 0 0 0 1\nTr_velo_to_cam: 0 -1 0 0 0 0 -1 1 1 0 0 0\n"
+    )
+    os.utime(calib_path, ns=(0, calib_path.stat().st_mtime_ns + 1_000_000_000))
+    assert label_manager.import_labels(pcd_path)[0].get_center() == (1, 2, 4)
@@ -0,0 +1,100 @@
+# Testing the journal of unsaved label changes and its replay
+import copy
+
+import numpy as np
+import pytest
+
+from labelCloud.control.label_journal import (
+    LabelJournal,
+    decode_indices,
+    element_from_dict,
+    element_to_dict,
+    encode_indices,
+    replay_elements,
+    replay_segmentation_labels,
+)
+from labelCloud.definitions.types import Point2D, Point3D, PointPairCamera
+from labelCloud.model.bbox import BBox
+
+
+@pytest.fixture
+def bbox() -> BBox:
+    bbox = BBox(1, 2, 3, 4, 5, 6)
+    bbox.set_rotations(0, 0, 90)
+    bbox.set_classname("cart")
+    return bbox
+
+
+def test_element_round_trip(bbox) -> None:
+    restored = element_from_dict(element_to_dict(bbox))
+    assert restored.get_center() == (1, 2, 3)
+    assert restored.get_dimensions() == (4, 5, 6)
+    assert restored.get_z_rotation() == 90
+    assert restored.get_classname() == "cart"
+
+    pair = PointPairCamera(Point3D(0.5, 1.0, 2.0), Point2D(10, 20), 2)
+    assert str(element_from_dict(element_to_dict(pair))) == str(pair)
+    assert str(copy.deepcopy(pair)) == str(pair)  # snapshots for the label writer
+
+
+def test_journal_survives_restart(tmppath, bbox) -> None:
+    path = tmppath.joinpath(LabelJournal.FILE_NAME)
+    journal = LabelJournal(path)
+    assert not path.exists()  # created with the first change
+
+    journal.append("a.ply", "add", element=element_to_dict(bbox))
+    journal.append("b.ply", "clear")
+    journal.sync()
+    with path.open("a") as write_file:
+        write_file.write('{"seq": 3, "frame"')  # torn by a crash
+
+    restarted = LabelJournal(path)
+    assert restarted.get_frames() == ["a.ply", "b.ply"]
+    assert [r["op"] for r in restarted.get_records("a.ply")] == ["add"]
+    assert restarted.checkpoint() == 2
+
+
+def test_compact_keeps_later_changes(tmppath) -> None:
+    path = tmppath.joinpath(LabelJournal.FILE_NAME)
+    journal = LabelJournal(path)
+    journal.append("a.ply", "clear")
+    checkpoint = journal.checkpoint()
+    journal.append("a.ply", "delete", index=0)
+    journal.append("b.ply", "clear")
+
+    journal.compact("a.ply", checkpoint)
+    assert [r["seq"] for r in LabelJournal(path).records] == [2, 3]
+
+    journal.compact("a.ply", journal.checkpoint())
+    journal.compact("b.ply", journal.checkpoint())
+    assert not path.exists()
+    journal.close()
+
+
+def test_replay_elements(bbox) -> None:
+    saved = [BBox(0, 0, 0), BBox(1, 1, 1)]
+    records = [
+        {"op": "delete", "index": 0},
+        {"op": "add", "element": element_to_dict(bbox)},
+        {"op": "set", "index": 0, "element": element_to_dict(bbox)},
+    ]
+    elements = replay_elements(saved, records)
+
+    assert len(saved) == 2  # the loaded elements are not changed
+    assert [e.get_classname() for e in elements] == ["cart", "cart"]
+    assert replay_elements(saved, [{"op": "clear"}]) == []
+
+    insert = {"op": "insert", "index": 0, "element": element_to_dict(bbox)}
+    assert replay_elements(saved, [insert])[0].get_classname() == "cart"
+
+
+def test_replay_segmentation_labels() -> None:
+    labels = np.zeros(10, dtype=np.int8)
+    indices = np.array([1, 5, 7])
+    assert np.array_equal(decode_indices(encode_indices(indices)), indices)
+
+    changed = replay_segmentation_labels(
+        labels, [{"op": "labels", "indices": encode_indices(indices), "label": 3}]
+    )
+    assert np.array_equal(changed, indices)
+    assert np.array_equal(np.flatnonzero(labels == 3), indices)
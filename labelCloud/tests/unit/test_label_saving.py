@@ -0,0 +1,102 @@
+# Testing the change tracking of elements and the atomic background export of labels
+import json
+import threading
+from pathlib import Path
+
+import pytest
+
+from labelCloud.control.base_element_controller import BaseElementController
+from labelCloud.control.label_manager import LabelManager, LabelWriter
+from labelCloud.io.labels import write_file_atomic
+from labelCloud.model.bbox import BBox
+
+
+class BoxController(BaseElementController):
+    def __init__(self) -> None:
+        super().__init__(BBox)
+
+    def update_all(self) -> None:
+        pass
+
+
+class SlowFormat(object):
+    """Records exports and blocks them until released."""
+
+    def __init__(self) -> None:
+        self.release = threading.Event()
+        self.exports = []
+
+    def export_labels(self, elements, pcd_path: Path) -> None:
+        self.release.wait()
+        self.exports.append((pcd_path, elements))
+
+
+def test_dirty_tracking() -> None:
+    controller = BoxController()
+    assert not controller.dirty
+
+    controller.add_element(BBox(0, 0, 0))
+    controller.add_element(BBox(1, 0, 0))
+    assert controller.dirty
+
+    controller.mark_clean()
+    controller.update_element(0, BBox(1, 1, 1))
+    assert controller.dirty
+
+    controller.mark_clean()
+    controller.delete_current_element()
+    assert controller.dirty
+
+
+def test_bbox_revision() -> None:
+    bbox = BBox(0, 0, 0)
+    revision = bbox.revision
+
+    bbox.get_vertices()
+    assert bbox.revision == revision
+
+    bbox.translate_bbox(1, 0, 0)
+    bbox.change_side("front", 0.5)
+    assert bbox.revision > revision + 1
+
+    revision = bbox.revision
+    bbox.z_rotation = 45  # direct assignments are tracked as well
+    assert bbox.revision == revision + 1
+
+
+def test_write_file_atomic(tmppath) -> None:
+    path = tmppath.joinpath("label.json")
+    path.write_text("old")
+    write_file_atomic(path, "new")
+
+    assert path.read_text() == "new"
+    assert [p.name for p in tmppath.iterdir()] == ["label.json"]
+
+
+def test_writer_keeps_newest_snapshot() -> None:
+    label_format = SlowFormat()
+    writer = LabelWriter(label_format)
+    writer.submit(Path("a.ply"), ["first"])
+    writer.submit(Path("b.ply"), ["b"])
+    writer.submit(Path("a.ply"), ["second"])
+    assert writer.is_pending(Path("a.ply"))
+
+    label_format.release.set()
+    writer.close()
+
+    assert label_format.exports == [(Path("a.ply"), ["second"]), (Path("b.ply"), ["b"])]
+
+
+def test_import_waits_for_background_export(tmppath, object_detection) -> None:
+    label_manager = LabelManager(strategy="centroid_abs", path_to_label_folder=tmppath)
+    pcd_path = Path("testfolder/frame_0001.ply")
+    bbox = BBox(1, 2, 3, 1, 1, 1)
+    bbox.set_classname("cart")
+
+    label_manager.export_labels_in_background(pcd_path, [bbox])
+    bbox.set_classname("changed")  # the queued snapshot is not affected
+    label_manager.flush()
+
+    (imported,) = label_manager.import_labels(pcd_path)
+    assert imported.get_classname() == "cart"
+    label_manager.close()
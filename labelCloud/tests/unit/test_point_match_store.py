@@ -0,0 +1,76 @@
+from pathlib import Path
+
+import numpy as np
+
+from labelCloud.definitions.types import PointPairCamera
+from labelCloud.io.labels import PointMatchRaw, PointMatchStore, PointPairStore
+
+
+def make_pairs(offset: float) -> list:
+    return [
+        PointPairCamera((offset, 1.5, 2.0), (100.0 + offset, 200.0), 0),
+        PointPairCamera((offset, -1.0, 0.5), (300.0, 400.0 + offset), 2),
+    ]
+
+
+def test_store_keeps_latest_revision_per_frame(tmp_path: Path) -> None:
+    store = PointPairStore(tmp_path.joinpath("pairs.sqlite"))
+    store.save_frame("0000", make_pairs(0.0))
+    store.save_frame("0001", make_pairs(1.0))
+    store.save_frame("0000", make_pairs(5.0)[:1])
+
+    assert store.get_frames() == ["0000", "0001"]
+    assert [str(p) for p in store.load_frame("0000")] == [str(make_pairs(5.0)[0])]
+
+    arrays = store.load_arrays()
+    assert len(arrays) == 3
+    assert list(arrays.frames) == ["0001", "0001", "0000"]
+    assert np.allclose(arrays.points_3d[:, 0], [1, 1, 5])
+    assert len(store.load_arrays(cam=2)) == 1
+
+    store.compact()
+    assert len(store.load_arrays()) == 3
+
+
+def count_stored_rows(store: PointPairStore) -> int:
+    return store.connection.execute("SELECT COUNT(*) FROM pairs").fetchone()[0]
+
+
+def test_store_compacts_superseded_revisions(tmp_path: Path) -> None:
+    store = PointPairStore(tmp_path.joinpath("pairs.sqlite"))
+    store.COMPACT_MIN_ROWS = 4
+    store.save_frame("0001", make_pairs(1.0))
+    for offset in range(4):  # superseded: 0, 2, 4 and then 6 > max(4, current rows)
+        store.save_frame("0000", make_pairs(offset))
+    assert store.superseded_rows == 0
+    assert count_stored_rows(store) == 4
+
+    store.save_frame("0000", make_pairs(5.0))
+    store.close()  # compacts the remaining superseded revision
+
+    store = PointPairStore(tmp_path.joinpath("pairs.sqlite"))
+    assert count_stored_rows(store) == 4
+    assert (store.current_rows, store.superseded_rows) == (4, 0)
+    assert np.allclose(store.load_arrays("0000").points_3d[:, 0], 5)
+
+
+def test_store_text_round_trip(tmp_path: Path) -> None:
+    raw = PointMatchRaw(tmp_path, 8)
+    raw.export_labels(make_pairs(0.0), Path("0000_oust.txt"))
+    raw.export_labels(make_pairs(1.0), Path("0001_oust.txt"))
+
+    # existing text files are imported when the store is created
+    store_format = PointMatchStore(tmp_path, 8)
+    assert [str(p) for p in store_format.import_labels(Path("0001_oust.txt"))] == [
+        str(p) for p in make_pairs(1.0)
+    ]
+
+    store_format.export_labels(make_pairs(7.0), Path("0002_oust.txt"))
+    assert len(store_format.import_all_labels()) == 6
+
+    export_folder = tmp_path.joinpath("export")
+    assert store_format.store.export_text_folder(export_folder) == 3
+    assert [
+        str(p)
+        for p in PointMatchRaw(export_folder, 8).import_labels(Path("0002_oust.txt"))
+    ] == [str(p) for p in make_pairs(7.0)]
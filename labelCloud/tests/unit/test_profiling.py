@@ -0,0 +1,64 @@
+import json
+import logging
+import time
+
+from labelCloud.utils.profiling import FrameProfiler, StartupProfile
+
+
+def test_disabled_profile_records_nothing() -> None:
+    profile = StartupProfile()
+    profile.mark("import modules")
+    with profile.phase("load"):
+        pass
+    assert profile.phases == []
+
+
+def test_phases_add_up_to_total(caplog) -> None:
+    profile = StartupProfile()
+    profile.enable(time.perf_counter())
+    time.sleep(0.01)
+    profile.mark("first")
+    time.sleep(0.01)
+    with profile.phase("second"):
+        time.sleep(0.01)
+
+    assert [name for name, _ in profile.phases] == ["first", "other", "second"]
+    assert all(
+        duration >= 0.009 for name, duration in profile.phases if name != "other"
+    )
+    assert (
+        sum(duration for _, duration in profile.phases)
+        <= time.perf_counter() - profile.start
+    )
+
+    with caplog.at_level(logging.INFO):
+        profile.report()
+        profile.report()  # only reported once
+    assert caplog.text.count("Startup Profile") == 1
+
+
+def test_disabled_frame_profiler_records_nothing() -> None:
+    profiler = FrameProfiler()
+    timed_sum = profiler.timed("sum")(sum)
+    with profiler.timer("draw"):
+        assert timed_sum([1, 2]) == 3
+    assert profiler.samples == {} and len(profiler.trace_events) == 0
+
+
+def test_frame_profiler_statistics_and_trace(tmppath) -> None:
+    profiler = FrameProfiler()
+    profiler.enable()
+    for duration in range(1, 101):  # 1 to 100 ms
+        profiler.add("draw", 1.0, 1.0 + duration / 1000)
+    with profiler.timer("overlay"):
+        pass
+
+    (name, p50, p95, maximum), _ = profiler.statistics()
+    assert name == "draw"
+    assert (round(p50, 2), round(p95, 2), round(maximum, 2)) == (50.5, 95.05, 100.0)
+    assert profiler.overlay_lines()[1].startswith("draw")
+
+    profiler.dump_trace(tmppath / "trace.json")
+    events = json.loads((tmppath / "trace.json").read_text())["traceEvents"]
+    assert len(events) == 101
+    assert events[-1]["name"] == "overlay" and events[-1]["ph"] == "X"
@@ -0,0 +1,57 @@
+import numpy as np
+
+from labelCloud.utils.projection import (
+    project_points,
+    rasterize_points,
+    render_projection_overlay,
+)
+
+PMATRIX = np.array(
+    [
+        [100.0, 0.0, 50.0, 0.0],
+        [0.0, 100.0, 40.0, 0.0],
+        [0.0, 0.0, 1.0, 0.0],
+    ]
+)
+
+
+def test_project_points() -> None:
+    points = np.array([[0.0, 0.0, 1.0], [1.0, 0.5, 2.0], [0.0, 0.0, -1.0]])
+    pixels, depths = project_points(points, PMATRIX)
+
+    assert tuple(pixels[0]) == (50, 40)
+    assert tuple(pixels[1]) == (100, 65)
+    assert list(depths) == [1, 2, -1]
+
+
+def test_rasterize_points_keeps_closest_point() -> None:
+    pixels = np.array([[5, 5], [5, 5], [7, 2]], dtype=np.float64)
+    depths = np.array([3.0, 1.0, 2.0])
+    colors = np.array([[1.0, 0.0, 0.0], [0.0, 1.0, 0.0], [0.0, 0.0, 1.0]])
+
+    layer = rasterize_points(pixels, depths, colors, width=10, height=8, point_radius=0)
+
+    assert layer.shape == (8, 10, 4)
+    assert tuple(layer[5, 5]) == (0, 255, 0, 255)
+    assert tuple(layer[2, 7]) == (0, 0, 255, 255)
+    assert layer[..., 3].sum() == 2 * 255
+
+
+def test_rasterize_points_ignores_points_outside_and_behind() -> None:
+    pixels = np.array([[-5, 5], [5, 20], [3, 3]], dtype=np.float64)
+    depths = np.array([1.0, 1.0, -1.0])
+    colors = np.ones((3, 3))
+
+    layer = rasterize_points(pixels, depths, colors, width=10, height=8, point_radius=1)
+
+    assert not layer.any()
+
+
+def test_render_projection_overlay_with_depth_colors() -> None:
+    points = np.random.uniform(low=[-0.4, -0.3, 1], high=[0.4, 0.3, 5], size=(1000, 3))
+
+    layer = render_projection_overlay(points, PMATRIX, width=100, height=80)
+
+    assert layer.dtype == np.uint8
+    assert layer.shape == (80, 100, 4)
+    assert layer[..., 3].any()
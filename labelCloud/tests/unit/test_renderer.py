@@ -0,0 +1,20 @@
+# Testing the planning of partial label buffer uploads
+import numpy as np
+
+from labelCloud.view.renderer import plan_uploads
+
+
+def test_plan_uploads() -> None:
+    indices = np.array([0, 1, 2, 5, 6, 20, 40])
+    starts, stops = plan_uploads(indices, max_gap=2)
+    assert starts.tolist() == [0, 20, 40]
+    assert stops.tolist() == [7, 21, 41]
+
+    starts, stops = plan_uploads(indices, max_gap=0)  # only consecutive indices
+    assert list(zip(starts.tolist(), stops.tolist())) == [
+        (0, 3),
+        (5, 7),
+        (20, 21),
+        (40, 41),
+    ]
+    assert len(plan_uploads(np.array([], dtype=np.int64))[0]) == 0
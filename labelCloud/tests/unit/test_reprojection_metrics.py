@@ -0,0 +1,58 @@
+import numpy as np
+import pytest
+
+from labelCloud.control.base_element_controller import BaseElementController
+from labelCloud.control.reprojection_metrics import ReprojectionMetrics
+from labelCloud.definitions.types import PointPairCamera
+
+PMATRIX = np.array(
+    [
+        [100.0, 0.0, 50.0, 0.0],
+        [0.0, 100.0, 40.0, 0.0],
+        [0.0, 0.0, 1.0, 0.0],
+    ]
+)
+
+
+class PairController(BaseElementController):
+    def __init__(self) -> None:
+        super().__init__(PointPairCamera)
+
+    def update_all(self) -> None:
+        pass
+
+
+@pytest.fixture
+def controller() -> PairController:
+    controller = PairController()
+    controller.metrics = ReprojectionMetrics(controller, np.stack([PMATRIX, PMATRIX]))
+    return controller
+
+
+def test_residuals_follow_added_and_edited_pairs(controller) -> None:
+    controller.add_element(PointPairCamera((0, 0, 1), (53, 44), 0))
+    controller.add_element(PointPairCamera((1, 0.5, 2), (100, 65), 1))
+
+    assert tuple(controller.metrics.get_residual(0)) == (-3, -4)
+    assert controller.metrics.get_error(0) == 5
+    assert controller.metrics.get_error(1) == 0
+
+    controller.update_element(0, PointPairCamera((0, 0, 1), (50, 40), 0))
+    assert controller.metrics.get_error(0) == 0
+
+
+def test_camera_statistics(controller) -> None:
+    for p2d in [(53, 44), (50, 46), (50, 40)]:
+        controller.add_element(PointPairCamera((0, 0, 1), p2d, 0))
+    controller.add_element(PointPairCamera((0, 0, 1), (0, 0), 1))
+
+    stats = controller.metrics.get_camera_statistics(0)
+
+    assert stats.count == 3
+    assert stats.median == 5
+    assert stats.max == 6
+    assert stats.rms == pytest.approx(np.sqrt((25 + 36) / 3))
+
+    controller.delete_element(1)
+    assert controller.metrics.get_camera_statistics(0).max == 5
+    assert controller.metrics.get_camera_statistics(2) is None
@@ -0,0 +1,51 @@
+# Testing the label histogram of segmented point clouds
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from labelCloud.definitions import Color3f
+from labelCloud.io.labels.config import ClassConfig, LabelConfig
+from labelCloud.model import PointCloud
+
+
+@pytest.fixture
+def label_config():
+    label_config = LabelConfig()
+    classes, default = label_config.classes, label_config.default
+    label_config.classes = [
+        ClassConfig("ground", 0, color=Color3f(0, 1, 0), dimension=(1, 1, 1)),
+        ClassConfig("car", 3, color=Color3f(1, 0, 0), dimension=(1, 1, 1)),
+    ]
+    label_config.default = 0
+    yield label_config
+    label_config.default = default
+    label_config.classes = classes
+
+
+@pytest.fixture
+def pointcloud(label_config) -> PointCloud:
+    points = np.random.default_rng(0).uniform(size=(100, 3)).astype(np.float32)
+    pointcloud = PointCloud(Path("foo.bin"), points)
+    pointcloud.labels = np.zeros(100, dtype=np.int8)
+    pointcloud.labels[:10] = -5  # not defined in the label config
+    return pointcloud
+
+
+def test_label_counts_follow_assignments(pointcloud) -> None:
+    assert pointcloud.get_undefined_label_ids() == {-5}
+
+    pointcloud.set_labels(np.arange(5, 20), 3)
+    pointcloud.set_labels(np.arange(100) >= 95, 3)
+    assert np.array_equal(
+        pointcloud.label_counts,
+        np.bincount(pointcloud.labels.view(np.uint8), minlength=256),
+    )
+    assert pointcloud.get_class_point_counts() == {"ground": 75, "car": 20}
+
+
+def test_replace_missing_labels(pointcloud) -> None:
+    pointcloud.replace_missing_labels_with_default()
+    assert pointcloud.get_undefined_label_ids() == set()
+    assert (pointcloud.labels == 0).all()
+    assert pointcloud.get_class_point_counts() == {"ground": 100, "car": 0}
@@ -0,0 +1,87 @@
+# Testing the class statistics of the segmentation labels of a dataset
+import os
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from labelCloud.control.segmentation_stats import SegmentationStats
+from labelCloud.io.segmentations import (
+    NumpySegmentationHandler,
+    RunLengthSegmentationHandler,
+)
+
+
+def histogram(labels: np.ndarray) -> np.ndarray:
+    return np.bincount(labels.view(np.uint8), minlength=256)
+
+
+@pytest.fixture
+def segmentation_folder(tmp_path: Path) -> Path:
+    NumpySegmentationHandler().overwrite_labels(
+        tmp_path / "a.bin", np.array([0, 0, 1, 2], dtype=np.int8)
+    )
+    RunLengthSegmentationHandler().overwrite_labels(
+        tmp_path / "b.rle", np.array([1, 1, -1], dtype=np.int8)
+    )
+    return tmp_path
+
+
+def test_dataset_counts(segmentation_folder: Path) -> None:
+    stats = SegmentationStats(segmentation_folder)
+    stats.set_current_frame("a")
+    frame_counts = histogram(np.array([2, 2, 2, 2], dtype=np.int8))  # unsaved labels
+    counts = stats.get_dataset_counts(frame_counts)
+    assert counts[[0, 1, 2, 255]].tolist() == [0, 2, 4, 1]
+    assert stats.index_path.exists()
+
+
+def test_index_is_reused(segmentation_folder: Path, monkeypatch) -> None:
+    SegmentationStats(segmentation_folder).set_current_frame("")
+
+    def fail(*args):
+        raise AssertionError("an indexed label file was read again")
+
+    monkeypatch.setattr(NumpySegmentationHandler, "count_labels", fail)
+    monkeypatch.setattr(RunLengthSegmentationHandler, "count_labels", fail)
+    stats = SegmentationStats(segmentation_folder)
+    stats.set_current_frame("")
+    assert stats.get_dataset_counts(np.zeros(256, dtype=np.int64))[1] == 3
+
+    labels = np.array([3, 3, 3, 3], dtype=np.int8)  # saved by labelCloud
+    label_path = segmentation_folder / "a.bin"
+    NumpySegmentationHandler().overwrite_labels(label_path, labels)
+    os.utime(label_path, ns=(0, 0))
+    stats.update_frame(label_path, histogram(labels))
+    stats.set_current_frame("b")
+    assert stats.other_counts[3] == 4 and stats.other_counts[1] == 0
+
+
+def test_frame_switches_use_the_totals(segmentation_folder: Path, monkeypatch) -> None:
+    stats = SegmentationStats(segmentation_folder)
+    stats.set_current_frame("a")
+
+    def fail(*args):
+        raise AssertionError("the label files were listed again")
+
+    monkeypatch.setattr(SegmentationStats, "get_label_files", fail)
+    monkeypatch.setattr(SegmentationStats, "get_frame_counts", fail)
+    stats.set_current_frame("b")
+    assert stats.other_counts[[0, 1, 2, 255]].tolist() == [2, 1, 1, 0]
+    stats.set_current_frame("a")
+    assert stats.other_counts[[0, 1, 2, 255]].tolist() == [0, 2, 0, 1]
+
+
+def test_changed_files_are_counted_again(segmentation_folder: Path) -> None:
+    SegmentationStats(segmentation_folder).set_current_frame("")
+    label_path = segmentation_folder / "b.rle"
+    RunLengthSegmentationHandler().overwrite_labels(
+        label_path, np.array([4, 4, 4, 4, 4], dtype=np.int8)
+    )
+    os.utime(label_path, ns=(0, 0))
+    (segmentation_folder / "a.bin").unlink()
+
+    stats = SegmentationStats(segmentation_folder)  # the next start of labelCloud
+    stats.set_current_frame("")
+    assert stats.other_counts.sum() == stats.other_counts[4] == 5
+    assert set(stats.index) == {"b"}
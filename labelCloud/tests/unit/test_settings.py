@@ -0,0 +1,83 @@
+# Testing the typed settings that are kept in sync with the configuration
+import pytest
+
+from labelCloud.control.config_manager import ExtendedConfigParser, Settings, settings
+
+
+@pytest.fixture
+def parser() -> ExtendedConfigParser:
+    parser = ExtendedConfigParser()
+    parser.read_dict(
+        {
+            "POINTCLOUD": {"point_size": "4.0"},
+            "LABEL": {
+                "std_translation": "0.1",
+                "std_rotation": "1",
+                "std_scaling": "0.1",
+            },
+            "USER_INTERFACE": {
+                "z_rotation_only": "True",
+                "show_floor": "False",
+                "show_orientation": "True",
+                "viewing_precision": "2",
+            },
+        }
+    )
+    parser.settings = Settings()
+    parser.settings.load(parser)
+    return parser
+
+
+def test_settings_are_typed(parser) -> None:
+    assert parser.settings.point_size == 4.0
+    assert parser.settings.show_floor is False
+    assert parser.settings.viewing_precision == 2
+    assert parser.settings.usage_mode == "label"  # fallback of an optional option
+    assert isinstance(settings.point_size, float)  # the settings of the config.ini
+
+
+def test_settings_follow_config(parser) -> None:
+    changed = []
+    parser.settings.register_callback(changed.append)
+
+    parser.set("USER_INTERFACE", "show_floor", "True")
+    parser["POINTCLOUD"]["POINT_SIZE"] = "4.0"  # unchanged value
+    parser["LABEL"]["export_precision"] = "8"  # no setting
+
+    assert parser.settings.show_floor is True
+    assert changed == ["show_floor"]
+
+
+def test_invalid_settings_are_rejected(parser) -> None:
+    parser.set("POINTCLOUD", "point_size", "4.0")
+    parser.remove_option("USER_INTERFACE", "viewing_precision")
+    with pytest.raises(ValueError, match="viewing_precision"):
+        parser.settings.load(parser)
+    with pytest.raises(ValueError, match="point_size"):
+        parser.set("POINTCLOUD", "point_size", "big")
+
+
+def test_mix_ratio_follows_settings(monkeypatch) -> None:
+    from pathlib import Path
+
+    import numpy as np
+
+    from labelCloud.control.config_manager import config
+    from labelCloud.control.pcd_manager import PointCloudManager
+    from labelCloud.model import PointCloud
+
+    monkeypatch.setattr(settings, "callbacks", list(settings.callbacks))
+    pcd_manager = PointCloudManager()
+    points = np.random.default_rng(0).uniform(size=(10, 3)).astype(np.float32)
+    pcd_manager.pointcloud = PointCloud(Path("foo.bin"), points)
+    pcd_manager.pointcloud.labels = np.zeros(10, dtype=np.int8)
+    pcd_manager.pointcloud.mix_ratio = 0.3
+    pcd_manager.pointcloud.label_colors  # blended once when drawn first
+
+    previous = config.get("POINTCLOUD", "label_color_mix_ratio", fallback="0.3")
+    try:
+        config.set("POINTCLOUD", "label_color_mix_ratio", "1.0")
+        assert pcd_manager.pointcloud.mix_ratio == 1.0
+        assert pcd_manager.pointcloud.label_updates  # uploaded again on the next draw
+    finally:
+        config.set("POINTCLOUD", "label_color_mix_ratio", previous)
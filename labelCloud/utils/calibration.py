@@ -0,0 +1,251 @@
+"""
+Solve the 3x4 projection matrix of a camera from 3D-2D point pairs.
+
+The matrix is initialized with the normalized direct linear transform (DLT) on a
+RANSAC consensus set and refined with Levenberg-Marquardt on the reprojection error,
+using Huber weights to damp the remaining outliers.
+"""
+from dataclasses import dataclass
+from typing import Optional, Tuple
+
+import numpy as np
+import numpy.typing as npt
+
+from .projection import project_points
+
+# Minimal number of point pairs to solve the 11 degrees of freedom of a camera
+MIN_POINT_PAIRS = 6
+
+
+class CalibrationError(Exception):
+    """Raised if a camera can not be calibrated from the given point pairs."""
+
+
+@dataclass
+class CalibrationResult:
+    pmatrix: npt.NDArray[np.float64]
+    inliers: npt.NDArray[np.bool_]
+    rms: float  # reprojection error of the inliers in pixels
+
+
+def normalize_points(
+    points: npt.NDArray,
+) -> Tuple[npt.NDArray[np.float64], npt.NDArray[np.float64]]:
+    """Translate points to their centroid and scale them to an average norm of sqrt(dim).
+
+    :return: homogeneous normalized points and the normalizing similarity transform
+    """
+    points = np.asarray(points, dtype=np.float64)
+    dim = points.shape[1]
+    centroid = points.mean(axis=0)
+    mean_distance = np.linalg.norm(points - centroid, axis=1).mean()
+    scale = np.sqrt(dim) / mean_distance if mean_distance > 0 else 1.0
+
+    transform = np.eye(dim + 1)
+    transform[:dim, :dim] *= scale
+    transform[:dim, dim] = -scale * centroid
+    homogeneous = np.hstack([points, np.ones((len(points), 1))])
+    return homogeneous @ transform.T, transform
+
+
+def canonicalize_pmatrix(
+    pmatrix: npt.NDArray, points_3d: Optional[npt.NDArray] = None
+) -> npt.NDArray[np.float64]:
+    """Fix the free scale of a projection matrix.
+
+    The rotational part of the last row gets unit length and the sign is chosen so
+    that the given points lie in front of the camera.
+    """
+    pmatrix = pmatrix / np.linalg.norm(pmatrix[2, :3])
+    if points_3d is not None:
+        _, depths = project_points(points_3d, pmatrix)
+        if np.median(depths) < 0:
+            pmatrix = -pmatrix
+    return pmatrix
+
+
+def solve_dlt(
+    points_3d: npt.NDArray, points_2d: npt.NDArray
+) -> npt.NDArray[np.float64]:
+    """Estimate a projection matrix with the normalized direct linear transform.
+
+    :param points_3d: (N, 3) points in the point cloud frame, N >= 6
+    :param points_2d: (N, 2) corresponding pixel coordinates
+    :return: (3, 4) projection matrix
+    """
+    if len(points_3d) < MIN_POINT_PAIRS:
+        raise CalibrationError(
+            f"At least {MIN_POINT_PAIRS} point pairs are needed, got {len(points_3d)}."
+        )
+    norm_3d, transform_3d = normalize_points(points_3d)
+    norm_2d, transform_2d = normalize_points(points_2d)
+
+    # Two equations per correspondence: [X^T 0 -uX^T] and [0 X^T -vX^T]
+    nb_points = len(norm_3d)
+    system = np.zeros((2 * nb_points, 12))
+    system[0::2, 0:4] = norm_3d
+    system[0::2, 8:12] = -norm_2d[:, 0:1] * norm_3d
+    system[1::2, 4:8] = norm_3d
+    system[1::2, 8:12] = -norm_2d[:, 1:2] * norm_3d
+
+    _, _, vt = np.linalg.svd(system)
+    pmatrix_norm = vt[-1].reshape(3, 4)
+
+    # Undo the normalization: P = T2d^-1 * P_norm * T3d
+    pmatrix = np.linalg.inv(transform_2d) @ pmatrix_norm @ transform_3d
+    return canonicalize_pmatrix(pmatrix, points_3d)
+
+
+def reprojection_errors(
+    pmatrix: npt.NDArray, points_3d: npt.NDArray, points_2d: npt.NDArray
+) -> npt.NDArray[np.float64]:
+    """Euclidean reprojection error per point pair in pixels (inf behind the camera)."""
+    pixels, depths = project_points(points_3d, pmatrix)
+    errors = np.linalg.norm(pixels - points_2d, axis=1)
+    errors[~(depths > 0) | ~np.isfinite(errors)] = np.inf
+    return errors
+
+
+def ransac_dlt(
+    points_3d: npt.NDArray,
+    points_2d: npt.NDArray,
+    threshold: float,
+    iterations: int = 500,
+    seed: Optional[int] = None,
+) -> npt.NDArray[np.bool_]:
+    """Find the largest set of point pairs consistent with one DLT solution.
+
+    :param threshold: maximal reprojection error of an inlier in pixels
+    :return: (N,) inlier mask
+    """
+    nb_points = len(points_3d)
+    if nb_points <= MIN_POINT_PAIRS:
+        return np.ones(nb_points, dtype=bool)
+
+    rng = np.random.default_rng(seed)
+    best_inliers = np.ones(nb_points, dtype=bool)
+    best_count = 0
+    for _ in range(iterations):
+        sample = rng.choice(nb_points, MIN_POINT_PAIRS, replace=False)
+        try:
+            pmatrix = solve_dlt(points_3d[sample], points_2d[sample])
+        except (CalibrationError, np.linalg.LinAlgError):
+            continue
+        inliers = reprojection_errors(pmatrix, points_3d, points_2d) < threshold
+        if inliers.sum() > best_count:
+            best_inliers, best_count = inliers, inliers.sum()
+            if best_count == nb_points:
+                break
+
+    if best_count < MIN_POINT_PAIRS:
+        return np.ones(nb_points, dtype=bool)
+    return best_inliers
+
+
+def huber_weights(errors: npt.NDArray, delta: float) -> npt.NDArray[np.float64]:
+    """IRLS weights of the Huber loss: 1 inside delta, delta / error outside."""
+    weights = np.ones_like(errors)
+    outside = errors > delta
+    weights[outside] = delta / errors[outside]
+    return weights
+
+
+def refine_levenberg_marquardt(
+    pmatrix: npt.NDArray,
+    points_3d: npt.NDArray,
+    points_2d: npt.NDArray,
+    huber_delta: float = 2.0,
+    iterations: int = 50,
+    tolerance: float = 1e-10,
+) -> npt.NDArray[np.float64]:
+    """Minimize the Huber-weighted reprojection error of a projection matrix.
+
+    :param huber_delta: residual (in pixels) from which on errors only grow linearly
+    """
+    homogeneous = np.hstack([points_3d, np.ones((len(points_3d), 1))])
+    params = canonicalize_pmatrix(pmatrix, points_3d).ravel()
+    damping = 1e-3
+
+    def weighted_residuals(p: npt.NDArray) -> Tuple[npt.NDArray, npt.NDArray]:
+        projected = homogeneous @ p.reshape(3, 4).T
+        pixels = projected[:, :2] / projected[:, 2:3]
+        residuals = pixels - points_2d
+        weights = np.sqrt(huber_weights(np.linalg.norm(residuals, axis=1), huber_delta))
+        return residuals * weights[:, np.newaxis], weights
+
+    residuals, weights = weighted_residuals(params)
+    cost = np.sum(residuals**2)
+    for _ in range(iterations):
+        projected = homogeneous @ params.reshape(3, 4).T
+        w = projected[:, 2:3]
+        pixels = projected[:, :2] / w
+
+        # Jacobian of u = p0.X / p2.X and v = p1.X / p2.X w.r.t. the 12 entries
+        jacobian = np.zeros((len(points_3d), 2, 12))
+        jacobian[:, 0, 0:4] = homogeneous / w
+        jacobian[:, 0, 8:12] = -pixels[:, 0:1] * homogeneous / w
+        jacobian[:, 1, 4:8] = homogeneous / w
+        jacobian[:, 1, 8:12] = -pixels[:, 1:2] * homogeneous / w
+        jacobian = (jacobian * weights[:, np.newaxis, np.newaxis]).reshape(-1, 12)
+        flat_residuals = residuals.ravel()
+
+        normal = jacobian.T @ jacobian
+        gradient = jacobian.T @ flat_residuals
+        while True:
+            step = np.linalg.lstsq(
+                normal + damping * np.diag(np.diag(normal) + 1e-12),
+                -gradient,
+                rcond=None,
+            )[0]
+            new_params = params + step
+            new_residuals, new_weights = weighted_residuals(new_params)
+            new_cost = np.sum(new_residuals**2)
+            if np.isfinite(new_cost) and new_cost < cost:
+                damping = max(damping / 10, 1e-12)
+                break
+            damping *= 10
+            if damping > 1e12:
+                return canonicalize_pmatrix(params.reshape(3, 4), points_3d)
+
+        converged = cost - new_cost < tolerance * max(cost, 1.0)
+        params, residuals, weights, cost = (
+            new_params,
+            new_residuals,
+            new_weights,
+            new_cost,
+        )
+        if converged:
+            break
+
+    return canonicalize_pmatrix(params.reshape(3, 4), points_3d)
+
+
+def calibrate_camera(
+    points_3d: npt.NDArray,
+    points_2d: npt.NDArray,
+    ransac_threshold: float = 10.0,
+    huber_delta: float = 2.0,
+    seed: Optional[int] = None,
+) -> CalibrationResult:
+    """Robustly solve the projection matrix of one camera.
+
+    :param ransac_threshold: maximal reprojection error (pixels) of a RANSAC inlier
+    :param huber_delta: Huber threshold (pixels) of the Levenberg-Marquardt refinement
+    """
+    points_3d = np.asarray(points_3d, dtype=np.float64).reshape(-1, 3)
+    points_2d = np.asarray(points_2d, dtype=np.float64).reshape(-1, 2)
+    if len(points_3d) < MIN_POINT_PAIRS:
+        raise CalibrationError(
+            f"At least {MIN_POINT_PAIRS} point pairs are needed, got {len(points_3d)}."
+        )
+
+    inliers = ransac_dlt(points_3d, points_2d, ransac_threshold, seed=seed)
+    pmatrix = solve_dlt(points_3d[inliers], points_2d[inliers])
+    pmatrix = refine_levenberg_marquardt(
+        pmatrix, points_3d[inliers], points_2d[inliers], huber_delta=huber_delta
+    )
+
+    errors = reprojection_errors(pmatrix, points_3d, points_2d)
+    inliers = errors < ransac_threshold
+    rms = float(np.sqrt(np.mean(errors[inliers] ** 2))) if inliers.any() else np.inf
+    return CalibrationResult(pmatrix=pmatrix, inliers=inliers, rms=rms)
@@ -1,11 +1,12 @@
 import colorsys
+from functools import lru_cache
 from typing import List
 
 import numpy as np
 import numpy.typing as npt
-import pkg_resources
 
 from ..definitions.types import Color3f
+from .resources import resource_path
 
 
 def get_distinct_colors(n: int) -> List[str]:
@@ -32,12 +33,16 @@ def get_distinct_colors(n: int) -> List[str]:
     return [rgb_to_hex(color) for color in colors]
 
 
+@lru_cache(maxsize=None)
+def get_height_palette() -> npt.NDArray[np.float64]:
+    """Load the (P, 3) rocket palette used for height and depth coloring."""
+    return np.loadtxt(resource_path("labelCloud.resources", "rocket-palette.txt"))
+
+
 def colorize_points_with_height(
     points: np.ndarray, z_min: float, z_max: float
 ) -> npt.NDArray[np.float32]:
-    palette = np.loadtxt(
-        pkg_resources.resource_filename("labelCloud.resources", "rocket-palette.txt")
-    )
+    palette = get_height_palette()
     palette_len = len(palette) - 1
 
     colors = np.zeros(points.shape)
@@ -0,0 +1,100 @@
+"""
+Suggest the image pixel matching a picked 3D point.
+
+The point is projected with the current calibration into the camera that sees it best
+and the projection is snapped to the strongest corner (Harris response) in a window
+around it, as calibration targets are usually picked on corners and edges.
+"""
+from typing import Optional, Sequence, Tuple
+
+import numpy as np
+import numpy.typing as npt
+
+from .projection import MIN_DEPTH, project_points
+
+
+def select_camera(
+    point: npt.NDArray,
+    pmatrices: npt.NDArray,
+    image_sizes: Sequence[Optional[Tuple[int, int]]],
+) -> Optional[Tuple[int, npt.NDArray[np.float64]]]:
+    """Find the camera in which the point is visible, closest to the image center.
+
+    :param image_sizes: width and height of the image of each camera, cameras without
+        an image (None) are skipped
+    :return: camera index and projected pixel, or None if no camera sees the point
+    """
+    best = None
+    for cam, (pmatrix, image_size) in enumerate(zip(pmatrices, image_sizes)):
+        if image_size is None:
+            continue
+        width, height = image_size
+        pixels, depths = project_points(np.reshape(point, (1, 3)), pmatrix)
+        pixel = pixels[0]
+        if depths[0] <= MIN_DEPTH or not (
+            0 <= pixel[0] < width and 0 <= pixel[1] < height
+        ):
+            continue
+        distance = np.linalg.norm(pixel - np.array([width / 2, height / 2]))
+        if best is None or distance < best[0]:
+            best = (distance, cam, pixel)
+    return None if best is None else (best[1], best[2])
+
+
+def box_filter(image: npt.NDArray, radius: int) -> npt.NDArray[np.float64]:
+    """Mean over a (2r+1)² window using summed area tables (edges are replicated)."""
+    size = 2 * radius + 1
+    padded = np.pad(image, radius + 1, mode="edge").astype(np.float64)
+    summed = padded.cumsum(axis=0).cumsum(axis=1)
+    window = (
+        summed[size:, size:]
+        - summed[:-size, size:]
+        - summed[size:, :-size]
+        + summed[:-size, :-size]
+    )
+    return window[: image.shape[0], : image.shape[1]] / size**2
+
+
+def corner_response(
+    gray: npt.NDArray, radius: int = 2, k: float = 0.04
+) -> npt.NDArray[np.float64]:
+    """Harris corner response of a grayscale image (positive on corners)."""
+    grad_y, grad_x = np.gradient(np.asarray(gray, dtype=np.float64))
+    ixx = box_filter(grad_x * grad_x, radius)
+    iyy = box_filter(grad_y * grad_y, radius)
+    ixy = box_filter(grad_x * grad_y, radius)
+    return ixx * iyy - ixy**2 - k * (ixx + iyy) ** 2
+
+
+def refine_pixel(
+    gray: npt.NDArray, pixel: npt.NDArray, search_radius: int
+) -> npt.NDArray[np.float64]:
+    """Snap a pixel to the strongest nearby corner of the window around it.
+
+    :param gray: grayscale window of the image, `pixel` in window coordinates
+    :param search_radius: corners further away than this are ignored
+    :return: refined pixel with sub-pixel precision (unchanged if there is no corner)
+    """
+    response = corner_response(gray)
+    rows, cols = np.mgrid[0 : gray.shape[0], 0 : gray.shape[1]]
+    distance = np.hypot(cols - pixel[0], rows - pixel[1])
+
+    # Prefer corners close to the projection
+    weighted = np.where(distance <= search_radius, response, -np.inf)
+    weighted = weighted * np.exp(-((distance / search_radius) ** 2))
+    row, col = np.unravel_index(np.argmax(weighted), weighted.shape)
+    if not weighted[row, col] > 0:
+        return np.asarray(pixel, dtype=np.float64)
+
+    # Sub-pixel peak by fitting a parabola in both directions
+    offset = np.zeros(2)
+    for axis, (index, size) in enumerate([(col, gray.shape[1]), (row, gray.shape[0])]):
+        if 0 < index < size - 1:
+            if axis == 0:
+                left, center, right = response[row, col - 1 : col + 2]
+            else:
+                left, center, right = response[row - 1 : row + 2, col]
+            denominator = left - 2 * center + right
+            if denominator < 0:
+                offset[axis] = np.clip(0.5 * (left - right) / denominator, -0.5, 0.5)
+    return np.array([col, row], dtype=np.float64) + offset
@@ -1,7 +1,7 @@
 from functools import wraps
 import logging
 
-from ..control.config_manager import config
+from ..control.config_manager import settings
 
 def in_labeling_only_decorator(func):
     """
@@ -10,7 +10,7 @@ def in_labeling_only_decorator(func):
    
     @wraps(func)
     def wrapper(*args, **kwargs):
-        if config.get("FILE", "usage_mode") == "label":
+        if settings.usage_mode == "label":
             return func(*args, **kwargs)
         
     return wrapper
@@ -22,8 +22,8 @@ def in_projection_only_decorator(func):
     
     @wraps(func)
     def wrapper(*args, **kwargs):
-        if config.get("FILE", "usage_mode") == "projection":
-            return func(**args, **kwargs)
+        if settings.usage_mode == "projection":
+            return func(*args, **kwargs)
         
     return wrapper
 
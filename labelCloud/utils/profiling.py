@@ -0,0 +1,183 @@
+"""
+Lightweight timing instrumentation, enabled from the command line:
+
+- `labelCloud --profile-startup` reports the duration of each launch phase.
+- `labelCloud --profile-frames` shows the rolling frame-time statistics of the rendering
+  and event handling stages in the viewer (`--frame-trace` also dumps a Chrome trace).
+"""
+import json
+import os
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager, nullcontext
+from functools import wraps
+from pathlib import Path
+from typing import Callable, ContextManager, Deque, Dict, Iterator, List, Tuple, TypeVar
+
+import numpy as np
+
+from .logger import print_column, start_section, end_section
+
+
+class StartupProfile(object):
+    """Collects the durations of the launch phases and reports them once.
+
+    Phases are measured from the end of the previous one, so the report adds up to
+    the total launch time. Disabled profiles only cost a function call per phase.
+    """
+
+    def __init__(self) -> None:
+        self.enabled = False
+        self.start = time.perf_counter()
+        self.last = self.start
+        self.phases: List[Tuple[str, float]] = []
+        self.reported = False
+
+    def enable(self, start: float) -> None:
+        """Start profiling from `start` (a `time.perf_counter` value)."""
+        self.enabled = True
+        self.start = self.last = start
+
+    def mark(self, name: str) -> None:
+        """End the current phase under the given name."""
+        if self.enabled:
+            now = time.perf_counter()
+            self.phases.append((name, now - self.last))
+            self.last = now
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Measure only the enclosed block (the time before is reported as `other`)."""
+        if not self.enabled:
+            yield
+            return
+        self.mark("other")
+        try:
+            yield
+        finally:
+            self.mark(name)
+
+    def report(self) -> None:
+        if not self.enabled or self.reported:
+            return
+        self.reported = True
+        total = time.perf_counter() - self.start
+        start_section("Startup Profile")
+        for name, duration in self.phases:
+            if name == "other" and duration < 0.001:
+                continue
+            print_column(
+                [name, f"{duration * 1000:8.1f} ms", f"{duration / total:6.1%}"]
+            )
+        print_column(["total", f"{total * 1000:8.1f} ms", ""], last=True)
+        end_section()
+
+
+startup_profile = StartupProfile()
+
+
+# ---------------------------------------------------------------------------- #
+#                                 Frame Profile                                #
+# ---------------------------------------------------------------------------- #
+
+F = TypeVar("F", bound=Callable)
+
+_NO_TIMER = nullcontext()  # shared by all timers of a disabled profiler
+
+
+class _StageTimer(object):
+    __slots__ = ("profiler", "name", "start")
+
+    def __init__(self, profiler: "FrameProfiler", name: str) -> None:
+        self.profiler = profiler
+        self.name = name
+
+    def __enter__(self) -> None:
+        self.start = time.perf_counter()
+
+    def __exit__(self, *exc_info) -> None:
+        self.profiler.add(self.name, self.start, time.perf_counter())
+
+
+class FrameProfiler(object):
+    """Keeps the last durations of each stage and a trace of all measured calls.
+
+    Stages are measured with `timer` (context manager) or `timed` (decorator). While
+    disabled, both only check a flag. The GL stages measure the time to submit the
+    commands, the GPU works asynchronously.
+    """
+
+    WINDOW = 240  # durations per stage for the statistics (some seconds of frames)
+    MAX_TRACE_EVENTS = 1_000_000  # oldest events are dropped from the trace
+
+    def __init__(self) -> None:
+        self.enabled = False
+        self.origin = time.perf_counter()
+        self.samples: Dict[str, Deque[float]] = {}
+        self.trace_events: Deque[dict] = deque(maxlen=self.MAX_TRACE_EVENTS)
+
+    def enable(self) -> None:
+        self.enabled = True
+
+    def timer(self, name: str) -> ContextManager[None]:
+        if not self.enabled:
+            return _NO_TIMER
+        return _StageTimer(self, name)
+
+    def timed(self, name: str) -> Callable[[F], F]:
+        """Decorator measuring every call of a function as stage `name`."""
+
+        def decorator(func: F) -> F:
+            @wraps(func)
+            def wrapper(*args, **kwargs):
+                if not self.enabled:
+                    return func(*args, **kwargs)
+                with _StageTimer(self, name):
+                    return func(*args, **kwargs)
+
+            return wrapper  # type: ignore
+
+        return decorator
+
+    def add(self, name: str, start: float, end: float) -> None:
+        samples = self.samples.get(name)
+        if samples is None:
+            samples = self.samples[name] = deque(maxlen=self.WINDOW)
+        samples.append(end - start)
+        self.trace_events.append(
+            {
+                "name": name,
+                "ph": "X",  # complete event with duration
+                "ts": (start - self.origin) * 1e6,
+                "dur": (end - start) * 1e6,
+                "pid": os.getpid(),
+                "tid": threading.get_ident(),
+            }
+        )
+
+    def statistics(self) -> List[Tuple[str, float, float, float]]:
+        """Return p50, p95 and max in milliseconds of every stage (first seen first)."""
+        rows = []
+        for name, samples in list(self.samples.items()):
+            durations = np.fromiter(samples, dtype=np.float64) * 1000
+            p50, p95 = np.percentile(durations, [50, 95])
+            rows.append((name, float(p50), float(p95), float(durations.max())))
+        return rows
+
+    def overlay_lines(self) -> List[str]:
+        lines = [f"{'stage':<20}{'p50':>8}{'p95':>8}{'max':>8}  ms"]
+        for name, p50, p95, maximum in self.statistics():
+            lines.append(f"{name:<20}{p50:8.2f}{p95:8.2f}{maximum:8.2f}")
+        return lines
+
+    def dump_trace(self, path: Path) -> None:
+        """Write the measured calls as Chrome trace (open in chrome://tracing or Perfetto)."""
+        with path.open("w") as write_file:
+            json.dump(
+                {"traceEvents": list(self.trace_events), "displayTimeUnit": "ms"},
+                write_file,
+            )
+
+
+frame_profiler = FrameProfiler()
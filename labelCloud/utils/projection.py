@@ -0,0 +1,184 @@
+"""
+Helpers to project point cloud points into the camera images using the 3x4 projection
+matrices from the `pmatrix_list` calibration and to rasterize them as an image overlay.
+"""
+from dataclasses import dataclass
+from typing import Optional, Tuple
+
+import numpy as np
+import numpy.typing as npt
+
+from ..control.config_manager import config
+
+# Minimum depth in front of the camera for a point to be projected
+MIN_DEPTH = 1e-3
+
+
+def get_projection_matrices() -> npt.NDArray[np.float64]:
+    """Read the projection matrices of all cameras from the config.
+
+    :return: (C, 3, 4) array with one projection matrix per camera (left, middle, right)
+    """
+    values = config.getlist("FILE", "pmatrix_list")
+    return np.asarray(values, dtype=np.float64).reshape(-1, 3, 4)
+
+
+def project_points(
+    points: npt.NDArray, pmatrix: npt.NDArray
+) -> Tuple[npt.NDArray[np.float64], npt.NDArray[np.float64]]:
+    """Project 3D points with a 3x4 projection matrix.
+
+    :param points: (N, 3) array of points in the point cloud frame
+    :param pmatrix: (3, 4) projection matrix of the camera
+    :return: (N, 2) pixel coordinates and (N,) depths in front of the camera
+    """
+    pmatrix = np.asarray(pmatrix, dtype=np.float64)
+    points = np.asarray(points, dtype=np.float64)
+    homogeneous = points @ pmatrix[:, :3].T + pmatrix[:, 3]
+    depths = homogeneous[:, 2]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        pixels = homogeneous[:, :2] / depths[:, np.newaxis]
+    return pixels, depths
+
+
+def normalize(values: npt.NDArray) -> npt.NDArray[np.float64]:
+    """Scale values linearly into 0..1 (constant arrays map to 0)."""
+    values = np.asarray(values, dtype=np.float64)
+    if values.size == 0:
+        return values
+    v_min, v_max = values.min(), values.max()
+    if v_max - v_min <= 0:
+        return np.zeros_like(values)
+    return (values - v_min) / (v_max - v_min)
+
+
+def rasterize_points(
+    pixels: npt.NDArray,
+    depths: npt.NDArray,
+    colors: npt.NDArray,
+    width: int,
+    height: int,
+    point_radius: int = 1,
+    alpha: float = 1.0,
+) -> npt.NDArray[np.uint8]:
+    """Rasterize projected points into a single z-buffered RGBA layer.
+
+    Each pixel only keeps the color of the closest point that covers it, so the
+    overlay is built with a handful of vectorized operations instead of one paint
+    call per point.
+
+    :param pixels: (N, 2) pixel coordinates (x, y)
+    :param depths: (N,) depths of the points in front of the camera
+    :param colors: (N, 3) rgb colors in 0..1
+    :param width: width of the image
+    :param height: height of the image
+    :param point_radius: half size of the square drawn per point (0 = single pixel)
+    :param alpha: opacity of the drawn points
+    :return: (height, width, 4) uint8 RGBA image (transparent where no point falls)
+    """
+    layer = np.zeros((height, width, 4), dtype=np.uint8)
+
+    in_front = depths > MIN_DEPTH
+    pixels = np.round(pixels[in_front]).astype(np.int64)
+    depths = depths[in_front]
+    colors = np.asarray(colors)[in_front]
+
+    # Splat every point into a (2r+1)² square
+    if point_radius > 0:
+        offset_range = np.arange(-point_radius, point_radius + 1)
+        offsets = np.stack(np.meshgrid(offset_range, offset_range), -1).reshape(-1, 2)
+        nb_offsets = len(offsets)
+        pixels = (pixels[:, np.newaxis, :] + offsets[np.newaxis, :, :]).reshape(-1, 2)
+        depths = np.repeat(depths, nb_offsets)
+        colors = np.repeat(colors, nb_offsets, axis=0)
+
+    inside = (
+        (pixels[:, 0] >= 0)
+        & (pixels[:, 0] < width)
+        & (pixels[:, 1] >= 0)
+        & (pixels[:, 1] < height)
+    )
+    if not inside.any():
+        return layer
+    pixels, depths, colors = pixels[inside], depths[inside], colors[inside]
+
+    # Z-buffer: sort by pixel and depth, keep the closest point of each pixel
+    flat_index = pixels[:, 1] * width + pixels[:, 0]
+    order = np.lexsort((depths, flat_index))
+    flat_index = flat_index[order]
+    first_of_pixel = np.ones(len(flat_index), dtype=bool)
+    first_of_pixel[1:] = flat_index[1:] != flat_index[:-1]
+    winners = order[first_of_pixel]
+
+    rgba = layer.reshape(-1, 4)
+    rgba[flat_index[first_of_pixel], :3] = np.clip(colors[winners] * 255, 0, 255)
+    rgba[flat_index[first_of_pixel], 3] = int(alpha * 255)
+    return layer
+
+
+def render_projection_overlay(
+    points: npt.NDArray,
+    pmatrix: npt.NDArray,
+    width: int,
+    height: int,
+    colors: Optional[npt.NDArray] = None,
+    palette: Optional[npt.NDArray] = None,
+    point_radius: int = 1,
+    alpha: float = 1.0,
+) -> npt.NDArray[np.uint8]:
+    """Project a point cloud into a camera and return the RGBA overlay.
+
+    :param colors: (N, 3) colors per point (e.g. intensity colors); if None the points
+        are colored by their depth using the given palette
+    :param palette: (P, 3) color palette used for the depth coloring
+    """
+    pixels, depths = project_points(points, pmatrix)
+    if colors is None:
+        visible = depths > MIN_DEPTH
+        relative_depth = np.zeros_like(depths)
+        relative_depth[visible] = normalize(depths[visible])
+        if palette is None:
+            palette = np.array([[1.0, 1.0, 0.0], [0.0, 0.0, 1.0]])
+        palette_index = np.round(relative_depth * (len(palette) - 1)).astype(np.int64)
+        colors = palette[palette_index]
+    return rasterize_points(
+        pixels, depths, colors, width, height, point_radius=point_radius, alpha=alpha
+    )
+
+
+@dataclass
+class ResidualStatistics:
+    """Summary of the reprojection residuals of one camera (in pixels)."""
+
+    count: int
+    rms: float
+    median: float
+    max: float
+
+
+def reprojection_residuals(
+    points_3d: npt.NDArray, points_2d: npt.NDArray, pmatrix: npt.NDArray
+) -> npt.NDArray[np.float64]:
+    """Residual vectors between the projected 3D points and their 2D correspondences.
+
+    :param points_3d: (N, 3) points in the point cloud frame
+    :param points_2d: (N, 2) picked pixel coordinates
+    :param pmatrix: (3, 4) projection matrix of the camera
+    :return: (N, 2) vectors pointing from the picked to the projected pixel
+    """
+    pixels, _ = project_points(np.reshape(points_3d, (-1, 3)), pmatrix)
+    return pixels - np.reshape(np.asarray(points_2d, dtype=np.float64), (-1, 2))
+
+
+def residual_statistics(residuals: npt.NDArray) -> Optional[ResidualStatistics]:
+    """Compute RMS, median and maximum of the residual lengths, None if there are none."""
+    residuals = np.reshape(residuals, (-1, 2))
+    if len(residuals) == 0:
+        return None
+    errors = np.linalg.norm(residuals, axis=1)
+    return ResidualStatistics(
+        count=len(errors),
+        rms=float(np.sqrt(np.mean(errors**2))),
+        median=float(np.median(errors)),
+        max=float(errors.max()),
+    )
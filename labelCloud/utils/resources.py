@@ -0,0 +1,19 @@
+"""Locate the data files shipped with labelCloud (e.g. in labelCloud.resources)."""
+import sys
+from pathlib import Path
+
+
+def resource_path(package: str, name: str) -> Path:
+    """Return the path of a package data file.
+
+    The package is installed unzipped (see setup.cfg), so the file exists on disk.
+    """
+    if sys.version_info >= (3, 9):
+        from importlib.resources import files
+
+        return Path(str(files(package).joinpath(name)))
+
+    # pkg_resources is slow to import, so it is only used on old Python versions
+    import pkg_resources
+
+    return Path(pkg_resources.resource_filename(package, name))
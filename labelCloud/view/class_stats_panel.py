@@ -0,0 +1,78 @@
+from typing import List, Tuple
+
+import numpy as np
+import numpy.typing as npt
+from PyQt5 import QtCore, QtGui, QtWidgets
+
+from ..io.labels.config import LabelConfig
+
+
+class ClassStatsPanel(QtWidgets.QDockWidget):
+    """Number of points per segmentation class in the current frame and the dataset."""
+
+    COLUMNS = ["Class", "Frame", "Dataset"]
+
+    def __init__(self, parent: QtWidgets.QWidget) -> None:
+        super().__init__("Class Statistics", parent)
+        self.setObjectName("class_stats_panel")
+        self.setFeatures(
+            QtWidgets.QDockWidget.DockWidgetMovable
+            | QtWidgets.QDockWidget.DockWidgetFloatable
+        )
+
+        self.table = QtWidgets.QTableWidget(0, len(self.COLUMNS), self)
+        self.table.setHorizontalHeaderLabels(self.COLUMNS)
+        self.table.verticalHeader().setVisible(False)
+        self.table.setEditTriggers(QtWidgets.QAbstractItemView.NoEditTriggers)
+        self.table.setSelectionMode(QtWidgets.QAbstractItemView.NoSelection)
+        self.table.horizontalHeader().setSectionResizeMode(
+            QtWidgets.QHeaderView.Stretch
+        )
+        self.setWidget(self.table)
+
+    @staticmethod
+    def get_rows(
+        frame_counts: npt.NDArray[np.int64], dataset_counts: npt.NDArray[np.int64]
+    ) -> List[Tuple[str, int, int]]:
+        """Class name and counts of every class, labels that are not defined in the
+        label config are summed up in an extra row."""
+        rows = []
+        undefined = np.ones(len(frame_counts), dtype=np.bool_)
+        for label_class in LabelConfig().classes:
+            index = label_class.id & 0xFF
+            rows.append(
+                (label_class.name, int(frame_counts[index]), int(dataset_counts[index]))
+            )
+            undefined[index] = False
+        if dataset_counts[undefined].any():
+            rows.append(
+                (
+                    "(undefined)",
+                    int(frame_counts[undefined].sum()),
+                    int(dataset_counts[undefined].sum()),
+                )
+            )
+        return rows
+
+    def update_counts(
+        self, frame_counts: npt.NDArray[np.int64], dataset_counts: npt.NDArray[np.int64]
+    ) -> None:
+        rows = self.get_rows(frame_counts, dataset_counts)
+        frame_total = max(int(frame_counts.sum()), 1)
+        dataset_total = max(int(dataset_counts.sum()), 1)
+
+        self.table.setRowCount(len(rows))
+        for row, (name, frame_count, dataset_count) in enumerate(rows):
+            name_item = QtWidgets.QTableWidgetItem(name)
+            if name in LabelConfig().class_by_name:
+                name_item.setData(
+                    QtCore.Qt.DecorationRole,
+                    QtGui.QColor.fromRgbF(*LabelConfig().get_class_color(name)),
+                )
+            self.table.setItem(row, 0, name_item)
+            for column, (count, total) in enumerate(
+                [(frame_count, frame_total), (dataset_count, dataset_total)], start=1
+            ):
+                item = QtWidgets.QTableWidgetItem(f"{count:,} ({count / total:.1%})")
+                item.setTextAlignment(QtCore.Qt.AlignRight | QtCore.Qt.AlignVCenter)
+                self.table.setItem(row, column, item)
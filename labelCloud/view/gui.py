@@ -3,13 +3,11 @@ import numpy as np
 import os
 import re
 import sys
-import copy
 import shutil
 import traceback
 from pathlib import Path
 from typing import TYPE_CHECKING, Optional, Set, Union
 
-import pkg_resources
 from PyQt5 import QtCore, QtGui, QtWidgets, uic
 from PyQt5.QtCore import QEvent
 from PyQt5.QtCore import Qt as Keys
@@ -24,15 +22,19 @@ from PyQt5.QtWidgets import (
     QMessageBox,
 )
 
-from ..control.config_manager import config
+from ..control.config_manager import config, settings
 from ..definitions import Color3f, LabelingMode, Camera
 from ..definitions.types import Point2D
 from ..io.labels.config import LabelConfig
 from ..io.pointclouds import BasePointCloudHandler
 from ..labeling_strategies import PickingStrategy, SpanningStrategy
 from ..proj_correction_strategies import PointMatchCorrection
+from ..model import BBox
 from ..model.point_cloud import PointCloud
 from ..utils.decorators import in_labeling_only_decorator, in_projection_only_decorator
+from ..utils.profiling import frame_profiler, startup_profile
+from ..utils.resources import resource_path
+from .class_stats_panel import ClassStatsPanel
 from .settings_dialog import SettingsDialog  # type: ignore
 from .startup.dialog import StartupDialog
 from .status_manager import StatusManager
@@ -69,6 +71,10 @@ def set_orientation_visibility(state: bool) -> None:
     config.set("USER_INTERFACE", "show_orientation", str(state))
 
 
+def set_projected_points_visibility(state: bool) -> None:
+    config.set("USER_INTERFACE", "show_projected_points", str(state))
+
+
 def set_zrotation_only(state: bool) -> None:
     config.set("USER_INTERFACE", "z_rotation_only", str(state))
 
@@ -134,13 +140,13 @@ class GUI(QtWidgets.QMainWindow):
     def __init__(self, control: "Controller") -> None:
         super(GUI, self).__init__()
 
-
+        # The uic loader logs every parsed widget property on debug level
+        logging.getLogger("PyQt5.uic").setLevel(logging.WARNING)
         uic.loadUi(
-            pkg_resources.resource_filename(
-                "labelCloud.resources.interfaces", f"interface-label-proto.ui"
-            ),
+            str(resource_path("labelCloud.resources.interfaces", "interface-label-proto.ui")),
             self,
         )
+        startup_profile.mark("load user interface")
         self.resize(1500, 900)
         self.setWindowTitle("labelCloud")
         self.setStyleSheet(
@@ -160,6 +166,7 @@ class GUI(QtWidgets.QMainWindow):
             pass
         else:
             sys.exit()
+        startup_profile.mark("startup dialog (user input)")
 
         self.LABELING = LabelConfig().type == LabelingMode.OBJECT_DETECTION
         self.PROJECTION = LabelConfig().type == LabelingMode.PROJECTION_CORRECTION
@@ -178,9 +185,11 @@ class GUI(QtWidgets.QMainWindow):
         self.act_color_with_label: QtWidgets.QAction # In labeling only
         self.act_show_floor: QtWidgets.QAction
         self.act_show_orientation: QtWidgets.QAction
+        self.act_show_projected_points: QtWidgets.QAction # In projection only
         self.act_save_perspective: QtWidgets.QAction
         self.act_align_pcd: QtWidgets.QAction
         self.act_change_settings: QtWidgets.QAction
+        self.act_solve_calibration: QtWidgets.QAction # In projection only
 
         self.current_element_label: QtWidgets.QLabel
 
@@ -265,6 +274,10 @@ class GUI(QtWidgets.QMainWindow):
 
         self.label_volume: QtWidgets.QLabel # In labeling only
 
+        # Active bounding box (and its revision) whose parameters are shown
+        self.shown_bbox: Optional[BBox] = None
+        self.shown_bbox_revision: int = -1
+
         self.button_point_match: QtWidgets.QPushButton # In projection only
 
         self.camera_left_graphics: QtWidgets.QGraphicsView
@@ -281,6 +294,12 @@ class GUI(QtWidgets.QMainWindow):
         
         self.img_manager_list = [self.camera_left_manager, self.camera_middle_manager, self.camera_right_manager]
         self.populate_ui_list()
+
+        # Points per class of the current frame and the dataset, in segmentation only
+        self.class_stats_panel: Optional[ClassStatsPanel] = None
+        if self.SEMANTIC:
+            self.class_stats_panel = ClassStatsPanel(self)
+            self.addDockWidget(QtCore.Qt.RightDockWidgetArea, self.class_stats_panel)
         
         self.cam_list = config.getlist("FILE", "image_list")
 
@@ -290,9 +309,11 @@ class GUI(QtWidgets.QMainWindow):
         # Connect all events to functions
         self.connect_events()
         self.set_checkbox_states()  # tick in menu
+        startup_profile.mark("set up widgets and events")
 
         # Connect with controller
         self.controller.startup(self)
+        startup_profile.mark("controller startup")
 
         # Start event cycle
         self.timer = QtCore.QTimer(self)
@@ -310,6 +331,7 @@ class GUI(QtWidgets.QMainWindow):
             self.act_color_with_label,
             self.act_show_floor,
             self.act_show_orientation,
+            self.act_show_projected_points,
             self.act_save_perspective,
             self.act_align_pcd,
             self.act_change_settings,
@@ -321,6 +343,7 @@ class GUI(QtWidgets.QMainWindow):
             self.button_set_pcd,
             self.progressbar_pcds,
             self.act_delete_all_elements,
+            self.act_solve_calibration,
             self.act_set_default_class,
             self.actiongroup_default_class,
             self.act_propagate_labels,
@@ -368,6 +391,8 @@ class GUI(QtWidgets.QMainWindow):
             return ui_element.property(prop)
      
     def connect_events(self) -> None:
+        # Namespace in which the `connections` properties of the widgets are evaluated
+        namespace = {**globals(), "self": self}
         for ui_element in self.all_ui_elements:
             
             visible_labeling = self.prop_fallback(ui_element, "visible_labeling", True) 
@@ -404,10 +429,7 @@ class GUI(QtWidgets.QMainWindow):
                 if ui_element.property(f"on_{conn_event}"):
                     for conn in connections:
                         logging.debug(f"\t- connecting {conn_event} w/ \"{conn}\"")
-                        _globals = globals().copy()
-                        _globals.update(locals())
-                            
-                        exec(f"ui_element.{conn_event}.connect({conn})", _globals)
+                        getattr(ui_element, conn_event).connect(eval(conn, namespace))
         logging.debug(" ")
 
     def init_images(self) -> None:
@@ -415,6 +437,7 @@ class GUI(QtWidgets.QMainWindow):
             manager.set_camera(idx)
             manager.refresh_image_path()
 
+    @frame_profiler.timed("refresh images")
     def refresh_images(self, do_pixmap=True) -> None:
         for idx, manager in enumerate(self.img_manager_list):
             if do_pixmap:   
@@ -427,34 +450,32 @@ class GUI(QtWidgets.QMainWindow):
             config.getboolean("LABEL", "propagate_labels")
             )
             self.act_z_rotation_only.setChecked(
-                config.getboolean("USER_INTERFACE", "z_rotation_only")
+                settings.z_rotation_only
             )
             self.act_color_with_label.setChecked(
-                config.getboolean("POINTCLOUD", "color_with_label")
+                settings.color_with_label
             )
 
         self.act_show_floor.setChecked(
-            config.getboolean("USER_INTERFACE", "show_floor")
+            settings.show_floor
         )
         self.act_show_orientation.setChecked(
-            config.getboolean("USER_INTERFACE", "show_orientation")
+            settings.show_orientation
         )
+        if self.PROJECTION:
+            self.act_show_projected_points.setChecked(
+                config.getboolean("USER_INTERFACE", "show_projected_points", fallback=False)
+            )
         
 
     # Collect, filter and forward events to viewer
+    @frame_profiler.timed("event filter")
     def eventFilter(self, event_object, event) -> bool:
-        if self.LABELING:
-            self.bbox_previous = copy.deepcopy(self.controller.element_controller.get_active_element())
-
         # Keyboard Events
         if (event.type() == QEvent.KeyPress) and event_object in [
             self,
             self.element_list,
         ]:
-            if self.LABELING:
-                self.update_bbox_stats(self.controller.element_controller.get_active_element())
-            if self.PROJECTION:
-                pass
             if event.key() == Keys.Key_B:
                 self.controller.drawing_mode.set_drawing_strategy(PointMatchCorrection(self))
                 return True
@@ -468,13 +489,9 @@ class GUI(QtWidgets.QMainWindow):
         if (event.type() == QEvent.MouseMove):
             if (event_object == self.gl_widget): # MOUSE MOVE
                 self.controller.mouse_move_event(event)
-                if self.LABELING:
-                    self.update_bbox_stats(self.controller.element_controller.get_active_element())
-                 
+
         elif (event.type() == QEvent.Wheel) and (event_object == self.gl_widget): # MOUSE SCROLL
             self.controller.mouse_scroll_event(event)
-            if self.LABELING:
-                self.update_bbox_stats(self.controller.element_controller.get_active_element())
 
         elif event.type() == QEvent.MouseButtonDblClick and ( # MOUSE DOUBLE CLICK
             event_object == self.gl_widget
@@ -486,8 +503,6 @@ class GUI(QtWidgets.QMainWindow):
             event_object == self.gl_widget
         ):
             self.controller.mouse_clicked(event)
-            if self.LABELING:
-                self.update_bbox_stats(self.controller.element_controller.get_active_element())
 
         #### TESTING
 #        if (event.type() == QEvent.MouseButtonPress) and (event_object == self.camera_left_graphics):
@@ -502,12 +517,12 @@ class GUI(QtWidgets.QMainWindow):
             event_object != self.current_class_dropdown
         ):
             self.current_class_dropdown.clearFocus()
-            self.update_bbox_stats(self.controller.element_controller.get_active_element())
         return False
 
     def closeEvent(self, a0: QtGui.QCloseEvent) -> None:
         logging.info("Closing window after saving ...")
         self.controller.save()
+        self.controller.pcd_manager.label_manager.close()
         self.timer.stop()
         a0.accept()
 
@@ -532,6 +547,26 @@ class GUI(QtWidgets.QMainWindow):
         msg.setWindowTitle("No Point Clouds Found")
         msg.exec_()
 
+    def ask_replace_undefined_labels(
+        self, pcd_path: Path, undefined_label_ids: Set[int]
+    ) -> bool:
+        unique_class_ids = set(c.id for c in LabelConfig().classes)
+        msg = QMessageBox(self)
+        msg.setWindowTitle("Invalid segmentation label")
+        msg.setText(
+            f"Segmentation labels {undefined_label_ids} of `{pcd_path}` don't match with the label config {unique_class_ids}."
+        )
+        msg.setInformativeText(
+            f"""
+            Do you want to overwrite 
+            the undefined labels {undefined_label_ids} with 
+            default label `{LabelConfig().get_default_class_name()}` of id `{LabelConfig().default}`?
+            """
+        )
+        msg.setIcon(QMessageBox.Critical)
+        msg.setStandardButtons(QMessageBox.Cancel | QMessageBox.Ok)
+        return msg.exec_() == QMessageBox.Ok
+
     # VISUALIZATION METHODS
 
     def set_pcd_label(self, pcd_name: str) -> None:
@@ -544,9 +579,39 @@ class GUI(QtWidgets.QMainWindow):
     def update_progress(self, value) -> None:
         self.progressbar_pcds.setValue(value)
 
+    def update_class_stats(
+        self, frame_counts: np.ndarray, dataset_counts: np.ndarray
+    ) -> None:
+        if self.class_stats_panel is not None:
+            self.class_stats_panel.update_counts(frame_counts, dataset_counts)
+
     def update_current_class_dropdown(self) -> None:
         self.controller.pcd_manager.populate_class_dropdown()
 
+    def refresh_bbox_stats(self) -> None:
+        """Show the parameters of the active bounding box if it or its revision changed."""
+        bbox = self.controller.element_controller.get_active_element()
+        revision = bbox.revision if bbox is not None else -1
+        if (bbox is self.shown_bbox and revision == self.shown_bbox_revision) or (
+            self.line_edited_activated()  # do not overwrite the users input
+        ):
+            return
+        self.shown_bbox, self.shown_bbox_revision = bbox, revision
+        self.update_bbox_stats(bbox)
+
+    def update_bbox_stats(self, bbox: Optional[BBox]) -> None:
+        viewing_precision = settings.viewing_precision
+        if bbox is None:
+            values = [""] * len(self.all_line_edits)
+        else:
+            values = [
+                *(str(round(value, viewing_precision)) for value in bbox.get_center()),
+                *(str(round(value, viewing_precision)) for value in bbox.get_dimensions()),
+                *(str(round(value, 1)) for value in bbox.get_rotations()),
+            ]
+        for line_edit, value in zip(self.all_line_edits, values):
+            line_edit.setText(value)
+
 #    def update_bbox_stats(self, bbox) -> None:
 #        viewing_precision = config.getint("USER_INTERFACE", "viewing_precision")
 #        if bbox and not self.line_edited_activated():
@@ -655,11 +720,7 @@ class GUI(QtWidgets.QMainWindow):
         if not path_to_folder.is_dir():
             logging.warning("Please specify a valid folder path.")
         else:
-            # TODO
-            self.controller.pcd_manager.label_manager.label_folder = path_to_folder
-            self.controller.pcd_manager.label_manager.label_strategy.update_label_folder(
-                path_to_folder
-            )
+            self.controller.pcd_manager.label_manager.update_label_folder(path_to_folder)
             logging.info("Changed label folder to %s!" % path_to_folder)
 
     def update_default_object_class_menu(
@@ -0,0 +1,217 @@
+"""
+Render the scene of the viewer without a display, e.g. for benchmarks and golden images.
+
+The same `SceneView` code as in the GUI draws into an EGL pbuffer. Mesa's surfaceless
+platform renders in software, so neither a GPU nor an X server is needed. PyOpenGL
+chooses its platform when OpenGL is imported the first time, so this module has to be
+imported before any other OpenGL user (or `PYOPENGL_PLATFORM=egl` be set):
+
+    from labelCloud.view.offscreen import OffscreenViewer
+
+    viewer = OffscreenViewer(800, 600)
+    viewer.show(pointcloud, bboxes)
+    image = viewer.render()  # (height, width, 3) uint8 array
+"""
+import os
+import sys
+
+if sys.platform.startswith("linux") and "OpenGL" not in sys.modules:
+    os.environ.setdefault("PYOPENGL_PLATFORM", "egl")
+    if not (os.environ.get("DISPLAY") or os.environ.get("WAYLAND_DISPLAY")):
+        os.environ.setdefault("EGL_PLATFORM", "surfaceless")
+
+import ctypes
+import time
+from pathlib import Path
+from typing import List, Optional
+
+import numpy as np
+import numpy.typing as npt
+import OpenGL.GL as GL
+
+from ..control.bbox_controller import BoundingBoxController
+from ..control.drawing_manager import LabelDrawingManager
+from ..control.pcd_manager import PointCloudManager
+from ..model import BBox, PointCloud
+from .viewer import SceneView
+
+
+class OffscreenContextError(Exception):
+    pass
+
+
+class OffscreenContext(object):
+    """An OpenGL (compatibility profile) context rendering into an EGL pbuffer."""
+
+    def __init__(self, width: int, height: int) -> None:
+        from OpenGL import platform
+
+        if "EGL" not in type(platform.PLATFORM).__name__:
+            raise OffscreenContextError(
+                "PyOpenGL was imported without the EGL platform. Import "
+                "labelCloud.view.offscreen first or set PYOPENGL_PLATFORM=egl."
+            )
+        from OpenGL import EGL
+
+        self.EGL = EGL
+        self.width = width
+        self.height = height
+
+        self.display = EGL.eglGetDisplay(EGL.EGL_DEFAULT_DISPLAY)
+        major, minor = EGL.EGLint(), EGL.EGLint()
+        if not EGL.eglInitialize(
+            self.display, ctypes.pointer(major), ctypes.pointer(minor)
+        ):
+            raise OffscreenContextError("Could not initialize the EGL display.")
+
+        config_attributes = [
+            EGL.EGL_SURFACE_TYPE, EGL.EGL_PBUFFER_BIT,
+            EGL.EGL_RED_SIZE, 8,
+            EGL.EGL_GREEN_SIZE, 8,
+            EGL.EGL_BLUE_SIZE, 8,
+            EGL.EGL_DEPTH_SIZE, 24,
+            EGL.EGL_RENDERABLE_TYPE, EGL.EGL_OPENGL_BIT,
+            EGL.EGL_NONE,
+        ]  # fmt: skip
+        config = EGL.EGLConfig()
+        nb_configs = EGL.EGLint()
+        EGL.eglChooseConfig(
+            self.display,
+            (EGL.EGLint * len(config_attributes))(*config_attributes),
+            ctypes.pointer(config),
+            1,
+            ctypes.pointer(nb_configs),
+        )
+        if nb_configs.value == 0:
+            raise OffscreenContextError("EGL has no config for OpenGL pbuffers.")
+
+        surface_attributes = [
+            EGL.EGL_WIDTH,
+            width,
+            EGL.EGL_HEIGHT,
+            height,
+            EGL.EGL_NONE,
+        ]
+        self.surface = EGL.eglCreatePbufferSurface(
+            self.display,
+            config,
+            (EGL.EGLint * len(surface_attributes))(*surface_attributes),
+        )
+        EGL.eglBindAPI(EGL.EGL_OPENGL_API)  # desktop OpenGL instead of OpenGL ES
+        self.context = EGL.eglCreateContext(
+            self.display, config, EGL.EGL_NO_CONTEXT, None
+        )
+        if self.context == EGL.EGL_NO_CONTEXT:
+            raise OffscreenContextError("Could not create an EGL OpenGL context.")
+        self.make_current()
+
+    def make_current(self) -> None:
+        self.EGL.eglMakeCurrent(self.display, self.surface, self.surface, self.context)
+
+    def read_pixels(self) -> npt.NDArray[np.uint8]:
+        """Return the rendered image as (height, width, 3) array, top row first."""
+        GL.glPixelStorei(GL.GL_PACK_ALIGNMENT, 1)
+        data = GL.glReadPixels(
+            0, 0, self.width, self.height, GL.GL_RGB, GL.GL_UNSIGNED_BYTE
+        )
+        image = np.frombuffer(data, dtype=np.uint8).reshape(self.height, self.width, 3)
+        return np.flipud(image).copy()
+
+    def close(self) -> None:
+        EGL = self.EGL
+        EGL.eglMakeCurrent(
+            self.display, EGL.EGL_NO_SURFACE, EGL.EGL_NO_SURFACE, EGL.EGL_NO_CONTEXT
+        )
+        EGL.eglDestroyContext(self.display, self.context)
+        EGL.eglDestroySurface(self.display, self.surface)
+
+
+class OffscreenViewer(SceneView):
+    """Draws point clouds and bounding boxes like the viewer of the GUI does."""
+
+    LABELING = True  # draw the bounding boxes independent of the labeling mode
+    PROJECTION = False
+
+    def __init__(self, width: int = 800, height: int = 600) -> None:
+        self.context = OffscreenContext(width, height)
+        self.init_scene()
+        self.crosshair_pos = (width // 2, height // 2)
+
+        self.pcd_manager = PointCloudManager()
+        self.element_controller = BoundingBoxController()
+        self.drawing_mode = LabelDrawingManager(self.element_controller)
+
+        self.initialize_gl()
+        self.resize_gl(width, height)
+
+    def show(
+        self,
+        pointcloud: PointCloud,
+        bboxes: Optional[List[BBox]] = None,
+        active_bbox_id: int = -1,
+    ) -> None:
+        self.pcd_manager.pointcloud = pointcloud
+        self.element_controller.elements = list(bboxes or [])
+        self.element_controller.active_element_id = active_bbox_id
+
+    def render(self) -> npt.NDArray[np.uint8]:
+        """Draw one frame and return it as (height, width, 3) array."""
+        self.context.make_current()
+        self.draw_scene()
+        GL.glFinish()
+        return self.context.read_pixels()
+
+    def measure_fps(self, nb_frames: int = 50) -> float:
+        """Draw `nb_frames` frames (without reading them back) and return the frame rate."""
+        self.context.make_current()
+        self.draw_scene()  # uploads the buffers of a new point cloud
+        GL.glFinish()
+        start = time.perf_counter()
+        for _ in range(nb_frames):
+            self.draw_scene()
+        GL.glFinish()
+        return nb_frames / (time.perf_counter() - start)
+
+    def close(self) -> None:
+        self.context.close()
+
+
+# ---------------------------------------------------------------------------- #
+#                                 Golden Images                                #
+# ---------------------------------------------------------------------------- #
+
+
+def save_image(image: npt.NDArray[np.uint8], path: Path) -> None:
+    from PyQt5.QtGui import QImage
+
+    height, width, _ = image.shape
+    data = np.ascontiguousarray(image)
+    qimage = QImage(data.data, width, height, 3 * width, QImage.Format_RGB888)
+    if not qimage.save(str(path)):
+        raise OSError(f"Could not write image {path}.")
+
+
+def load_image(path: Path) -> npt.NDArray[np.uint8]:
+    from PyQt5.QtGui import QImage
+
+    qimage = QImage(str(path)).convertToFormat(QImage.Format_RGB888)
+    if qimage.isNull():
+        raise OSError(f"Could not read image {path}.")
+    pointer = qimage.constBits()
+    pointer.setsize(qimage.sizeInBytes())
+    rows = np.frombuffer(pointer, np.uint8).reshape(
+        qimage.height(), qimage.bytesPerLine()
+    )
+    return (
+        rows[:, : qimage.width() * 3].reshape(qimage.height(), qimage.width(), 3).copy()
+    )
+
+
+def image_difference(
+    image: npt.NDArray[np.uint8], golden: npt.NDArray[np.uint8], tolerance: int = 8
+) -> float:
+    """Return the share of pixels differing by more than `tolerance` in any channel."""
+    if image.shape != golden.shape:
+        return 1.0
+    difference = np.abs(image.astype(np.int16) - golden.astype(np.int16)).max(axis=2)
+    return float(np.count_nonzero(difference > tolerance)) / difference.size
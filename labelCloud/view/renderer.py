@@ -0,0 +1,300 @@
+"""
+Draw the data model (point cloud, bounding boxes) with OpenGL.
+
+The model classes only hold data and can be used without a display, all GL calls
+and GPU buffers live here.
+"""
+import ctypes
+import logging
+from typing import Optional, Tuple
+
+import numpy as np
+import numpy.typing as npt
+import OpenGL.GL as GL
+
+from ..definitions import BBOX_EDGES, BBOX_SIDES, Color3f
+from ..io.labels.config import LabelConfig
+from ..model import BBox, PointCloud
+from ..utils import oglhelper
+
+# Get size of float (4 bytes) for VBOs
+SIZE_OF_FLOAT = ctypes.sizeof(ctypes.c_float)
+# Changed points up to this many unchanged points apart are uploaded in one call
+UPLOAD_MAX_GAP = 256
+# Share of the points from which on the whole label buffer is uploaded at once
+FULL_UPLOAD_RATIO = 0.25
+
+
+def plan_uploads(
+    indices: npt.NDArray[np.int64], max_gap: int = UPLOAD_MAX_GAP
+) -> Tuple[npt.NDArray[np.int64], npt.NDArray[np.int64]]:
+    """Merge sorted unique indices into spans [start, stop) to upload in one call each.
+
+    Runs of indices that are at most `max_gap` indices apart are merged, which uploads
+    the points in the gap again but saves one GL call per merged run.
+    """
+    if len(indices) == 0:
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+    breaks = np.flatnonzero(np.diff(indices) > max_gap + 1)
+    starts = indices[np.concatenate(([0], breaks + 1))]
+    stops = indices[np.concatenate((breaks, [len(indices) - 1]))] + 1
+    return starts, stops
+
+
+class PointCloudRenderer(object):
+    """Holds the vertex buffers of the shown point cloud and draws it."""
+
+    def __init__(self) -> None:
+        self.pointcloud: Optional[PointCloud] = None  # point cloud in the buffers
+        self.position_vbo = None
+        self.color_vbo = None
+        self.label_vbo = None
+        self.label_config_version = -1  # of the class colors in the label vbo
+
+    def invalidate(self) -> None:
+        """Forget the buffers, e.g. after the GL context was (re)created."""
+        self.pointcloud = None
+
+    def create_buffers(self, pointcloud: PointCloud) -> None:
+        """Create 3 different buffers holding points, colors and label colors information"""
+        if self.pointcloud is not None:
+            GL.glDeleteBuffers(3, [self.position_vbo, self.color_vbo, self.label_vbo])
+        (
+            self.position_vbo,
+            self.color_vbo,
+            self.label_vbo,
+        ) = GL.glGenBuffers(3)
+        for data, vbo in [
+            (pointcloud.points, self.position_vbo),
+            (pointcloud.colors, self.color_vbo),
+            (pointcloud.label_colors, self.label_vbo),
+        ]:
+            GL.glBindBuffer(GL.GL_ARRAY_BUFFER, vbo)
+            GL.glBufferData(GL.GL_ARRAY_BUFFER, data.nbytes, data, GL.GL_DYNAMIC_DRAW)
+            GL.glBindBuffer(GL.GL_ARRAY_BUFFER, 0)
+        pointcloud.label_updates.clear()
+        self.pointcloud = pointcloud
+        self.label_config_version = LabelConfig().version
+
+    def reload_label_buffer(self, pointcloud: PointCloud) -> None:
+        """Send all label colors to the label vbo, e.g. after a class color changed."""
+        label_color = pointcloud.label_colors
+        GL.glBindBuffer(GL.GL_ARRAY_BUFFER, self.label_vbo)
+        # New storage instead of overwriting, so the driver does not wait for the gpu
+        GL.glBufferData(
+            GL.GL_ARRAY_BUFFER, label_color.nbytes, label_color, GL.GL_DYNAMIC_DRAW
+        )
+        GL.glBindBuffer(GL.GL_ARRAY_BUFFER, 0)
+        pointcloud.label_updates.clear()
+        self.label_config_version = LabelConfig().version
+
+    def update_label_buffer(self, pointcloud: PointCloud) -> None:
+        """Send the changed label colors of the point cloud to the label vbo.
+
+        Only the points in `pointcloud.label_updates` are sent to minimise the data
+        sent to the gpu. Nearby indexes are merged into spans by `plan_uploads`, so each
+        span is updated in one single `glBufferSubData` call. If the spans cover a large
+        share of the points, the whole buffer is sent at once instead.
+        """
+        if not pointcloud.label_updates:
+            return
+        inside_idx = np.unique(np.concatenate(pointcloud.label_updates))
+        starts, stops = plan_uploads(inside_idx)
+        label_color = pointcloud.label_colors
+        if np.sum(stops - starts) >= FULL_UPLOAD_RATIO * len(label_color):
+            self.reload_label_buffer(pointcloud)
+            return
+        pointcloud.label_updates.clear()
+        logging.debug(
+            f"Update {len(inside_idx)} point colors in label VBO with {len(starts)} calls."
+        )
+
+        GL.glBindBuffer(GL.GL_ARRAY_BUFFER, self.label_vbo)
+        stride = label_color.shape[1] * SIZE_OF_FLOAT
+        for start, stop in zip(starts.tolist(), stops.tolist()):
+            colors: npt.NDArray[np.float32] = label_color[start:stop]
+            # partially update label_vbo from positions start to stop - 1
+            GL.glBufferSubData(
+                GL.GL_ARRAY_BUFFER,
+                offset=start * stride,
+                size=colors.nbytes,
+                data=colors,
+            )
+        GL.glBindBuffer(GL.GL_ARRAY_BUFFER, 0)
+
+    def draw_pointcloud(self, pointcloud: PointCloud) -> None:
+        if pointcloud is not self.pointcloud:
+            self.create_buffers(pointcloud)
+        elif self.label_config_version != LabelConfig().version:
+            self.reload_label_buffer(pointcloud)
+        else:
+            self.update_label_buffer(pointcloud)
+
+        set_gl_background(pointcloud)
+        stride = 3 * SIZE_OF_FLOAT
+
+        # Bind position buffer
+        GL.glBindBuffer(GL.GL_ARRAY_BUFFER, self.position_vbo)
+        GL.glEnableClientState(GL.GL_VERTEX_ARRAY)
+        GL.glVertexPointer(3, GL.GL_FLOAT, stride, None)
+
+        # Bind color buffer
+        if pointcloud.color_with_label:
+            color_vbo = self.label_vbo
+        else:
+            color_vbo = self.color_vbo
+        GL.glBindBuffer(
+            GL.GL_ARRAY_BUFFER, color_vbo
+        )  # Just gotta crack the layer issue
+        GL.glEnableClientState(GL.GL_COLOR_ARRAY)
+        GL.glColorPointer(3, GL.GL_FLOAT, stride, None)
+        GL.glDrawArrays(
+            GL.GL_POINTS, 0, pointcloud.get_no_of_points()
+        )  # Draw the points
+
+        GL.glDisableClientState(GL.GL_VERTEX_ARRAY)
+        GL.glDisableClientState(GL.GL_COLOR_ARRAY)
+        # Release the buffer binding
+        GL.glBindBuffer(GL.GL_ARRAY_BUFFER, 0)
+
+
+# ---------------------------------------------------------------------------- #
+#                                  Point Cloud                                 #
+# ---------------------------------------------------------------------------- #
+
+
+def draw_orientation_arrow():
+    # Get object coordinates for arrow
+    center = np.array([0.0, 0.0, 0.0])
+    yaw = 180
+    pitch = 0
+    roll = 0
+    arrow_length = 3
+    bp2 = [arrow_length, 0, 0]
+    first_edge = [
+        arrow_length * 0.8,
+        arrow_length * 0.3,
+        0,
+    ]  # TODO: Refactor to OGL helper
+    second_edge = [arrow_length * 0.8, arrow_length * -0.3, 0]
+    third_edge = [arrow_length * 0.8, 0, arrow_length * 0.3]
+
+    GL.glPushMatrix()
+    GL.glLineWidth(10)
+    # Apply translation and rotation
+    GL.glTranslate(*center)
+
+    GL.glRotate(yaw, 0.0, 0.0, 1.0)
+    GL.glRotate(pitch, 0.0, 1.0, 0.0)
+    GL.glRotate(roll, 1.0, 0.0, 0.0)
+
+    GL.glBegin(GL.GL_LINES)
+    GL.glVertex3fv([0, 0, 0])
+    GL.glVertex3fv(bp2)
+    GL.glVertex3fv(bp2)
+    GL.glVertex3fv(first_edge)
+    GL.glVertex3fv(bp2)
+    GL.glVertex3fv(second_edge)
+    GL.glVertex3fv(bp2)
+    GL.glVertex3fv(third_edge)
+
+    GL.glEnd()
+    GL.glLineWidth(1)
+    GL.glPopMatrix()
+
+
+def set_gl_background(pointcloud: PointCloud) -> None:
+    # Translate cloud to set translation
+    GL.glTranslate(pointcloud.trans_x, pointcloud.trans_y, pointcloud.trans_z)
+
+    # Draw a blue dot at the rotation origin
+    GL.glColor3f(0, 255, 255)
+    GL.glPointSize(10)
+    GL.glBegin(GL.GL_POINTS)
+    GL.glVertex3fv((0.0, 0.0, 0.0))
+    GL.glEnd()
+
+    # Rotate the pointcloud to the desired rotation
+    GL.glRotate(pointcloud.rot_x, 1.0, 0.0, 0.0)
+    GL.glRotate(pointcloud.rot_y, 0.0, 1.0, 0.0)
+    GL.glRotate(pointcloud.rot_z, 0.0, 0.0, 1.0)
+
+    # TODO : Can't remember what this was for
+    if pointcloud.focus is not None:
+        GL.glTranslate(-pointcloud.focus[0], -pointcloud.focus[1], -pointcloud.focus[2])
+
+    draw_orientation_arrow()
+
+    # Draw rotation origin
+    GL.glColor3f(0, 255, 0)
+    GL.glPointSize(10)
+    GL.glBegin(GL.GL_POINTS)
+    GL.glVertex3fv((0.0, 0.0, 0.0))
+    GL.glEnd()
+
+    GL.glPointSize(pointcloud.point_size)
+
+
+# ---------------------------------------------------------------------------- #
+#                                Bounding Boxes                                #
+# ---------------------------------------------------------------------------- #
+
+
+# Draw the BBox using verticies
+def draw_bbox(bbox: BBox, highlighted: bool = False) -> None:
+    bbox.set_axis_aligned_verticies()
+
+    GL.glPushMatrix()
+    bbox_color = LabelConfig().get_class_color(bbox.classname)
+    if highlighted:
+        bbox_color = bbox.HIGHLIGHTED_COLOR
+
+    vertices = bbox.get_vertices()
+    drawing_sequence = []
+    for edge in BBOX_EDGES:
+        for vertex_id in edge:
+            drawing_sequence.append(vertices[vertex_id])
+
+    oglhelper.draw_lines(drawing_sequence, color=Color3f.to_rgba(bbox_color))
+    GL.glPopMatrix()
+
+
+def draw_orientation(bbox: BBox, crossed_side: bool = True) -> None:
+    # Get object coordinates for arrow
+    arrow_length = bbox.length * 0.4
+    bp2 = [arrow_length, 0, 0]
+    first_edge = [
+        arrow_length * 0.8,
+        arrow_length * 0.3,
+        0,
+    ]  # TODO: Refactor to OGL helper
+    second_edge = [arrow_length * 0.8, arrow_length * -0.3, 0]
+    third_edge = [arrow_length * 0.8, 0, arrow_length * 0.3]
+
+    GL.glPushMatrix()
+    GL.glLineWidth(5)
+
+    # Apply translation and rotation
+    GL.glTranslate(*bbox.get_center())
+
+    GL.glRotate(bbox.get_z_rotation(), 0.0, 0.0, 1.0)
+    GL.glRotate(bbox.get_y_rotation(), 0.0, 1.0, 0.0)
+    GL.glRotate(bbox.get_x_rotation(), 1.0, 0.0, 0.0)
+
+    GL.glBegin(GL.GL_LINES)
+    GL.glVertex3fv([0, 0, 0])
+    GL.glVertex3fv(bp2)
+    GL.glVertex3fv(bp2)
+    GL.glVertex3fv(first_edge)
+    GL.glVertex3fv(bp2)
+    GL.glVertex3fv(second_edge)
+    GL.glVertex3fv(bp2)
+    GL.glVertex3fv(third_edge)
+    if crossed_side:
+        GL.glVertex3fv(bbox.verticies[BBOX_SIDES["right"][0]])
+        GL.glVertex3fv(bbox.verticies[BBOX_SIDES["right"][2]])
+        GL.glVertex3fv(bbox.verticies[BBOX_SIDES["right"][1]])
+        GL.glVertex3fv(bbox.verticies[BBOX_SIDES["right"][3]])
+    GL.glEnd()
+    GL.glLineWidth(1)
+    GL.glPopMatrix()
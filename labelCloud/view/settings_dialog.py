@@ -3,13 +3,13 @@
 import logging
 from pathlib import Path
 
-import pkg_resources
 from PyQt5 import uic
 from PyQt5.QtWidgets import QDialog
 
 from ..control.config_manager import config, config_manager
 from ..control.label_manager import LabelManager
 from ..io.labels.config import LabelConfig
+from ..utils.resources import resource_path
 
 
 class SettingsDialog(QDialog):
@@ -17,9 +17,7 @@ class SettingsDialog(QDialog):
         super().__init__(parent)
         self.parent_gui = parent
         uic.loadUi(
-            pkg_resources.resource_filename(
-                "labelCloud.resources.interfaces", "settings_interface.ui"
-            ),
+            str(resource_path("labelCloud.resources.interfaces", "settings_interface.ui")),
             self,
         )
         self.fill_with_current_settings()
@@ -191,6 +189,7 @@ class SettingsDialog(QDialog):
 
         config_manager.write_into_file()
         self.parent_gui.set_checkbox_states()
+        self.parent_gui.controller.pcd_manager.label_manager.close()
         self.parent_gui.controller.pcd_manager.label_manager = LabelManager(
             strategy=LabelConfig().format,
             path_to_label_folder=Path(config["FILE"]["label_folder"]),
@@ -1,7 +1,6 @@
 import random
 from typing import List, Optional
 
-import pkg_resources
 from PyQt5.QtCore import pyqtSignal
 from PyQt5.QtGui import QIcon, QPixmap
 from PyQt5.QtWidgets import (
@@ -16,6 +15,7 @@ from PyQt5.QtWidgets import (
 
 from ...io.labels.config import ClassConfig, LabelConfig
 from ...utils.color import get_distinct_colors, hex_to_rgb, rgb_to_hex
+from ...utils.resources import resource_path
 from .color_button import ColorButton
 
 
@@ -98,8 +98,8 @@ class ClassList(QWidget):
         label_delete = QPushButton(
             icon=QIcon(
                 QPixmap(
-                    pkg_resources.resource_filename(
-                        "labelCloud.resources.icons", "delete-outline.svg"
+                    str(
+                        resource_path("labelCloud.resources.icons", "delete-outline.svg")
                     )
                 )
             ),
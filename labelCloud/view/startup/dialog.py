@@ -1,6 +1,5 @@
 import traceback
 
-import pkg_resources
 from PyQt5.QtCore import Qt
 from PyQt5.QtGui import QIcon
 from PyQt5.QtWidgets import (
@@ -24,6 +23,7 @@ from ...io.labels.exceptions import (
     LabelIdsNotUniqueException,
     ZeroLabelException,
 )
+from ...utils.resources import resource_path
 from .class_list import ClassList
 from .labeling_mode import SelectLabelingMode
 
@@ -37,11 +37,7 @@ class StartupDialog(QDialog):
         screen_size = QDesktopWidget().availableGeometry(self).size()
         self.resize(screen_size * 0.5)
         self.setWindowIcon(
-            QIcon(
-                pkg_resources.resource_filename(
-                    "labelCloud.resources.icons", "labelCloud.ico"
-                )
-            )
+            QIcon(str(resource_path("labelCloud.resources.icons", "labelCloud.ico")))
         )
         self.setContentsMargins(50, 10, 50, 10)
 
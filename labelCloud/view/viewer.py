@@ -11,15 +11,17 @@ from PyQt5 import QtGui, QtOpenGL
 from ..control.alignmode import AlignMode
 from ..control.bbox_controller import BoundingBoxController
 from ..control.manual_calibration_controller import ProjectionCorrectionController
-from ..control.config_manager import config
+from ..control.config_manager import config, settings
 from ..control.drawing_manager import LabelDrawingManager, ProjectionDrawingManager
 from ..control.pcd_manager import PointCloudManager
 from ..definitions.types import Color4f, Point2D
 from ..utils import oglhelper
+from ..utils.profiling import frame_profiler
 from ..control.base_element_controller import BaseElementController
 from ..control.drawing_manager import BaseDrawingManager
 from ..io.labels.config import LabelConfig
 from ..definitions import LabelingMode
+from . import renderer
 
 
 @contextmanager
@@ -31,30 +33,27 @@ def ignore_depth_mask():
         GL.glDepthMask(GL.GL_TRUE)
 
 
-# Main widget for presenting the point cloud
-class GLWidget(QtOpenGL.QGLWidget):
+class SceneView(object):
+    """The scene of the viewer (point cloud, elements, previews) drawn with OpenGL.
+
+    Holds the drawn objects and draws them into the current GL context. It is shared by
+    the `GLWidget` and the off-screen viewer (`view.offscreen`).
+    """
+
     NEAR_PLANE = config.getfloat("USER_INTERFACE", "near_plane")
     FAR_PLANE = config.getfloat("USER_INTERFACE", "far_plane")
     LABELING = LabelConfig().type == LabelingMode.OBJECT_DETECTION 
     PROJECTION = LabelConfig().type == LabelingMode.PROJECTION_CORRECTION
     SEMANTIC = LabelConfig().type == LabelingMode.SEMANTIC_SEGMENTATION
 
-    def __init__(self, parent=None) -> None:
-        QtOpenGL.QGLWidget.__init__(self, parent)
-        self.setMouseTracking(
-            True
-        )  # mouseMoveEvent is called also without button pressed
+    DEVICE_PIXEL_RATIO: float = 1  # 1 = normal; 2 = retina display
 
+    def init_scene(self) -> None:
         self.modelview: Optional[npt.NDArray] = None
         self.projection: Optional[npt.NDArray] = None
-        self.DEVICE_PIXEL_RATIO: float = (
-            self.devicePixelRatioF()
-        )  # 1 = normal; 2 = retina display
-        oglhelper.DEVICE_PIXEL_RATIO = (
-            self.DEVICE_PIXEL_RATIO
-        )  # set for helper functions
 
         self.pcd_manager: PointCloudManager = None  # type: ignore
+        self.renderer = renderer.PointCloudRenderer()
 
         self.element_controller: Optional[BaseElementController] = None
         self.drawing_mode: Optional[BaseDrawingManager] = None
@@ -71,46 +70,47 @@ class GLWidget(QtOpenGL.QGLWidget):
     def set_element_controller(self, element_controller : BaseElementController) -> None:
         self.element_controller = element_controller
 
-    # QGLWIDGET METHODS
-
-    def initializeGL(self) -> None:
+    def initialize_gl(self) -> None:
         bg_color = [
-            int(fl_color)
+            float(fl_color) / 255
             for fl_color in config.getlist("USER_INTERFACE", "BACKGROUND_COLOR")
-        ]  # floats to ints
-        self.qglClearColor(QtGui.QColor(*bg_color))  # screen background color
+        ]
+        GL.glClearColor(*bg_color, 1)  # screen background color
         GL.glEnable(GL.GL_DEPTH_TEST)  # for visualization of depth
         GL.glEnable(GL.GL_BLEND)  # enable transparency
         GL.glBlendFunc(GL.GL_SRC_ALPHA, GL.GL_ONE_MINUS_SRC_ALPHA)
-        logging.info("Intialized widget.")
 
         # Must be written again, due to buffer clearing
-        self.pcd_manager.pointcloud.create_buffers()  # type: ignore
+        self.renderer.invalidate()
 
-    def resizeGL(self, width, height) -> None:
-        logging.info("Resized widget.")
+    def resize_gl(self, width: int, height: int) -> None:
         GL.glViewport(0, 0, width, height)
         GL.glMatrixMode(GL.GL_PROJECTION)
         GL.glLoadIdentity()
         aspect = width / float(height)
 
-        GLU.gluPerspective(45.0, aspect, GLWidget.NEAR_PLANE, GLWidget.FAR_PLANE)
+        GLU.gluPerspective(45.0, aspect, self.NEAR_PLANE, self.FAR_PLANE)
         GL.glMatrixMode(GL.GL_MODELVIEW)
 
-    def paintGL(self) -> None:
+    @frame_profiler.timed("paintGL")
+    def draw_scene(self) -> None:
         GL.glClear(GL.GL_COLOR_BUFFER_BIT | GL.GL_DEPTH_BUFFER_BIT)
+        if self.pcd_manager.pointcloud is None:
+            return  # first point cloud is loaded after the window is shown
         GL.glPushMatrix()  # push the current matrix to the current stack
 
         # Draw point cloud
-        self.pcd_manager.pointcloud.draw_pointcloud()  # type: ignore
+        with frame_profiler.timer("draw point cloud"):
+            self.renderer.draw_pointcloud(self.pcd_manager.pointcloud)  # type: ignore
 
         # Get actual matrices for click unprojection
-        self.modelview = GL.glGetDoublev(GL.GL_MODELVIEW_MATRIX)
-        self.projection = GL.glGetDoublev(GL.GL_PROJECTION_MATRIX)
-
+        with frame_profiler.timer("matrix readback"):
+            self.modelview = GL.glGetDoublev(GL.GL_MODELVIEW_MATRIX)
+            self.projection = GL.glGetDoublev(GL.GL_PROJECTION_MATRIX)
 
-        with ignore_depth_mask():  # Do not write decoration and preview elements in depth buffer
-            if config.getboolean("USER_INTERFACE", "show_floor"):
+        with frame_profiler.timer("overlays"), ignore_depth_mask():
+            # Do not write decoration and preview elements in depth buffer
+            if settings.show_floor:
                 oglhelper.draw_xy_plane(self.pcd_manager.pointcloud)  # type: ignore
 
             # Draw crosshair/ cursor in 3D world
@@ -134,23 +134,27 @@ class GLWidget(QtOpenGL.QGLWidget):
         if self.LABELING:
             # Draw active bbox
             if self.element_controller.has_active_element():
-                bbox_center = self.element_controller.get_active_element().center
-                self.element_controller.get_active_element().draw_element(highlighted=True)  # type: ignore
-                if config.getboolean("USER_INTERFACE", "show_orientation"):
-                    self.element_controller.get_active_element().draw_orientation()  # type: ignore
+                with frame_profiler.timer("active box"):
+                    active_bbox = self.element_controller.get_active_element()
+                    renderer.draw_bbox(active_bbox, highlighted=True)  # type: ignore
+                    if settings.show_orientation:
+                        renderer.draw_orientation(active_bbox)  # type: ignore
 
             else:
                 self.pcd_manager.stop_focus()
 
             # Draw labeled bboxes
-            for bbox in self.element_controller.elements:  # type: ignore
-                bbox.draw_bbox()
+            with frame_profiler.timer("all boxes"):
+                for bbox in self.element_controller.elements:  # type: ignore
+                    renderer.draw_bbox(bbox)
         elif self.PROJECTION:
-            self.element_controller.show_3d_points()
+            with frame_profiler.timer("projected points"):
+                self.element_controller.show_3d_points()
 
         GL.glPopMatrix()  # restore the previous modelview matrix
 
     # Translates the 2D cursor position from screen plane into 3D world space coordinates
+    @frame_profiler.timed("get_world_coords")
     def get_world_coords(
         self, x: float, y: float, z: Optional[float] = None, correction: bool = False
     ) -> Tuple[float, float, float]:
@@ -185,6 +189,46 @@ class GLWidget(QtOpenGL.QGLWidget):
         return mod_x, mod_y, mod_z
 
 
+# Main widget for presenting the point cloud
+class GLWidget(SceneView, QtOpenGL.QGLWidget):
+    def __init__(self, parent=None) -> None:
+        QtOpenGL.QGLWidget.__init__(self, parent)
+        self.setMouseTracking(
+            True
+        )  # mouseMoveEvent is called also without button pressed
+
+        self.DEVICE_PIXEL_RATIO = self.devicePixelRatioF()
+        oglhelper.DEVICE_PIXEL_RATIO = (
+            self.DEVICE_PIXEL_RATIO
+        )  # set for helper functions
+        self.init_scene()
+
+    # QGLWIDGET METHODS
+
+    def initializeGL(self) -> None:
+        self.initialize_gl()
+        logging.info("Intialized widget.")
+
+    def resizeGL(self, width, height) -> None:
+        logging.info("Resized widget.")
+        self.resize_gl(width, height)
+
+    def paintGL(self) -> None:
+        self.draw_scene()
+        if frame_profiler.enabled:
+            self.draw_frame_profile()
+
+    def draw_frame_profile(self) -> None:
+        """Show the rolling stage timings of the frame profiler in the top left corner."""
+        font = QtGui.QFont("Monospace", 9)
+        font.setStyleHint(QtGui.QFont.TypeWriter)
+        line_height = QtGui.QFontMetrics(font).height()
+        with ignore_depth_mask():
+            self.qglColor(QtGui.QColor(255, 255, 0))
+            for row, line in enumerate(frame_profiler.overlay_lines(), start=1):
+                self.renderText(10, 5 + row * line_height, line, font)
+
+
 # Creates a circular mask with radius around center
 def circular_mask(arr_length, center, radius) -> np.ndarray:
     dx = np.arange(arr_length)